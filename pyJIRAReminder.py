@@ -11,8 +11,17 @@ if not getattr(sys, "frozen", False):
     if SRC.exists():
         sys.path.insert(0, str(SRC))
 
-from jira_reminder.app import main  # noqa: E402
-from jira_reminder import JiraReminderController, JiraClient, APP_NAME, __version__  # re-export для тестів / старого коду
+from jira_reminder.cli import main  # noqa: E402
+from jira_reminder import APP_NAME, __version__  # noqa: E402
+
+
+def __getattr__(name):
+    # re-export для тестів / старого коду; контролер і клієнт вантажаться лише на запит
+    if name in ("JiraReminderController", "JiraClient"):
+        import jira_reminder
+
+        return getattr(jira_reminder, name)
+    raise AttributeError(name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks: refresh against the local Jira stand-in, JSON parsing, block rendering and
+config decryption. Results are written as JSON so runs can be compared across versions.
+
+  python scripts/bench.py                          # full run, saved to bench-results/
+  python scripts/bench.py --quick --out run.json   # small sizes, for a smoke check
+  python scripts/bench.py --compare old.json       # print the change against an earlier run
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_jira_server import START_FIELD, FakeJira, make_issues  # noqa: E402
+
+SIZES = {
+    "full": {"refresh_issues": 5000, "parse_issues": 10000, "render_issues": 1000, "team": 20, "repeat": 5},
+    "quick": {"refresh_issues": 300, "parse_issues": 1000, "render_issues": 100, "team": 5, "repeat": 2},
+}
+
+
+def _stats(samples: list[float]) -> dict:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "runs": len(samples),
+    }
+
+
+def _client(url: str):
+    from jira_reminder.jira_client import JiraClient
+    from jira_reminder.resilience import RetryPolicy
+
+    client = JiraClient(
+        base_url=url,
+        email="bench@example.com",
+        api_token="token",
+        projects=["BENCH"],
+        issue_types=["Sub-task - HW"],
+        start_date_field=START_FIELD,
+        cache_ttl=0,
+    )
+    client.retry = RetryPolicy(retries=3, base_delay=0.01, max_delay=0.05)  # simulated 503s, not real outages
+    return client
+
+
+def bench_refresh(issues: int, repeat: int, latency_ms: float = 5.0, error_rate: float = 0.0) -> dict:
+    """A full window sync (what the startup refresh does) and paging through every issue."""
+    from jira_reminder.jira_client import MAX_PAGE_SIZE, partition_buckets
+    from jira_reminder.store import IssueStore
+    from jira_reminder.sync import IssueSync
+
+    with FakeJira(issues=issues, latency_ms=latency_ms, error_rate=error_rate) as jira:
+        client = _client(jira.url)
+        sync_times, page_times = [], []
+        for _ in range(repeat):
+            sync = IssueSync(client, "bench@example.com", store=IssueStore(":memory:"))
+            t0 = time.perf_counter()
+            window = sync.sync(full=True)
+            partition_buckets(window)
+            sync_times.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            fetched = sum(len(p) for p in client.iter_search("project = BENCH", page_size=MAX_PAGE_SIZE))
+            page_times.append(time.perf_counter() - t0)
+            assert fetched == issues, fetched
+        stats = dict(jira.stats)
+    return {
+        "issues": issues,
+        "latency_ms": latency_ms,
+        "error_rate": error_rate,
+        "window_sync_seconds": _stats(sync_times),
+        "all_pages_seconds": _stats(page_times),
+        "server": stats,
+    }
+
+
+def bench_team(members: int, issues: int, repeat: int, latency_ms: float = 5.0) -> dict:
+    """A team's window: one query per person against ``team.fetch_team``'s batched queries."""
+    from jira_reminder.jira_client import MAX_PAGE_SIZE
+    from jira_reminder.team import fetch_team
+
+    team = tuple(f"dev{i}@example.com" for i in range(members))
+    with FakeJira(issues=issues, latency_ms=latency_ms, assignees=team) as jira:
+        client = _client(jira.url)
+        each, batched, requests = [], [], {}
+        for _ in range(repeat):
+            before = jira.stats["requests"]
+            t0 = time.perf_counter()
+            for person in team:
+                for _page in client.iter_search(client.jql_window(person), page_size=MAX_PAGE_SIZE):
+                    pass
+            each.append(time.perf_counter() - t0)
+            requests["per_person"] = jira.stats["requests"] - before
+
+            before = jira.stats["requests"]
+            t0 = time.perf_counter()
+            fetch_team(client, team)
+            batched.append(time.perf_counter() - t0)
+            requests["batched"] = jira.stats["requests"] - before
+    return {
+        "members": members,
+        "issues": issues,
+        "latency_ms": latency_ms,
+        "per_person_seconds": _stats(each),
+        "batched_seconds": _stats(batched),
+        "requests": requests,
+    }
+
+
+def bench_parse(issues: int, repeat: int) -> dict:
+    """json.loads of one big search response plus building the Issue records."""
+    from jira_reminder.models import Issue
+
+    client = _client("http://127.0.0.1:9")
+    body = json.dumps({"issues": make_issues(issues), "isLast": True}).encode("utf-8")
+    decode, build = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = json.loads(body)
+        t1 = time.perf_counter()
+        parsed = [client._parse_issue(it) for it in data["issues"]]
+        t2 = time.perf_counter()
+        decode.append(t1 - t0)
+        build.append(t2 - t1)
+    assert len(parsed) == issues and isinstance(parsed[0], Issue)
+    total = statistics.median(d + b for d, b in zip(decode, build))
+    return {
+        "issues": issues,
+        "bytes": len(body),
+        "json_decode_seconds": _stats(decode),
+        "build_issues_seconds": _stats(build),
+        "issues_per_second": issues / total,
+    }
+
+
+def bench_render(issues: int, repeat: int) -> dict:
+    """One block with ``issues`` cards under the offscreen platform: fill, first paint, repaints."""
+    from PyQt6 import QtGui, QtWidgets
+    from jira_reminder.models import Issue
+    from jira_reminder.ui import RENDER_CACHE, IssuesCardList
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    parser = _client("http://127.0.0.1:9")
+    data = [parser._parse_issue(it) for it in make_issues(issues)]
+    assert isinstance(data[0], Issue)
+
+    fill, first, frames = [], [], []
+    for _ in range(repeat):
+        RENDER_CACHE.clear()
+        block = IssuesCardList("Today")
+        block.show()
+        app.processEvents()
+        img = QtGui.QImage(block.view.viewport().size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+        t0 = time.perf_counter()
+        block.set_issues(data, "https://jira/issues", lambda k: f"https://jira/browse/{k}")
+        fill.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        block.view.viewport().render(img)
+        first.append(time.perf_counter() - t0)
+
+        bar = block.view.verticalScrollBar()
+        t0 = time.perf_counter()
+        steps = 20
+        for i in range(steps):
+            bar.setValue(bar.maximum() * i // steps)
+            block.view.viewport().render(img)
+        frames.append((time.perf_counter() - t0) / steps)
+        block.hide()
+        block.deleteLater()
+        app.processEvents()
+    return {
+        "issues": issues,
+        "set_issues_seconds": _stats(fill),
+        "first_paint_seconds": _stats(first),
+        "scroll_frame_seconds": _stats(frames),
+    }
+
+
+def bench_decrypt(repeat: int) -> dict:
+    """config.enc decryption: cold (key derivation) and with the key cached."""
+    from jira_reminder import security
+
+    blob = security.encrypt_config({"jira_base_url": "https://x", "api_token": "t" * 40, "project_keys": ["A"] * 20})
+    cold, warm = [], []
+    for _ in range(repeat):
+        security.wipe_key_cache()
+        t0 = time.perf_counter()
+        security.decrypt_config(blob)
+        cold.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        security.decrypt_config(blob)
+        warm.append(time.perf_counter() - t0)
+    return {"cold_seconds": _stats(cold), "warm_seconds": _stats(warm)}
+
+
+def run(quick: bool = False, only: list[str] | None = None) -> dict:
+    from jira_reminder import __version__
+
+    size = SIZES["quick" if quick else "full"]
+    benches = {
+        "refresh": lambda: bench_refresh(size["refresh_issues"], size["repeat"]),
+        "refresh_flaky": lambda: bench_refresh(size["refresh_issues"], size["repeat"], error_rate=0.05),
+        "team": lambda: bench_team(size["team"], size["refresh_issues"], size["repeat"]),
+        "parse": lambda: bench_parse(size["parse_issues"], size["repeat"]),
+        "render": lambda: bench_render(size["render_issues"], size["repeat"]),
+        "decrypt": lambda: bench_decrypt(size["repeat"]),
+    }
+    results = {}
+    for name, bench in benches.items():
+        if only and name not in only:
+            continue
+        print(f"{name} ...", file=sys.stderr, flush=True)
+        results[name] = bench()
+    return {
+        "version": __version__,
+        "taken": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def _flatten(data, prefix: str = "") -> dict:
+    out = {}
+    for k, v in data.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            out.update(_flatten(v, key + "."))
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[key] = v
+    return out
+
+
+def compare(old: dict, new: dict) -> str:
+    """Median timings of two runs side by side (negative change = faster)."""
+    a, b = _flatten(old["results"]), _flatten(new["results"])
+    lines = [f"{'metric':<52} {old['version']:>12} {new['version']:>12} {'change':>8}"]
+    for key in sorted(a.keys() & b.keys()):
+        if not (key.endswith(".median") or key.endswith("per_second")) or not a[key]:
+            continue
+        lines.append(f"{key:<52} {a[key]:>12.4g} {b[key]:>12.4g} {(b[key] - a[key]) / a[key]:>+8.1%}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="small sizes and fewer runs")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="refresh, refresh_flaky, team, parse, render, decrypt")
+    parser.add_argument("--out", help="result file (default: bench-results/<version>-<time>.json)")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="print the change against an earlier result file")
+    args = parser.parse_args(argv)
+
+    result = run(args.quick, args.only)
+    out = Path(args.out) if args.out else ROOT / "bench-results" / f"{result['version']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"Saved {out}")
+    if args.compare:
+        print(compare(json.loads(Path(args.compare).read_text(encoding="utf-8")), result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
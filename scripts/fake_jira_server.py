@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Jira Cloud search API, for benchmarks and manual testing without a network.
+
+Serves a synthetic issue set on
+  POST/GET /rest/api/3/search/jql          (maxResults, nextPageToken pagination; of the JQL only an
+                                            `assignee = "..."` / `assignee in (...)` clause is applied)
+  POST     /rest/api/3/search/approximate-count
+  GET      /rest/api/3/user/search                (?query=<e-mail>)
+with configurable size, latency and error rate. Due/start dates are spread around today, so all three
+blocks of the app get issues.
+
+  python scripts/fake_jira_server.py --issues 5000 --latency-ms 80 --error-rate 0.05 --port 8089
+
+then point ``jira_base_url`` at http://127.0.0.1:8089 (any e-mail/token is accepted).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGE_CAP = 100  # Jira caps a search page like this when all fields are requested
+STATUSES = (("To Do", "new"), ("In Progress", "indeterminate"), ("In Review", "indeterminate"), ("Done", "done"))
+PRIORITIES = ("Highest", "High", "Medium", "Low", "Lowest")
+START_FIELD = "customfield_10015"
+WORDS = ("check", "fix", "board", "rev", "power", "rail", "test", "layout", "review", "firmware")
+ASSIGNEE_RE = re.compile(r'assignee\s*(?:=\s*"([^"]*)"|in\s*\(([^)]*)\))', re.IGNORECASE)
+
+
+def make_issues(
+    count: int,
+    seed: int = 1,
+    today: date | None = None,
+    project: str = "BENCH",
+    assignees: tuple = ("bench@example.com",),
+) -> list[dict]:
+    """``count`` issues in Jira's REST shape, deterministic for a given seed and day; ``assignees`` take turns."""
+    rnd = random.Random(seed)
+    today = today or date.today()
+    now = datetime.now(timezone.utc)
+    issues = []
+    for i in range(count):
+        status, category = rnd.choice(STATUSES[:3])
+        due = today + timedelta(days=rnd.randint(-5, 5))
+        words = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(3, 12)))
+        fields = {
+            "summary": f"Synthetic issue {i}: {words}",
+            "duedate": due.isoformat() if rnd.random() < 0.9 else None,
+            START_FIELD: (due - timedelta(days=rnd.randint(0, 3))).isoformat() if rnd.random() < 0.5 else None,
+            "issuetype": {"name": "Sub-task - HW"},
+            "project": {"key": project},
+            "priority": {"name": rnd.choice(PRIORITIES)},
+            "status": {"name": status, "statusCategory": {"key": category}},
+            "assignee": {"accountId": f"acc-{i % len(assignees)}", "emailAddress": assignees[i % len(assignees)]},
+            "updated": (now - timedelta(minutes=rnd.randint(0, 60 * 24 * 30))).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+        }
+        issues.append({"id": str(10000 + i), "key": f"{project}-{i + 1}", "fields": fields})
+    return issues
+
+
+class FakeJira:
+    """
+    The stand-in server on a background thread. Use as a context manager::
+
+        with FakeJira(issues=2000, latency_ms=20) as jira:
+            client = JiraClient(base_url=jira.url, ...)
+
+    ``error_rate`` is the share of requests answered with HTTP 503 (the client retries those);
+    ``stats`` counts requests, errors and bytes served. ``hide_emails`` answers like a Cloud site
+    whose profiles hide e-mails: assignees carry only their account id.
+    """
+
+    def __init__(
+        self,
+        issues: int = 500,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        page_cap: int = PAGE_CAP,
+        seed: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        assignees: tuple = ("bench@example.com",),
+        hide_emails: bool = False,
+    ):
+        self.issues = make_issues(issues, seed, assignees=assignees)
+        self.assignees = assignees
+        self.hide_emails = hide_emails
+        self.latency = latency_ms / 1000.0
+        self.error_rate = error_rate
+        self.page_cap = page_cap
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "bytes": 0}
+        self.queries: list[str] = []  # JQL of every search, in arrival order
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self.url = f"http://{host}:{self._httpd.server_address[1]}"
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "FakeJira":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-jira", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeJira":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --- request handling ---
+
+    def _fail(self) -> bool:
+        with self._lock:
+            self.stats["requests"] += 1
+            failed = self._rnd.random() < self.error_rate
+            if failed:
+                self.stats["errors"] += 1
+            return failed
+
+    def _matching(self, jql: str | None) -> list[dict]:
+        m = ASSIGNEE_RE.search(jql or "")
+        if not m:
+            return self.issues
+        wanted = {m.group(1).lower()} if m.group(1) is not None else {
+            a.strip().strip('"').lower() for a in m.group(2).split(",")
+        }
+        return [it for it in self.issues if it["fields"]["assignee"]["emailAddress"].lower() in wanted]
+
+    def _page(self, jql, max_results, token) -> dict:
+        issues = self._matching(jql)
+        start = int(token or 0)
+        size = max(1, min(int(max_results or 50), self.page_cap))
+        end = min(start + size, len(issues))
+        page = issues[start:end]
+        if self.hide_emails:
+            page = [
+                {**it, "fields": {**it["fields"], "assignee": {"accountId": it["fields"]["assignee"]["accountId"]}}}
+                for it in page
+            ]
+        data = {"issues": page, "isLast": end >= len(issues)}
+        if end < len(issues):
+            data["nextPageToken"] = str(end)
+        return data
+
+    def _users(self, query: str | None) -> list[dict]:
+        wanted = (query or "").strip().lower()
+        users = []
+        for i, email in enumerate(self.assignees):
+            if email.lower() == wanted:
+                user = {"accountId": f"acc-{i}", "displayName": email.split("@")[0]}
+                if not self.hide_emails:
+                    user["emailAddress"] = email
+                users.append(user)
+        return users
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like Jira Cloud
+            disable_nagle_algorithm = True  # headers and body go out as two writes
+
+            def _reply(self, status: int, data: dict | list) -> None:
+                body = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.stats["bytes"] += len(body)
+
+            def _route(self, body: dict) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._fail():
+                    self._reply(503, {"errorMessages": ["Service unavailable (simulated)"]})
+                    return
+                path = urlparse(self.path).path
+                if path == "/rest/api/3/search/jql":
+                    with server._lock:
+                        server.queries.append(body.get("jql") or "")
+                    self._reply(200, server._page(body.get("jql"), body.get("maxResults"), body.get("nextPageToken")))
+                elif path == "/rest/api/3/search/approximate-count" and self.command == "POST":
+                    self._reply(200, {"count": len(server._matching(body.get("jql")))})
+                elif path == "/rest/api/3/user/search" and self.command == "GET":
+                    self._reply(200, server._users(body.get("query")))
+                else:
+                    self._reply(404, {"errorMessages": [f"No route for {self.command} {path}"]})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b"{}"
+                try:
+                    body = json.loads(raw or b"{}")
+                except ValueError:
+                    self._reply(400, {"errorMessages": ["Invalid JSON"]})
+                    return
+                self._route(body)
+
+            def do_GET(self):
+                query = {k: v[-1] for k, v in parse_qs(urlparse(self.path).query).items()}
+                self._route(query)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local Jira search API stand-in")
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--page-cap", type=int, default=PAGE_CAP)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument(
+        "--assignee", action="append", metavar="EMAIL", help="issues are spread over these (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    jira = FakeJira(
+        args.issues,
+        args.latency_ms,
+        args.error_rate,
+        args.page_cap,
+        args.seed,
+        port=args.port,
+        assignees=tuple(args.assignee or ("bench@example.com",)),
+    )
+    print(f"Fake Jira with {args.issues} issues on {jira.url} (Ctrl+C to stop)")
+    try:
+        jira._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        jira._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
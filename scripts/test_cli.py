@@ -0,0 +1,118 @@
+# scripts/test_cli.py
+"""
+Tests for the headless `jira-reminder report` command: no Qt, output formats, exit codes.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_jira_server import START_FIELD, FakeJira  # noqa: E402
+from jira_reminder import security  # noqa: E402
+from jira_reminder.cli import format_ics, format_table  # noqa: E402
+from jira_reminder.models import Issue  # noqa: E402
+
+RUN_REPORT = (
+    "import sys; from jira_reminder.cli import main; rc = main(sys.argv[1:]); "
+    "print('QT' if any(m.startswith('PyQt6') for m in sys.modules) else 'NO-QT', file=sys.stderr); sys.exit(rc)"
+)
+
+
+def run_report(home: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "HOME": home, "USERPROFILE": home, "PYTHONPATH": str(ROOT / "src")}
+    return subprocess.run(
+        [sys.executable, "-c", RUN_REPORT, "report", *args], env=env, capture_output=True, text=True, timeout=60
+    )
+
+
+def write_config(home: str, url: str) -> None:
+    path = Path(home) / ".jira_reminder" / "config.enc"
+    path.parent.mkdir(parents=True)
+    cfg = {
+        "jira_base_url": url,
+        "assignee_email": "me@example.com",
+        "api_token": "token",
+        "project_keys": ["BENCH"],
+        "start_date_field": START_FIELD,
+    }
+    path.write_bytes(security.encrypt_config(cfg))
+
+
+def test_report_runs_without_qt():
+    with FakeJira(issues=250, assignees=("me@example.com",)) as jira, tempfile.TemporaryDirectory() as home:
+        write_config(home, jira.url)
+        out = run_report(home, "--format", "json")
+        assert out.returncode == 0, out.stderr
+        assert out.stderr.strip().endswith("NO-QT")
+        data = json.loads(out.stdout)
+        assert data["assignee"] == "me@example.com" and data["date"] == date.today().isoformat()
+        assert set(data["buckets"]) == {"overdue", "today", "tomorrow"}
+        today = data["buckets"]["today"]
+        assert today and today[0]["url"] == f"{jira.url}/browse/{today[0]['key']}"
+        assert jira.stats["requests"] == 3  # 250 issues in pages of 100
+
+        out = run_report(home, "--bucket", "today", "--format", "table")
+        assert out.returncode == 0 and out.stdout.startswith(f"Today ({len(today)})\nKEY ")
+
+        out = run_report(home, "-a", "me@example.com", "-a", "Lead@example.com", "--format", "json")
+        assert out.returncode == 0, out.stderr
+        team = json.loads(out.stdout)["assignees"]
+        assert list(team) == ["me@example.com", "lead@example.com"]
+        assert team["me@example.com"] == data["buckets"] and not any(team["lead@example.com"].values())
+        assert 'assignee in ("me@example.com", "lead@example.com")' in jira.queries[-1]
+
+
+def test_missing_config_is_an_error():
+    with tempfile.TemporaryDirectory() as home:
+        out = run_report(home)
+        assert out.returncode == 1 and "encrypted config" in out.stderr and not out.stdout
+        out = run_report(home, "--format", "xml")
+        assert out.returncode == 2
+
+
+def test_table_cuts_summaries_to_the_width():
+    issues = [Issue(key="HW-1", summary="x" * 200, duedate="2025-11-10", status="To Do", priority="High")]
+    text = format_table({"today": issues, "tomorrow": []}, width=60)
+    lines = text.splitlines()
+    assert lines[0] == "Today (1)" and lines[1].split() == ["KEY", "STATUS", "PRIORITY", "DUE", "SUMMARY"]
+    assert len(lines[2]) == 60 and lines[2].startswith("HW-1  To Do") and lines[2].endswith("…")
+    assert lines[-1] == "Tomorrow (0)"
+    assert len(format_table({"today": issues}).splitlines()[2]) > 200  # no terminal: keep it all
+
+
+def test_ics_events():
+    long = "Rework; the power rail, then " + "ü" * 60
+    issues = [
+        Issue(key="HW-1", summary=long, duedate="2025-11-10", status="In Progress"),
+        Issue(key="HW-2", summary="Start only", startdate="2025-11-11"),
+        Issue(key="HW-3", summary="No dates"),
+    ]
+    now = datetime(2025, 11, 10, 8, 30, tzinfo=timezone.utc)
+    text = format_ics({"overdue": issues[:1], "today": issues, "tomorrow": []}, "https://acme.atlassian.net/", now)
+    assert text.startswith("BEGIN:VCALENDAR\r\n") and text.endswith("END:VCALENDAR\r\n")
+    assert "\n" not in text.replace("\r\n", "")
+    assert all(len(line.encode("utf-8")) <= 75 for line in text.split("\r\n"))
+    assert text.count("BEGIN:VEVENT") == 2  # HW-1 once, though in two blocks; HW-3 has no day
+    unfolded = text.replace("\r\n ", "")
+    assert "UID:HW-1@acme.atlassian.net\r\nDTSTAMP:20251110T083000Z\r\nDTSTART;VALUE=DATE:20251110" in unfolded
+    assert "DTEND;VALUE=DATE:20251111" in unfolded
+    assert f"SUMMARY:HW-1: Rework\\; the power rail\\, then {'ü' * 60}\r\n" in unfolded
+    assert "DESCRIPTION:Status: In Progress\r\n" in unfolded and "CATEGORIES:Overdue" in unfolded
+    assert "DTSTART;VALUE=DATE:20251111\r\n" in unfolded  # the start date without a due date
+
+
+if __name__ == "__main__":
+    test_report_runs_without_qt()
+    test_missing_config_is_an_error()
+    test_table_cuts_summaries_to_the_width()
+    test_ics_events()
+    print("OK")
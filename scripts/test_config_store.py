@@ -0,0 +1,137 @@
+# scripts/test_config_store.py
+"""
+Tests for the in-memory config service: single load, file-change reload, subscribers.
+"""
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder import paths as paths_mod  # noqa: E402
+from jira_reminder import security as sec_mod  # noqa: E402
+from jira_reminder.config import ConfigStore  # noqa: E402
+
+
+def temp_paths():
+    td = tempfile.TemporaryDirectory()
+    tmp = Path(td.name)
+    paths_mod.CONFIG_PLAIN_PATH = tmp / "config.json"
+    paths_mod.CONFIG_ENC_PATH = tmp / "config.enc"
+    return td
+
+
+def counting_decrypt():
+    calls = []
+    real = sec_mod.decrypt_config
+
+    def decrypt(blob):
+        calls.append(1)
+        return real(blob)
+
+    sec_mod.decrypt_config = decrypt
+    return calls, lambda: setattr(sec_mod, "decrypt_config", real)
+
+
+def test_values_are_served_from_memory():
+    td = temp_paths()
+    paths_mod.CONFIG_PLAIN_PATH.write_text(json.dumps({"ui_scale": "1.5", "logging": 1}), encoding="utf-8")
+    paths_mod.CONFIG_ENC_PATH.write_bytes(sec_mod.encrypt_config({"jira_base_url": "https://x", "api_token": "t"}))
+    calls, restore = counting_decrypt()
+    try:
+        store = ConfigStore()
+        for _ in range(3):
+            assert store.get("jira_base_url") == "https://x"
+            store.reload()
+        assert calls == [1]
+        assert store.get_float("ui_scale") == 1.5 and store.get_bool("logging") is True
+        assert store.get_int("poll_minutes", 5) == 5
+        assert store.get("issue_types") == ["Sub-task - HW"]  # secure default
+    finally:
+        restore()
+        td.cleanup()
+
+
+def test_plain_settings_do_not_decrypt():
+    td = temp_paths()
+    paths_mod.CONFIG_PLAIN_PATH.write_text(json.dumps({"ui_scale": 1.5}), encoding="utf-8")
+    paths_mod.CONFIG_ENC_PATH.write_bytes(sec_mod.encrypt_config({"jira_base_url": "https://x"}))
+    calls, restore = counting_decrypt()
+    try:
+        store = ConfigStore()
+        seen = []
+        store.subscribe(seen.append)
+        assert store.plain == {"ui_scale": 1.5} and calls == []
+        assert store.get("jira_base_url") == "https://x" and calls == [1]
+        assert seen == []  # loading the secure part later is not a change
+    finally:
+        restore()
+        td.cleanup()
+
+
+def test_external_edit_is_reloaded_and_announced():
+    td = temp_paths()
+    try:
+        store = ConfigStore()
+        store.save_plain({"poll_minutes": 5, "logging": False})
+        seen = []
+        store.subscribe(seen.append)
+
+        store.save_plain({"poll_minutes": 5, "logging": True})
+        assert seen == [{"logging"}]
+
+        path = paths_mod.CONFIG_PLAIN_PATH
+        path.write_text(json.dumps({"poll_minutes": 9, "logging": True}), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert store.reload() == {"poll_minutes"}
+        assert seen[-1] == {"poll_minutes"} and store.get_int("poll_minutes") == 9
+        assert store.reload() == set()  # unchanged file is not read again
+    finally:
+        td.cleanup()
+
+
+def test_broken_plain_config_keeps_the_last_good_settings():
+    td = temp_paths()
+    try:
+        store = ConfigStore()
+        store.save_plain({"poll_minutes": 9, "logging": True})
+        seen = []
+        store.subscribe(seen.append)
+
+        path = paths_mod.CONFIG_PLAIN_PATH
+        path.write_text('{"poll_minutes": 9, "logg', encoding="utf-8")  # caught mid-save
+        assert store.reload() == set() and seen == []
+        assert store.get_int("poll_minutes") == 9 and store.get_bool("logging") is True
+
+        path.write_text(json.dumps({"poll_minutes": 7, "logging": True}), encoding="utf-8")
+        assert store.reload() == {"poll_minutes"}
+    finally:
+        td.cleanup()
+
+
+def test_missing_or_broken_secure_config():
+    td = temp_paths()
+    try:
+        store = ConfigStore()
+        assert not store.has_secure() and isinstance(store.secure_error, FileNotFoundError)
+        paths_mod.CONFIG_ENC_PATH.write_bytes(b"garbage")
+        store.reload()
+        assert not store.has_secure() and isinstance(store.secure_error, ValueError)
+        store.save_secure({"jira_base_url": "https://x"})
+        assert store.has_secure() and store.secure_error is None
+    finally:
+        td.cleanup()
+
+
+if __name__ == "__main__":
+    test_values_are_served_from_memory()
+    test_plain_settings_do_not_decrypt()
+    test_external_edit_is_reloaded_and_announced()
+    test_broken_plain_config_keeps_the_last_good_settings()
+    test_missing_or_broken_secure_config()
+    print("OK")
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 from pathlib import Path
-from datetime import datetime, date, time as dtime
+from datetime import datetime, date, time as dtime, timedelta
 
 from PyQt6 import QtWidgets
 
@@ -13,6 +14,18 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 import pyJIRAReminder as appmod  # головний модуль з JiraReminderController
+import jira_reminder.controller as ctrlmod  # модуль, з якого контролер реально бере JiraClient
+from jira_reminder import paths as paths_mod
+from jira_reminder.snapshot import load_snapshot, save_snapshot
+from jira_reminder.models import Issue
+from jira_reminder.jira_client import SearchPage
+from jira_reminder.config import ConfigStore
+from jira_reminder.scheduler import Schedule
+
+# Снапшот і базу задач тримаємо поза ~/.jira_reminder користувача
+_TMP = tempfile.TemporaryDirectory()
+paths_mod.SNAPSHOT_PATH = Path(_TMP.name) / "snapshot.json"
+paths_mod.STORE_PATH = ":memory:"
 
 
 APP_NAME = "Jira Reminder TEST"
@@ -29,13 +42,16 @@ class FakeTray:
     def showMessage(self, title, text, icon=None, msec=0):
         self.messages.append((title, text, icon, msec))
 
+    def setToolTip(self, text):
+        self.tooltip = text
+
 
 class FakeJiraClient:
     """
     Фейковий JiraClient з тим самим API, який очікує JiraReminderController.
     НІЯКИХ HTTP-запитів, тільки контрольовані відповіді.
     """
-    def __init__(self, base_url, email, api_token, projects, issue_types, start_date_field, done_jql_override=None):
+    def __init__(self, base_url, email, api_token, projects, issue_types, start_date_field, done_jql_override=None, **kwargs):
         self.base_url = base_url
         self.email = email
         self.api_token = api_token
@@ -43,16 +59,22 @@ class FakeJiraClient:
         self.issue_types = issue_types
         self.start_date_field = start_date_field
         self.done_jql_override = done_jql_override
+        self.cache_ttl = kwargs.get("cache_ttl")
+        self.invalidate_calls = 0
 
         # Налаштовувані відповіді для тестів
         self.today_issues_to_return = []
         self.closed_today_issues_to_return = []
+        self.window_issues_to_return = []
+        self.page_error = None  # виняток, яким впаде наступний search_page
+        self.count_unknown = False  # немає approximate-count і total у відповіді
 
         # Лічильники викликів для перевірок
         self.jql_for_day_calls: list[tuple[str, str]] = []
         self.jql_closed_today_calls: list[str] = []
         self.jql_overdue_calls: list[str] = []
         self.search_calls: list[tuple[str, int]] = []
+        self.page_calls: list[tuple[str, str | None]] = []
         self.make_issues_link_calls: list[str] = []
         self.make_issue_url_calls: list[str] = []
 
@@ -79,22 +101,80 @@ class FakeJiraClient:
         self.jql_overdue_calls.append(assignee_email)
         return "JQL-OVERDUE"
 
-    def search(self, jql: str, max_results: int = 50):
+    def jql_updated_since(self, assignee_email: str, minutes: int) -> str:
+        """
+        Викликається інкрементальною синхронізацією (IssueSync).
+        """
+        return f"JQL-UPDATED-{minutes}"
+
+    def jql_window(self, assignee_email: str) -> str:
+        """
+        Викликається у refresh_all() — один запит на overdue/today/tomorrow.
+        """
+        return "JQL-WINDOW"
+
+    def search(self, jql: str, max_results: int = 50, use_cache: bool = True):
         """
         Емуляція пошуку. Ми реагуємо тільки на наші штучні JQL-рядки.
         Все інше повертає порожній список.
         """
         self.search_calls.append((jql, max_results))
+        return self._answer(jql)
 
+    def _answer(self, jql: str):
+        # справжній клієнт повертає Issue, а не dict
         if jql.startswith("JQL-today"):
-            return list(self.today_issues_to_return)
+            return [Issue.from_dict(x) for x in self.today_issues_to_return]
 
         if jql == "JQL-CLOSED-TODAY":
-            return list(self.closed_today_issues_to_return)
+            return [Issue.from_dict(x) for x in self.closed_today_issues_to_return]
+
+        if jql == "JQL-WINDOW":
+            return [Issue.from_dict(x) for x in self.window_issues_to_return]
 
         # OVERDUE, TOMORROW, etc. для наших тестів можна повертати пусто
         return []
 
+    def iter_search(self, jql: str, page_size: int = 50, limit=None):
+        """
+        Пагінований пошук: для тестів достатньо однієї сторінки (обрізаної до limit,
+        з токеном продовження, як у справжнього клієнта).
+        """
+        issues = self.search(jql, max_results=limit or page_size)
+        if issues:
+            page = SearchPage(issues[:limit] if limit else issues)
+            if limit and len(issues) > limit:
+                page.next_token = str(limit)
+            yield page
+
+    def search_page(self, jql: str, page_size: int = 50, next_token=None):
+        """
+        Одна сторінка результатів; токен наступної сторінки — просто зсув.
+        """
+        self.page_calls.append((jql, next_token))
+        if self.page_error is not None:
+            error, self.page_error = self.page_error, None
+            raise error
+        issues = self._answer(jql)
+        start = int(next_token or 0)
+        end = start + page_size
+        return issues[start:end], (str(end) if end < len(issues) else None)
+
+    def count(self, jql: str, exact: bool = False):
+        """
+        Кількість задач без завантаження — емулюємо через search().
+        None — Jira не знає точної кількості (див. count_unknown).
+        """
+        if exact and self.count_unknown:
+            return None
+        return len(self.search(jql, max_results=1000))
+
+    def invalidate(self, jql=None):
+        """
+        Кешу у фейкового клієнта немає — лише рахуємо виклики.
+        """
+        self.invalidate_calls += 1
+
     def make_issues_link(self, jql: str, wrap_login: bool = True, modern: bool = True) -> str:
         """
         Викликається для кнопок 'Show more' у вікні.
@@ -117,12 +197,29 @@ class FakeJiraClient:
         self.jql_closed_today_calls.clear()
         self.jql_overdue_calls.clear()
         self.search_calls.clear()
+        self.page_calls.clear()
         self.make_issues_link_calls.clear()
         self.make_issue_url_calls.clear()
 
 
 
-def create_controller_for_test():
+def drain(ctrl):
+    """
+    Запити до Jira виконуються у пулі потоків контролера (FetchEngine).
+    Чекаємо завершення всіх задач і доставляємо їхні колбеки в GUI-потік.
+    """
+    while ctrl.fetcher.pending():
+        ctrl.fetcher.wait()
+        QtWidgets.QApplication.processEvents()
+
+
+def tick(ctrl, when: datetime):
+    """Один тік контролера + очікування фонових запитів, які він запустив."""
+    ctrl._on_tick_at(when)
+    drain(ctrl)
+
+
+def create_controller_for_test(config=None):
     """
     Створює реальний JiraReminderController, але:
     - патчить JiraClient на FakeJiraClient;
@@ -136,8 +233,9 @@ def create_controller_for_test():
     if app is None:
         app = QtWidgets.QApplication([])
 
-    # 2) Патчимо JiraClient у модулі на наш FakeJiraClient
+    # 2) Патчимо JiraClient у модулях на наш FakeJiraClient
     appmod.JiraClient = FakeJiraClient
+    ctrlmod.JiraClient = FakeJiraClient
 
     # 3) Мінімальна конфігурація (значення неважливі — нікуди не йдуть)
     cfg = {
@@ -150,11 +248,12 @@ def create_controller_for_test():
         "done_jql": None,
     }
 
-    ctrl = appmod.JiraReminderController(app, cfg)
+    if config is not None:
+        cfg = config.combined()
+    ctrl = appmod.JiraReminderController(app, cfg, config)
 
-    # 4) Зупиняємо внутрішній таймер, щоб він не бігав у тестах
-    if hasattr(ctrl, "tick"):
-        ctrl.tick.stop()
+    # 4) Зупиняємо внутрішній планувальник, щоб він не спрацьовував у тестах
+    ctrl.scheduler.stop()
 
     # 5) Ховаємо реальний tray-ікон, щоб не миготіла іконка під час тестів
     real_tray = ctrl.tray
@@ -171,10 +270,13 @@ def create_controller_for_test():
     if not isinstance(fake_client, FakeJiraClient):
         raise RuntimeError("Expected FakeJiraClient, got something else")
 
+    # Чекаємо завершення фонового initial refresh_all, щоб він не "доїхав" у середину тесту
+    drain(ctrl)
+
     # Обнуляємо лічильники після initial refresh_all
     fake_client.reset_counters()
     fake_tray.messages.clear()
-    ctrl._last_close_check = None
+    ctrl.scheduler.core.last_evening = None
 
     return ctrl, fake_tray, fake_client
 
@@ -194,18 +296,18 @@ def test_morning_popup_when_tasks_exist():
     ]
 
     # 09:59 – не повинно нічого статися
-    ctrl._on_tick_at(datetime.combine(today, dtime(9, 59)))
+    tick(ctrl, datetime.combine(today, dtime(9, 59)))
     assert client.jql_for_day_calls == [], "До 10:00 не повинно бути jql_for_day"
     assert tray.messages == [], "До 10:00 не повинно бути сповіщень"
 
     # 10:00 – очікуємо 1 JQL + 1 popup
-    ctrl._on_tick_at(datetime.combine(today, dtime(10, 0)))
+    tick(ctrl, datetime.combine(today, dtime(10, 0)))
     assert len(client.jql_for_day_calls) == 1, "О 10:00 має бути один виклик jql_for_day('today')"
     assert len(tray.messages) == 1, "О 10:00 має бути одне сповіщення"
     assert "Today's tasks" in tray.messages[0][1]
 
-    # 10:05 – не потрапляє у (0,1) → нічого нового
-    ctrl._on_tick_at(datetime.combine(today, dtime(10, 5)))
+    # 10:05 – ранкове зведення вже було сьогодні → нічого нового
+    tick(ctrl, datetime.combine(today, dtime(10, 5)))
     assert len(client.jql_for_day_calls) == 1, "Після 10:01 не має бути додаткових jql_for_day"
     assert len(tray.messages) == 1, "І нових сповіщень теж"
 
@@ -218,7 +320,7 @@ def test_morning_no_tasks_no_popup():
     # Нема задач
     client.today_issues_to_return = []
 
-    ctrl._on_tick_at(datetime.combine(today, dtime(10, 0)))
+    tick(ctrl, datetime.combine(today, dtime(10, 0)))
     assert len(client.jql_for_day_calls) == 1, "О 10:00 JQL все одно викликається"
     assert len(tray.messages) == 0, "Але без задач сповіщення не показується"
 
@@ -232,22 +334,22 @@ def test_evening_interval_and_stop_when_closed():
     client.closed_today_issues_to_return = []
 
     # 16:29 – поза вікном
-    ctrl._on_tick_at(datetime.combine(today, dtime(16, 29)))
+    tick(ctrl, datetime.combine(today, dtime(16, 29)))
     assert len(client.jql_closed_today_calls) == 0, "До 16:30 не викликаємо jql_closed_today"
     assert len(tray.messages) == 0
 
     # 16:30 – перша перевірка
-    ctrl._on_tick_at(datetime.combine(today, dtime(16, 30)))
+    tick(ctrl, datetime.combine(today, dtime(16, 30)))
     assert len(client.jql_closed_today_calls) == 1, "О 16:30 має бути виклик jql_closed_today"
     assert len(tray.messages) == 1, "Має бути перше сповіщення"
 
     # 16:40 – ще немає 30 хв, не повинно бути нового виклику
-    ctrl._on_tick_at(datetime.combine(today, dtime(16, 40)))
+    tick(ctrl, datetime.combine(today, dtime(16, 40)))
     assert len(client.jql_closed_today_calls) == 1, "До +30 хв не повторюємо перевірку"
     assert len(tray.messages) == 1
 
     # 17:01 – минуло >30 хв, ще нічого не закрито → ще одне сповіщення
-    ctrl._on_tick_at(datetime.combine(today, dtime(17, 1)))
+    tick(ctrl, datetime.combine(today, dtime(17, 1)))
     assert len(client.jql_closed_today_calls) == 2, "Після +30 хв має бути друга перевірка"
     assert len(tray.messages) == 2, "І друге сповіщення"
 
@@ -255,15 +357,264 @@ def test_evening_interval_and_stop_when_closed():
     client.closed_today_issues_to_return = [{"key": "ABC-99"}]
 
     # 17:40 – перевірка є, але popup вже НЕ має бути
-    ctrl._on_tick_at(datetime.combine(today, dtime(17, 40)))
+    tick(ctrl, datetime.combine(today, dtime(17, 40)))
     assert len(client.jql_closed_today_calls) == 3, "Має бути третя перевірка"
     assert len(tray.messages) == 2, "Але кількість сповіщень не збільшується після закриття задачі"
 
 
+def test_refresh_splits_window_into_blocks():
+    print("=== test_refresh_splits_window_into_blocks ===")
+    ctrl, tray, client = create_controller_for_test()
+    today = date.today()
+
+    client.window_issues_to_return = [
+        {"key": "ABC-1", "summary": "Late", "duedate": (today - timedelta(days=3)).isoformat()},
+        {"key": "ABC-2", "summary": "Now", "duedate": today.isoformat()},
+        {"key": "ABC-3", "summary": "Next", "startdate": (today + timedelta(days=1)).isoformat()},
+    ]
+
+    ctrl.refresh_all()
+    drain(ctrl)
+    assert [x["key"] for x in ctrl.today_issues] == ["ABC-2"], "Today-блок має містити лише ABC-2"
+    assert [c for c in client.search_calls if c[0] == "JQL-WINDOW"], "Має бути один window-запит"
+    assert len(client.search_calls) == 1, "Refresh не повинен робити окремі запити на кожен блок"
+    assert tray.messages and tray.messages[-1][1] == "Data updated"
+    assert "(1)" in ctrl.window.overdue.label.text(), "У заголовку блоку має бути кількість задач"
+
+
+def test_truncated_window_is_counted_once_per_full_sync():
+    print("=== test_truncated_window_is_counted_once_per_full_sync ===")
+    import jira_reminder.sync as syncmod
+
+    ctrl, tray, client = create_controller_for_test()
+    today = date.today()
+    client.window_issues_to_return = [
+        {"key": f"ABC-{i}", "summary": "Now", "duedate": today.isoformat()} for i in range(3)
+    ]
+    client.today_issues_to_return = [{"key": f"ABC-{i}"} for i in range(5)]  # Jira's count for "today"
+    limit, syncmod.WINDOW_LIMIT = syncmod.WINDOW_LIMIT, 3  # the window fetch hits its cap
+    try:
+        ctrl.refresh_all()
+        drain(ctrl)
+        counts = [c for c in client.search_calls if c[1] == 1000]
+        assert sorted(jql for jql, _ in counts) == ["JQL-OVERDUE", "JQL-today", "JQL-tomorrow"]
+        assert "(5)" in ctrl.window.today.label.text()
+
+        client.reset_counters()
+        ctrl._poll()  # a delta: no new counts, and the counted totals stay on screen
+        drain(ctrl)
+        assert not [c for c in client.search_calls if c[1] == 1000]
+        assert "(5)" in ctrl.window.today.label.text()
+
+        # Jira без точної кількості: у заголовку лишається кількість з вікна, а не "(1)"
+        client.count_unknown = True
+        ctrl.refresh_all()
+        drain(ctrl)
+        assert "(3)" in ctrl.window.today.label.text()
+    finally:
+        syncmod.WINDOW_LIMIT = limit
+
+
+def test_scrolling_continues_the_truncated_window():
+    print("=== test_scrolling_continues_the_truncated_window ===")
+    import jira_reminder.sync as syncmod
+
+    ctrl, tray, client = create_controller_for_test()
+    today = date.today()
+    due = {"summary": "Now", "duedate": today.isoformat()}
+    client.window_issues_to_return = [{"key": f"ABC-{i}", **due} for i in range(7)]
+    client.today_issues_to_return = client.window_issues_to_return  # Jira's count for "today"
+    model = ctrl.window.today.model
+
+    def scroll_to_end():
+        while model.canFetchMore():
+            model.fetchMore()
+            drain(ctrl)
+
+    limit, syncmod.WINDOW_LIMIT = syncmod.WINDOW_LIMIT, 3  # the window fetch hits its cap
+    page_size, ctrlmod.MAX_PAGE_SIZE = ctrlmod.MAX_PAGE_SIZE, 2
+    try:
+        # перша сторінка після вікна падає: це не блокує наступні запити
+        client.page_error = RuntimeError("boom")
+        ctrl.refresh_all()
+        drain(ctrl)
+        assert "(7)" in ctrl.window.today.label.text()
+        scroll_to_end()  # список може й сам попросити наступну сторінку, коли бачить кінець
+        assert client.page_error is None, "Після помилки прокрутка має знову просити сторінку"
+        # продовжуємо вікно з місця, де зупинилась повна синхронізація, а не з першої сторінки
+        assert client.page_calls[0] == ("JQL-WINDOW", "3"), client.page_calls
+        assert set(client.page_calls) == {("JQL-WINDOW", "3"), ("JQL-WINDOW", "5")}, client.page_calls
+        assert [it.key for it in model.issues()] == [f"ABC-{i}" for i in range(7)]
+
+        # опитування не обрізає завантажене назад до вікна
+        ctrl._poll()
+        drain(ctrl)
+        assert len(model.issues()) == 7
+
+        # повна синхронізація починає сторінки спочатку
+        ctrl.refresh_all()
+        drain(ctrl)
+        assert len(model.issues()) == 3 and ctrl._more is None
+    finally:
+        syncmod.WINDOW_LIMIT = limit
+        ctrlmod.MAX_PAGE_SIZE = page_size
+
+
+def test_snapshot_rendered_on_start_and_marked_stale():
+    print("=== test_snapshot_rendered_on_start_and_marked_stale ===")
+    ctrl, tray, client = create_controller_for_test()
+    today = date.today()
+    client.window_issues_to_return = [{"key": "ABC-7", "summary": "Now", "duedate": today.isoformat()}]
+    ctrl.refresh_all()
+    drain(ctrl)
+    assert paths_mod.SNAPSHOT_PATH.exists(), "Після успішного refresh має з'явитися снапшот"
+
+    fetched_at, issues = load_snapshot(ctrl._account)
+    assert [x["key"] for x in issues] == ["ABC-7"]
+
+    # "Новий запуск": дані зі снапшота малюються одразу, з позначкою "cached"
+    client.window_issues_to_return = []
+    ctrl._restore_snapshot()
+    assert [x["key"] for x in ctrl.today_issues] == ["ABC-7"]
+    assert "cached" in ctrl.window.today.label.text()
+
+    # Після успішного оновлення позначка зникає
+    ctrl.refresh_all()
+    drain(ctrl)
+    assert "cached" not in ctrl.window.today.label.text()
+    assert ctrl.today_issues == []
+
+
+def test_concurrent_snapshot_saves_keep_the_newest():
+    print("=== test_concurrent_snapshot_saves_keep_the_newest ===")
+    import threading
+    start = datetime(2030, 1, 1, 9, 0)
+    saves = [
+        threading.Thread(
+            target=save_snapshot,
+            args=("snap@example.com", [{"key": f"S-{i}"}] * 200, start + timedelta(minutes=i)),
+        )
+        for i in range(8)
+    ]
+    # старіші знімки пишуться останніми: жоден не має затерти новіший чи впасти на спільному .tmp
+    for t in reversed(saves):
+        t.start()
+    for t in saves:
+        t.join()
+    fetched_at, issues = load_snapshot("snap@example.com")
+    assert fetched_at == start + timedelta(minutes=7)
+    assert {x["key"] for x in issues} == {"S-7"}
+    assert not paths_mod.SNAPSHOT_PATH.with_suffix(".tmp").exists()
+
+
+def test_midnight_rollover_rebuckets_then_full_sync():
+    print("=== test_midnight_rollover_rebuckets_then_full_sync ===")
+    ctrl, tray, client = create_controller_for_test()
+    today = date.today()
+    client.window_issues_to_return = [
+        {"key": "ABC-5", "summary": "Next", "duedate": (today + timedelta(days=1)).isoformat()},
+    ]
+    ctrl.refresh_all()
+    drain(ctrl)
+    assert ctrl.today_issues == []
+    client.reset_counters()
+
+    # 00:05 наступного дня: завтрашня задача стає сьогоднішньою одразу, ще до відповіді Jira
+    ctrl._on_event("midnight", datetime.combine(today + timedelta(days=1), dtime(0, 5)))
+    assert [x["key"] for x in ctrl.today_issues] == ["ABC-5"]
+
+    # ...а повна синхронізація підтягує задачі, які щойно увійшли у вікно (їх немає у сховищі)
+    drain(ctrl)
+    assert [jql for jql, _ in client.search_calls] == ["JQL-WINDOW"], client.search_calls
+
+
+def test_jira_outage_announced_once():
+    print("=== test_jira_outage_announced_once ===")
+    from jira_reminder.resilience import JiraUnavailableError
+
+    ctrl, tray, client = create_controller_for_test()
+    ctrl.jiraStateChanged.emit("open")
+    QtWidgets.QApplication.processEvents()
+    assert len(tray.messages) == 1 and "not reachable" in tray.messages[0][1]
+
+    # поки Jira недоступна, невдалі оновлення та перевірки не спамлять сповіщеннями
+    ctrl._on_refresh_failed(ctrl._refresh_gen, JiraUnavailableError(60), True)
+    ctrl._on_today_check_failed(JiraUnavailableError(60))
+    ctrl.jiraStateChanged.emit("open")
+    QtWidgets.QApplication.processEvents()
+    assert len(tray.messages) == 1
+
+    ctrl.jiraStateChanged.emit("closed")
+    QtWidgets.QApplication.processEvents()
+    assert len(tray.messages) == 2 and "restored" in tray.messages[1][1]
+
+
+def test_config_changes_apply_without_restart():
+    """
+    Збережені налаштування застосовуються одразу: новий клієнт Jira, новий розклад, TTL кешу,
+    інтервал повної синхронізації; видалений ключ повертається до значення за замовчуванням.
+    """
+    print("=== test_config_changes_apply_without_restart ===")
+    tmp = Path(_TMP.name)
+    paths_mod.CONFIG_PLAIN_PATH = tmp / "config.json"
+    paths_mod.CONFIG_ENC_PATH = tmp / "config.enc"
+    secure = {
+        "jira_base_url": "https://example.atlassian.net",
+        "assignee_email": "user@example.com",
+        "api_token": "dummy-token",
+    }
+    store = ConfigStore()
+    store.save_secure(secure)
+    store.save_plain({"poll_minutes": 5})
+
+    ctrl, tray, client = create_controller_for_test(config=store)
+
+    store.save_secure({**secure, "assignee_email": "other@example.com"})
+    drain(ctrl)
+    assert ctrl.client is not client, "Після зміни облікових даних має бути новий клієнт"
+    assert ctrl.sync.assignee == "other@example.com"
+    assert ctrl.store.get_meta("account") == "https://example.atlassian.net|other@example.com"
+
+    store.save_plain({"poll_minutes": 7})
+    assert ctrl.scheduler.core.schedule.poll_every == timedelta(minutes=7)
+
+    client = ctrl.client
+    invalidated = client.invalidate_calls
+    store.save_plain({"poll_minutes": 7, "cache_ttl_seconds": 5, "full_sync_minutes": 15})
+    assert ctrl.client is client and client.cache_ttl == 5.0
+    assert client.invalidate_calls == invalidated + 1, "Кеш зі старим TTL треба скинути"
+    assert ctrl.sync.full_every == timedelta(minutes=15)
+
+    store.save_plain({"cache_ttl_seconds": 5, "full_sync_minutes": 15})
+    assert "poll_minutes" not in ctrl.cfg, "Видалений ключ не повинен залишатися в cfg"
+    assert ctrl.scheduler.core.schedule.poll_every == Schedule().poll_every
+    drain(ctrl)
+
+    # config.enc зіпсований: працюємо далі зі старими налаштуваннями Jira, а plain-частину беремо нову
+    client = ctrl.client
+    paths_mod.CONFIG_ENC_PATH.write_bytes(b"garbage")
+    paths_mod.CONFIG_PLAIN_PATH.write_text('{"poll_minutes": 9}', encoding="utf-8")
+    store.reload()
+    drain(ctrl)
+    assert ctrl.client is client and ctrl.cfg["assignee_email"] == "other@example.com"
+    assert ctrl.scheduler.core.schedule.poll_every == timedelta(minutes=9)
+    ctrl.check_today_and_notify()
+    drain(ctrl)
+    assert ctrl._bucket_jqls() and ctrl.rules
+
+
 def run_all():
     test_morning_popup_when_tasks_exist()
     test_morning_no_tasks_no_popup()
     test_evening_interval_and_stop_when_closed()
+    test_refresh_splits_window_into_blocks()
+    test_truncated_window_is_counted_once_per_full_sync()
+    test_scrolling_continues_the_truncated_window()
+    test_snapshot_rendered_on_start_and_marked_stale()
+    test_concurrent_snapshot_saves_keep_the_newest()
+    test_midnight_rollover_rebuckets_then_full_sync()
+    test_jira_outage_announced_once()
+    test_config_changes_apply_without_restart()
     print("\033[1m\033[42m\033[30m ALL CONTROLLER NOTIFICATION TESTS PASSED \033[0m")
 
 
@@ -0,0 +1,46 @@
+# scripts/test_fake_jira.py
+"""
+Tests for the local Jira stand-in used by the benchmarks: the real client talks to it over HTTP.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for p in (ROOT / "src", ROOT / "scripts"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from bench import _client, bench_parse, compare  # noqa: E402
+from fake_jira_server import FakeJira  # noqa: E402
+
+
+def test_client_pages_through_the_stand_in():
+    with FakeJira(issues=230, page_cap=100) as jira:
+        client = _client(jira.url)
+        pages = list(client.iter_search("project = BENCH", page_size=100))
+        assert [len(p) for p in pages] == [100, 100, 30]
+        assert pages[0][0].key == "BENCH-1" and pages[0][0].due is not None
+        assert client.count("project = BENCH") == 230
+        assert jira.stats["requests"] == 4
+
+
+def test_simulated_errors_are_retried():
+    with FakeJira(issues=50, error_rate=0.5, seed=3) as jira:
+        client = _client(jira.url)
+        client.retry.retries = 10
+        assert len(client.search("project = BENCH", max_results=50)) == 50
+        assert jira.stats["errors"] > 0
+
+
+def test_results_can_be_compared():
+    old = {"version": "1", "results": {"parse": bench_parse(200, 1)}}
+    new = {"version": "2", "results": {"parse": bench_parse(200, 1)}}
+    table = compare(old, new)
+    assert "parse.json_decode_seconds.median" in table and "parse.issues_per_second" in table
+
+
+if __name__ == "__main__":
+    test_client_pages_through_the_stand_in()
+    test_simulated_errors_are_retried()
+    test_results_can_be_compared()
+    print("OK")
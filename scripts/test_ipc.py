@@ -0,0 +1,71 @@
+# scripts/test_ipc.py
+"""
+Tests for forwarding commands from a second launch to the running instance (local socket, no UI).
+"""
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from PyQt6 import QtCore, QtWidgets  # noqa: E402
+
+from jira_reminder import ipc  # noqa: E402
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def wait_for(cond, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not cond() and time.monotonic() < end:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 20)
+    return cond()
+
+
+def test_commands_reach_the_running_instance():
+    name = f"jrm-test-{uuid.uuid4().hex[:8]}"
+    server = ipc.CommandServer(name=name)
+    assert server.listen()
+    got = []
+    server.commandReceived.connect(got.append)
+    try:
+        assert ipc.send_command("refresh", name=name)
+        assert ipc.send_command("today", name=name)
+        assert wait_for(lambda: len(got) == 2)
+        assert sorted(got) == ["refresh", "today"]
+    finally:
+        server.close()
+
+
+def test_nobody_listening_is_reported_fast():
+    name = f"jrm-test-{uuid.uuid4().hex[:8]}"
+    t = time.perf_counter()
+    assert not ipc.send_command("show", name=name)
+    assert time.perf_counter() - t < 0.5
+
+    try:
+        ipc.send_command("rm -rf", name=name)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown command must be rejected")
+
+
+def test_cli_options():
+    from jira_reminder.app import parse_args
+
+    assert parse_args(["--today"])[0].command == "today"
+    assert parse_args([])[0].command is None
+
+
+if __name__ == "__main__":
+    test_commands_reach_the_running_instance()
+    test_nobody_listening_is_reported_fast()
+    test_cli_options()
+    print("OK")
@@ -0,0 +1,423 @@
+"""
+Tests for JiraClient query building and local result processing.
+No network access: only pure helpers are exercised here.
+"""
+import sys
+from pathlib import Path
+from datetime import date
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+import requests  # noqa: E402
+
+from jira_reminder.jira_client import JiraClient, partition_buckets  # noqa: E402
+from jira_reminder.telemetry import TELEMETRY  # noqa: E402
+from jira_reminder.resilience import (  # noqa: E402
+    CircuitBreaker,
+    JiraUnavailableError,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def make_client(**kw) -> JiraClient:
+    params = dict(
+        base_url="https://example.atlassian.net/",
+        email="me@example.com",
+        api_token="token",
+        projects=["ABC"],
+        issue_types=["Sub-task - HW"],
+    )
+    params.update(kw)
+    return JiraClient(**params)
+
+
+def test_window_jql_covers_up_to_tomorrow():
+    jql = make_client().jql_window("me@example.com")
+    assert 'assignee = "me@example.com"' in jql
+    assert "statusCategory != Done" in jql
+    assert "duedate <= startOfDay('+1d')" in jql
+    assert "cf[10015] <= startOfDay('+1d')" in jql
+
+
+def test_updated_since_jql_includes_done_issues():
+    jql = make_client().jql_updated_since("me@example.com", 7)
+    assert 'updated >= "-7m"' in jql
+    assert "statusCategory" not in jql
+
+
+def test_start_date_field_id():
+    assert make_client(start_date_field="cf[123]")._field_id() == "customfield_123"
+    assert make_client(start_date_field="customfield_77")._field_id() == "customfield_77"
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200, headers=None):
+        self._data = data
+        self.status_code = status_code
+        self.reason = "OK"
+        self.headers = headers or {}
+        self.text = ""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def json(self):
+        return self._data
+
+
+class PagedSession:
+    """Serves `total` synthetic issues through nextPageToken pagination."""
+
+    def __init__(self, total):
+        self.total = total
+        self.payloads = []
+
+    def post(self, url, json=None, timeout=None):
+        self.payloads.append(json)
+        start = int(json.get("nextPageToken") or 0)
+        end = min(start + json["maxResults"], self.total)
+        data = {
+            "issues": [{"key": f"P-{i}", "fields": {"summary": f"Issue {i}"}} for i in range(start, end)],
+            "isLast": end >= self.total,
+        }
+        if end < self.total:
+            data["nextPageToken"] = str(end)
+        return FakeResponse(data)
+
+
+def test_iter_search_follows_next_page_token():
+    client = make_client()
+    client.session = PagedSession(total=120)
+    pages = list(client.iter_search("project = P", page_size=50))
+    assert [len(p) for p in pages] == [50, 50, 20]
+    assert pages[2][-1]["key"] == "P-119"
+    assert [p.get("nextPageToken") for p in client.session.payloads] == [None, "50", "100"]
+    assert pages[-1].next_token is None
+
+
+def test_iter_search_respects_limit():
+    client = make_client()
+    client.session = PagedSession(total=500)
+    pages = list(client.iter_search("project = P", page_size=40, limit=90))
+    assert [len(p) for p in pages] == [40, 40, 10]
+    assert client.session.payloads[-1]["maxResults"] == 10
+    assert [p.next_token for p in pages] == ["40", "80", "90"]  # where to continue past the limit
+
+
+def test_search_collects_pages():
+    client = make_client()
+    client.session = PagedSession(total=130)
+    issues = client.search("project = P", max_results=500)
+    assert len(issues) == 130
+    assert len(client.session.payloads) == 2  # page size is capped at MAX_PAGE_SIZE
+
+
+def test_search_page_continues_from_a_token():
+    client = make_client()
+    client.session = PagedSession(total=70)
+    first, token = client.search_page("project = P", page_size=50)
+    rest, last = client.search_page("project = P", page_size=50, next_token=token)
+    assert (len(first), token, len(rest), last) == (50, "50", 20, None)
+    assert rest[0]["key"] == "P-50" and len(client.session.payloads) == 2
+
+
+def test_search_results_are_cached_until_ttl():
+    client = make_client(cache_ttl=30)
+    client.session = PagedSession(total=3)
+    clock = [100.0]
+    client.clock = lambda: clock[0]
+
+    assert len(client.search("project = P")) == 3
+    assert len(client.search("project = P")) == 3
+    assert len(client.session.payloads) == 1, "second call must be served from cache"
+    assert len(client.search("project = P", max_results=2)) == 2
+    assert len(client.session.payloads) == 2, "different max_results is a different key"
+
+    clock[0] += 31
+    client.search("project = P")
+    assert len(client.session.payloads) == 3, "expired entry is fetched again"
+
+    client.invalidate()
+    client.search("project = P")
+    assert len(client.session.payloads) == 4
+
+
+def test_search_can_bypass_the_cache():
+    client = make_client(cache_ttl=60)
+    client.session = PagedSession(total=3)
+    client.search('updated >= "-7m"', max_results=50)
+    client.search('updated >= "-7m"', max_results=50, use_cache=False)
+    client.search('updated >= "-7m"', max_results=50, use_cache=False)
+    assert len(client.session.payloads) == 3
+    client.search('updated >= "-7m"', max_results=50)
+    assert len(client.session.payloads) == 3  # the cached entry is still there for cached callers
+
+
+def test_concurrent_searches_share_one_request():
+    import threading
+
+    gate = threading.Event()
+
+    class SlowSession(PagedSession):
+        def post(self, url, json=None, timeout=None):
+            gate.wait(5)
+            return super().post(url, json=json, timeout=timeout)
+
+    client = make_client(cache_ttl=0)
+    client.session = SlowSession(total=5)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.search("project = P"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    # let the other callers queue up behind the first request before it completes
+    for _ in range(200):
+        if client._inflight:
+            break
+        threading.Event().wait(0.01)
+    threading.Event().wait(0.2)
+    gate.set()
+    for t in threads:
+        t.join(5)
+    assert [len(r) for r in results] == [5, 5, 5, 5]
+    assert len(client.session.payloads) == 1
+
+
+class ScriptedSession:
+    """Returns the scripted responses (or raises the scripted exceptions) in order."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        item = self.script.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+OK_PAGE = FakeResponse({"issues": [{"key": "R-1", "fields": {}}], "isLast": True})
+
+
+def resilient_client(*script, **breaker_kw):
+    client = make_client(
+        cache_ttl=0,
+        retry=RetryPolicy(retries=2, base_delay=1.0, max_delay=30.0),
+        breaker=CircuitBreaker(**breaker_kw),
+    )
+    client.session = ScriptedSession(*script)
+    client.sleeps = []
+    client._sleep = client.sleeps.append
+    return client
+
+
+def test_retries_5xx_and_timeouts_with_backoff():
+    client = resilient_client(FakeResponse({}, 503), requests.Timeout("slow"), OK_PAGE)
+    attempts = []
+    client.on_request = attempts.append
+    assert [x["key"] for x in client.search("q")] == ["R-1"]
+    assert client.session.calls == 3
+    assert attempts == ["search/jql"] * 3  # the hook sees every HTTP attempt
+    assert len(client.sleeps) == 2 and all(0 <= s <= 2.0 for s in client.sleeps)
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_429_honours_retry_after():
+    client = resilient_client(FakeResponse({}, 429, {"Retry-After": "7"}), OK_PAGE)
+    client.search("q")
+    assert client.sleeps == [7.0]
+
+
+def test_long_retry_after_opens_circuit_without_waiting():
+    clock = [0.0]
+    states = []
+    client = resilient_client(
+        FakeResponse({}, 429, {"Retry-After": "600"}),
+        OK_PAGE,
+        clock=lambda: clock[0],
+        on_change=states.append,
+    )
+    try:
+        client.search("q")
+        assert False, "expected HTTPError"
+    except requests.HTTPError:
+        pass
+    assert client.sleeps == [] and client.breaker.state == CircuitBreaker.OPEN
+
+    # while open: fail fast, no HTTP call
+    try:
+        client.search("q")
+        assert False, "expected JiraUnavailableError"
+    except JiraUnavailableError as e:
+        assert e.retry_in == 600
+    assert client.session.calls == 1
+
+    clock[0] = 601  # cooldown over: one trial request closes the circuit again
+    assert [x["key"] for x in client.search("q")] == ["R-1"]
+    assert states == ["open", "half-open", "closed"]
+
+
+def test_breaker_opens_after_consecutive_failures():
+    errors = [requests.ConnectionError("down")] * 9
+    client = resilient_client(*errors, threshold=3, cooldown=60)
+    for _ in range(3):
+        try:
+            client.search("q")
+        except requests.ConnectionError:
+            pass
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert client.session.calls == 9  # 3 calls x (1 + 2 retries)
+
+
+def test_failed_half_open_trial_reopens_and_recovers():
+    clock = [0.0]
+    down = [requests.ConnectionError("down")] * 3
+    client = resilient_client(
+        *down, *down, FakeResponse({}, 503), OK_PAGE, threshold=1, cooldown=60, clock=lambda: clock[0]
+    )
+    try:
+        client.search("q")
+    except requests.ConnectionError:
+        pass
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    clock[0] = 61  # the trial is retried (not refused by its own breaker) and fails for good
+    try:
+        client.search("q")
+        assert False, "expected ConnectionError"
+    except requests.ConnectionError:
+        pass
+    assert client.session.calls == 6 and client.breaker.state == CircuitBreaker.OPEN
+
+    clock[0] = 1000  # the next trial gets through its retries and closes the circuit
+    assert [x["key"] for x in client.search("q")] == ["R-1"]
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_trial_ending_in_another_error_settles_the_breaker():
+    clock = [0.0]
+    client = resilient_client(
+        *[requests.ConnectionError("down")] * 3,
+        requests.exceptions.ChunkedEncodingError("cut off"),
+        OK_PAGE,
+        threshold=1,
+        cooldown=60,
+        clock=lambda: clock[0],
+    )
+    try:
+        client.search("q")
+    except requests.ConnectionError:
+        pass
+    clock[0] = 61
+    try:
+        client.search("q")
+        assert False, "expected ChunkedEncodingError"
+    except requests.exceptions.ChunkedEncodingError:
+        pass
+    assert client.breaker.state == CircuitBreaker.OPEN  # the trial failed, not stuck half-open
+
+    clock[0] = 122
+    assert [x["key"] for x in client.search("q")] == ["R-1"]
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_parse_retry_after_http_date():
+    from datetime import datetime, timezone
+
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("Wed, 01 Jan 2025 12:00:30 GMT", now) == 30
+    assert parse_retry_after("garbage") is None
+
+
+class CountSession:
+    def __init__(self, approximate=True, total=None):
+        self.approximate = approximate
+        self.total = total
+        self.requests = []
+
+    def post(self, url, json=None, timeout=None):
+        self.requests.append((url.rsplit("/", 1)[-1], json))
+        if url.endswith("approximate-count"):
+            return FakeResponse({"count": 42}) if self.approximate else FakeResponse({}, 404)
+        data = {"issues": [{"key": "C-1", "fields": {}}], "isLast": False, "nextPageToken": "x"}
+        if self.total is not None:
+            data["total"] = self.total
+        return FakeResponse(data)
+
+
+def test_count_uses_approximate_count_endpoint():
+    client = make_client()
+    client.session = CountSession()
+    assert client.count("project = P") == 42
+    assert client.session.requests == [("approximate-count", {"jql": "project = P"})]
+
+
+def test_count_falls_back_to_minimal_search():
+    client = make_client()
+    client.session = CountSession(approximate=False)
+    assert client.count("project = P") == 1
+    endpoint, payload = client.session.requests[-1]
+    assert endpoint == "jql" and payload["maxResults"] == 1 and payload["fields"] == ["id"]
+    assert client.count("project = P", exact=True) is None  # 1 is not the total
+
+    client.session = CountSession(approximate=False, total=1500)
+    assert client.count("project = P") == client.count("project = P", exact=True) == 1500
+
+
+def test_partition_buckets_by_due_and_start_date():
+    today = date(2025, 11, 10)
+    issues = [
+        {"key": "A-1", "duedate": "2025-11-01", "startdate": None},
+        {"key": "A-2", "duedate": "2025-11-10", "startdate": None},
+        {"key": "A-3", "duedate": None, "startdate": "2025-11-11"},
+        {"key": "A-4", "duedate": "2025-11-10", "startdate": "2025-11-05"},
+        {"key": "A-5", "duedate": "2025-11-20", "startdate": None},
+    ]
+    buckets = partition_buckets(issues, today)
+    assert [x["key"] for x in buckets["overdue"]] == ["A-1", "A-4"]
+    assert [x["key"] for x in buckets["today"]] == ["A-2", "A-4"]
+    assert [x["key"] for x in buckets["tomorrow"]] == ["A-3"]
+
+
+def test_requests_are_measured():
+    TELEMETRY.reset()
+    client = make_client()
+    client.session = PagedSession(total=120)
+    client.search("project = P", max_results=120)
+    client.search("project = P", max_results=120)
+    endpoint = {"endpoint": "search/jql"}
+    assert TELEMETRY.histogram("jira_http_request_seconds", **endpoint).count == 2  # pages of 100 + 20
+    assert TELEMETRY.counter("jira_http_responses_total", status=200, **endpoint) == 2
+    assert TELEMETRY.counter("jira_search_cache_total", result="miss") == 1
+    assert TELEMETRY.counter("jira_search_cache_total", result="hit") == 1
+    assert TELEMETRY.histogram("jira_parse_issues_seconds").count == 2
+
+
+if __name__ == "__main__":
+    test_window_jql_covers_up_to_tomorrow()
+    test_updated_since_jql_includes_done_issues()
+    test_start_date_field_id()
+    test_iter_search_follows_next_page_token()
+    test_iter_search_respects_limit()
+    test_search_collects_pages()
+    test_search_page_continues_from_a_token()
+    test_search_results_are_cached_until_ttl()
+    test_search_can_bypass_the_cache()
+    test_concurrent_searches_share_one_request()
+    test_retries_5xx_and_timeouts_with_backoff()
+    test_429_honours_retry_after()
+    test_long_retry_after_opens_circuit_without_waiting()
+    test_breaker_opens_after_consecutive_failures()
+    test_failed_half_open_trial_reopens_and_recovers()
+    test_trial_ending_in_another_error_settles_the_breaker()
+    test_parse_retry_after_http_date()
+    test_count_uses_approximate_count_endpoint()
+    test_count_falls_back_to_minimal_search()
+    test_partition_buckets_by_due_and_start_date()
+    test_requests_are_measured()
+    print("OK")
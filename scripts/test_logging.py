@@ -0,0 +1,69 @@
+# scripts/test_logging.py
+"""
+Tests for the background log writer: no duplicate handlers, size cap with compressed segments.
+"""
+import gzip
+import logging
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder import logging_setup  # noqa: E402
+from jira_reminder.logging_setup import log, setup_logging, shutdown_logging  # noqa: E402
+
+
+def test_log_is_written_off_thread_and_rotated():
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "app.log"
+        try:
+            setup_logging(True, False, path=path, max_bytes=2000, backups=2)
+            setup_logging(True, False, path=path, max_bytes=2000, backups=2)  # live reconfigure
+            ours = [h for h in log.handlers if isinstance(h, logging.handlers.QueueHandler)]
+            assert len(ours) == 1
+
+            writers = set()
+            file_handler = logging_setup._listener.handlers[0]
+            real_emit = file_handler.emit
+            file_handler.emit = lambda r: (writers.add(threading.current_thread().name), real_emit(r))
+            for i in range(200):
+                log.debug("line %d %s", i, "x" * 40)
+        finally:
+            shutdown_logging()
+
+        assert writers and threading.current_thread().name not in writers
+        segments = sorted(Path(td).glob("app.log.*.gz"))
+        assert [p.name for p in segments] == ["app.log.1.gz", "app.log.2.gz"]
+        assert path.stat().st_size <= 2000
+        assert b"line" in gzip.decompress(segments[0].read_bytes())
+        assert "line 199" in path.read_text(encoding="utf-8")
+
+
+def test_new_log_rolls_over_and_disabled_log_skips_formatting():
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "app.log"
+        path.write_text("previous run\n", encoding="utf-8")
+        try:
+            setup_logging(True, True, path=path)
+        finally:
+            shutdown_logging()
+        assert gzip.decompress((Path(td) / "app.log.1.gz").read_bytes()) == b"previous run\n"
+
+        setup_logging(False, False, path=path)
+
+        class Expensive:
+            def __str__(self):
+                raise AssertionError("formatted while disabled")
+
+        log.debug("value %s", Expensive())
+        assert not log.isEnabledFor(logging.DEBUG)
+
+
+if __name__ == "__main__":
+    test_log_is_written_off_thread_and_rotated()
+    test_new_log_rolls_over_and_disabled_log_skips_formatting()
+    print("OK")
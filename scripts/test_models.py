@@ -0,0 +1,57 @@
+"""
+Tests for the Issue record produced by the Jira client.
+"""
+import json
+import sys
+from pathlib import Path
+from datetime import date, timedelta
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder.models import Issue, Priority  # noqa: E402
+
+
+def make(**kw):
+    data = {"key": "A-1", "summary": "x", "duedate": "2025-03-10", "status": "In Progress",
+            "status_category": "indeterminate", "priority": "High"}
+    data.update(kw)
+    return Issue.from_dict(data)
+
+
+def test_fields_are_parsed_once():
+    it = make(startdate="2025-03-09")
+    assert it.due == date(2025, 3, 10) and it.start == date(2025, 3, 9)
+    assert it.status_state == "inprogress"
+    assert it.priority_level is Priority.HIGH and it.priority_level.label == "High"
+    assert make(duedate="garbage").due is None
+    assert make(priority="Blocker").priority_level is Priority.NONE
+    # unknown status name falls back to the category
+    assert make(status="Code Review", status_category="indeterminate").status_state == "inprogress"
+    assert make(status="Weird", status_category=None).status_state == "other"
+
+
+def test_dict_compatibility():
+    it = make()
+    assert it["key"] == "A-1" and it.get("startdate") is None and it.get("nope", 1) == 1
+    assert "summary" in it and "due" not in it
+    assert it == it.to_dict()
+    assert Issue.from_dict(json.loads(json.dumps(it.to_dict()))) == it
+    assert not hasattr(it, "__dict__")
+
+
+def test_due_state():
+    today = date(2025, 3, 10)
+    assert make(duedate="2025-03-09").due_state(today) == "overdue"
+    assert make().due_state(today) == "today"
+    assert make(duedate=(today + timedelta(days=1)).isoformat()).due_state(today) == "tomorrow"
+    assert make(duedate="2025-04-01").due_state(today) == "future"
+    assert make(duedate=None).due_state(today) == "none"
+
+
+if __name__ == "__main__":
+    test_fields_are_parsed_once()
+    test_dict_compatibility()
+    test_due_state()
+    print("OK")
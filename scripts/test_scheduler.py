@@ -0,0 +1,99 @@
+"""
+Tests for the Qt-free reminder scheduling rules.
+"""
+import sys
+from pathlib import Path
+from datetime import date, datetime, time as dtime, timedelta
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder.scheduler import (  # noqa: E402
+    ReminderScheduler,
+    Schedule,
+    MORNING,
+    EVENING,
+    POLL,
+    MIDNIGHT,
+)
+
+DAY = date(2025, 11, 10)
+
+
+def at(h, m, day=DAY):
+    return datetime.combine(day, dtime(h, m))
+
+
+def run_day(sched, start, end):
+    """Follow next_wakeup from start to end, like the single-shot timer does."""
+    fired, wakeups, now = [], 0, start
+    while now < end:
+        now = sched.next_wakeup(now)
+        if now >= end:
+            break
+        wakeups += 1
+        fired += [(ev, now.strftime("%H:%M")) for ev in sched.due(now)]
+    return fired, wakeups
+
+
+def test_morning_fires_once_per_day():
+    sched = ReminderScheduler(Schedule(poll_every=timedelta(days=7)), now=at(9, 0))
+    assert sched.due(at(9, 59)) == []
+    assert sched.due(at(10, 0)) == [MORNING]
+    assert sched.due(at(10, 1)) == []
+    assert sched.due(at(10, 30)) == []
+
+
+def test_morning_after_sleep_within_grace():
+    sched = ReminderScheduler(Schedule(poll_every=timedelta(days=7)), now=at(8, 0))
+    # laptop was suspended over 10:00 and woke up at 10:40: the digest still runs, once
+    assert sched.due(at(10, 40)) == [MORNING]
+    other = ReminderScheduler(Schedule(poll_every=timedelta(days=7)), now=at(8, 0))
+    assert other.due(at(11, 30)) == []
+
+
+def test_full_day_is_event_driven():
+    sched = ReminderScheduler(Schedule(poll_every=timedelta(days=7)), now=at(0, 0))
+    fired, wakeups = run_day(sched, at(0, 0), at(23, 59))
+    assert fired == [
+        (MORNING, "10:00"),
+        (EVENING, "16:30"),
+        (EVENING, "17:00"),
+        (EVENING, "17:30"),
+        (EVENING, "18:00"),
+        (EVENING, "18:30"),
+        (EVENING, "19:00"),
+    ]
+    assert wakeups < 24 * 4 + 10  # bounded by MAX_SLEEP, far below one per minute
+
+
+def test_poll_and_midnight():
+    sched = ReminderScheduler(Schedule(poll_every=timedelta(minutes=5)), now=at(23, 50))
+    assert sched.next_wakeup(at(23, 50)) == at(23, 55)
+    assert sched.due(at(23, 55)) == [POLL]
+    nxt = sched.next_wakeup(at(23, 55))
+    assert nxt == at(0, 0, DAY + timedelta(days=1))
+    assert sched.due(nxt) == [MIDNIGHT, POLL]
+
+
+def test_configurable_windows():
+    cfg = {"morning_time": "08:15", "evening_start": "17:00", "evening_end": "17:45", "evening_interval_minutes": 15}
+    sched = ReminderScheduler(Schedule.from_config({**cfg, "poll_minutes": 10_000}), now=at(0, 0))
+    fired, _ = run_day(sched, at(0, 0), at(23, 59))
+    assert fired == [
+        (MORNING, "08:15"),
+        (EVENING, "17:00"),
+        (EVENING, "17:15"),
+        (EVENING, "17:30"),
+        (EVENING, "17:45"),
+    ]
+
+
+if __name__ == "__main__":
+    test_morning_fires_once_per_day()
+    test_morning_after_sleep_within_grace()
+    test_full_day_is_event_driven()
+    test_poll_and_midnight()
+    test_configurable_windows()
+    print("OK")
@@ -0,0 +1,116 @@
+# scripts/test_security.py
+"""
+Tests for the encrypted config format and the session key cache.
+"""
+import os
+import sys
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from cryptography.exceptions import InvalidTag  # noqa: E402
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # noqa: E402
+
+from jira_reminder import security as sec  # noqa: E402
+
+
+class CountingScrypt:
+    calls = 0
+
+    def __init__(self, **kw):
+        CountingScrypt.calls += 1
+        self._kdf = REAL_SCRYPT(**kw)
+
+    def derive(self, data):
+        return self._kdf.derive(data)
+
+
+REAL_SCRYPT = sec.Scrypt
+
+
+def with_counting_kdf(fn):
+    def wrapper():
+        sec.wipe_key_cache()
+        CountingScrypt.calls = 0
+        sec.Scrypt = CountingScrypt
+        try:
+            fn()
+        finally:
+            sec.Scrypt = REAL_SCRYPT
+            sec.wipe_key_cache()
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+
+@with_counting_kdf
+def test_roundtrip_writes_versioned_header_and_derives_once():
+    blob = sec.encrypt_config({"a": 1})
+    assert blob[:4] == b"JRM2" and tuple(blob[4:7]) == (sec.KDF_N_LOG2, sec.KDF_R, sec.KDF_P)
+    assert sec.decrypt_config(blob) == {"a": 1}
+    # save after load reuses the salt (fresh nonce), so still one derivation
+    again = sec.encrypt_config({"a": 2})
+    assert again[7:23] == blob[7:23] and again[23:35] != blob[23:35]
+    assert sec.decrypt_config(again) == {"a": 2}
+    assert CountingScrypt.calls == 1
+
+
+@with_counting_kdf
+def test_reads_legacy_header():
+    salt, nonce = os.urandom(16), os.urandom(12)
+    key = sec._derive_key_scrypt(salt)  # JRM1 implies n=2**14, r=8, p=1
+    blob = b"JRM1" + salt + nonce + AESGCM(key).encrypt(nonce, json.dumps({"x": "y"}).encode(), None)
+    assert sec.decrypt_config(blob) == {"x": "y"}
+    assert CountingScrypt.calls == 1
+
+
+@with_counting_kdf
+def test_rejects_kdf_params_it_never_writes():
+    blob = sec.encrypt_config({"a": 1})
+    for params in ((30, 8, 1), (sec.KDF_N_LOG2, 255, 1), (sec.KDF_N_LOG2, 8, 255), (1, 8, 1)):
+        forged = blob[:4] + bytes(params) + blob[7:]
+        try:
+            sec.decrypt_config(forged)
+        except ValueError as e:
+            assert "KDF parameters" in str(e)
+        else:
+            raise AssertionError(f"accepted {params}")
+    assert CountingScrypt.calls == 1  # rejected before any key derivation
+
+
+@with_counting_kdf
+def test_header_is_authenticated():
+    blob = sec.encrypt_config({"a": 1})
+    header, nonce = blob[:23], blob[23:35]
+    key = sec._derive_key_scrypt(blob[7:23], tuple(blob[4:7]))
+    # the same payload under the right key, but sealed without the header as associated data
+    unbound = header + nonce + AESGCM(key).encrypt(nonce, json.dumps({"a": 1}).encode(), None)
+    forged_salt = blob[:7] + bytes([blob[7] ^ 1]) + blob[8:]
+    for forged in (unbound, forged_salt):
+        try:
+            sec.decrypt_config(forged)
+        except InvalidTag:
+            pass
+        else:
+            raise AssertionError("accepted a blob whose header was not sealed with it")
+
+
+@with_counting_kdf
+def test_wipe_zeroes_and_forgets_keys():
+    blob = sec.encrypt_config({"a": 1})
+    cached = list(sec._key_cache.values())
+    sec.wipe_key_cache()
+    assert not sec._key_cache and all(not any(k) for k in cached)
+    assert sec.decrypt_config(blob) == {"a": 1}
+    assert CountingScrypt.calls == 2
+
+
+if __name__ == "__main__":
+    test_roundtrip_writes_versioned_header_and_derives_once()
+    test_reads_legacy_header()
+    test_rejects_kdf_params_it_never_writes()
+    test_header_is_authenticated()
+    test_wipe_zeroes_and_forgets_keys()
+    print("OK")
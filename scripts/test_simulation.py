@@ -0,0 +1,151 @@
+# scripts/test_simulation.py
+"""
+Tests for the virtual-clock simulation: the real schedule and reminder rules over simulated days.
+"""
+import sys
+import time
+from pathlib import Path
+from datetime import datetime, time as dtime, timedelta
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_jira_server import START_FIELD, FakeJira  # noqa: E402
+from jira_reminder.jira_client import JiraClient  # noqa: E402
+from jira_reminder.models import Issue  # noqa: E402
+from jira_reminder.resilience import JiraUnavailableError  # noqa: E402
+from jira_reminder.scheduler import EVENING, MIDNIGHT, MORNING, POLL, Schedule  # noqa: E402
+from jira_reminder.simulation import Simulation  # noqa: E402
+from jira_reminder.store import IssueStore  # noqa: E402
+from jira_reminder.sync import IssueSync  # noqa: E402
+
+START = datetime(2025, 11, 10)  # Monday 00:00
+
+
+class SimClient:
+    """Jira as seen by the reminders: issues due every day, something closed on chosen days."""
+
+    def __init__(self, clock=None, closed_on=(), down=False):
+        self.clock = clock
+        self.closed_on = set(closed_on)
+        self.down = down
+
+    def jql_for_day(self, assignee, day):
+        return f"due {day}"
+
+    def jql_closed_today(self, assignee):
+        return "closed today"
+
+    def jql_window(self, assignee):
+        return "window"
+
+    def jql_updated_since(self, assignee, minutes):
+        return f"updated -{minutes}m"
+
+    def search(self, jql, max_results=50, use_cache=True):
+        if self.down:
+            raise JiraUnavailableError(60)
+        return [Issue(key="A-1", summary="Solder", duedate=self.clock().date().isoformat())]
+
+    def iter_search(self, jql, page_size=50, limit=None):
+        yield self.search(jql)
+
+    def count(self, jql):
+        if self.down:
+            raise JiraUnavailableError(60)
+        return 1 if self.clock().date() in self.closed_on else 0
+
+
+def simulation(schedule=None, **kw):
+    client = SimClient(**kw)
+    sim = Simulation(client, "me@example.com", schedule=schedule, start=START)
+    client.clock = sim.clock
+    return sim
+
+
+def test_week_of_reminders():
+    wednesday = START.date() + timedelta(days=2)
+    sim = simulation(closed_on={wednesday}).run(days=7)
+    days = sim.per_day()
+    assert len(days) == 7
+    for d, stats in days.items():
+        assert stats["events"][MORNING] == 1
+        assert stats["events"][EVENING] == 6  # 16:30 ... 19:00 every 30 min
+        assert stats["events"][POLL] == (287 if d == START.date() else 288)  # first poll 5 min after start
+        assert stats["calls"]["search"] == 1 and stats["calls"]["count"] == 6
+        # the digest, plus a nag after each evening check unless something got done
+        assert stats["notifications"] == (1 if d == wednesday else 7)
+    first = [(at.time(), n.text.splitlines()[0]) for at, n in sim.notifications[:2]]
+    assert first == [(dtime(10, 0), "Today's tasks:"), (dtime(16, 30), sim.notifications[1][1].text)]
+
+
+def test_sleeping_machine_catches_up_within_grace():
+    sim = simulation()
+    sim.run_until(START.replace(hour=9))
+    sim.suspend(START.replace(hour=10, minute=40)).run_until(START.replace(hour=12))
+    assert [at for at, ev in sim.events if ev == MORNING] == [START.replace(hour=10, minute=40)]
+
+    sim = simulation()
+    sim.run_until(START.replace(hour=9))
+    sim.suspend(START.replace(hour=11, minute=30)).run_until(START + timedelta(days=1, hours=12))
+    mornings = [at for at, ev in sim.events if ev == MORNING]
+    assert mornings == [START + timedelta(days=1, hours=10)]  # missed day is not replayed
+
+
+def test_jira_down_does_not_nag():
+    sim = simulation(down=True).run(days=1)
+    assert sim.notifications == []
+
+
+def test_poll_requests_per_day_with_sync():
+    sim = simulation(schedule=Schedule(poll_every=timedelta(minutes=15)))
+    sim.sync = IssueSync(sim.client, "me@example.com", full_every=timedelta(hours=1), store=IssueStore())
+    sim.run(days=2)
+    for d, stats in sim.per_day().items():
+        assert stats["events"][POLL] == (95 if d == START.date() else 96)
+        assert stats["calls"]["iter_search"] == 24  # hourly full sync (forced at midnight), one page each
+        # the digest, plus a delta sync on every poll that is not a full one
+        full_polls = 24 - stats["events"][MIDNIGHT]
+        assert stats["calls"]["search"] == 1 + stats["events"][POLL] - full_polls
+
+
+def test_real_client_counts_match_the_server():
+    with FakeJira(issues=300, assignees=("me@example.com",)) as jira:
+        client = JiraClient(jira.url, "me@example.com", "token", ["BENCH"], None, START_FIELD)
+        sync = IssueSync(client, "me@example.com", full_every=timedelta(hours=1), store=IssueStore())
+        sim = Simulation(client, "me@example.com", Schedule(poll_every=timedelta(minutes=30)), START, sync)
+        sim.run(days=2)
+        assert sum(stats["requests"] for stats in sim.per_day().values()) == jira.stats["requests"]
+
+        # the search cache expires on the virtual clock
+        served = jira.stats["requests"]
+        sim.rules.fetch_today()
+        assert jira.stats["requests"] > served
+        served = jira.stats["requests"]
+        sim.rules.fetch_today()
+        assert jira.stats["requests"] == served
+        sim.clock.advance(timedelta(seconds=client.cache_ttl + 1))
+        sim.rules.fetch_today()
+        assert jira.stats["requests"] > served
+        assert sum(stats["requests"] for stats in sim.per_day().values()) == jira.stats["requests"]
+
+
+def test_thousand_days_run_fast():
+    t0 = time.perf_counter()
+    sim = simulation(schedule=Schedule(poll_every=timedelta(hours=1))).run(days=1000)
+    assert len(sim.per_day()) == 1000
+    assert sum(1 for _, ev in sim.events if ev == MORNING) == 1000
+    assert time.perf_counter() - t0 < 10
+
+
+if __name__ == "__main__":
+    test_week_of_reminders()
+    test_sleeping_machine_catches_up_within_grace()
+    test_jira_down_does_not_nag()
+    test_poll_requests_per_day_with_sync()
+    test_real_client_counts_match_the_server()
+    test_thousand_days_run_fast()
+    print("OK")
@@ -0,0 +1,77 @@
+# scripts/test_startup.py
+"""
+Tests for startup cost: what importing the package pulls in, and the startup profile.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder.startup import StartupProfile  # noqa: E402
+
+
+def imported_after(statement: str, home: str) -> set:
+    code = f"import sys; {statement}; import json; print(json.dumps(sorted(sys.modules)))"
+    env = {**os.environ, "HOME": home, "USERPROFILE": home, "PYTHONPATH": str(ROOT / "src")}
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout))
+
+
+def test_imports_are_lazy_and_side_effect_free():
+    with tempfile.TemporaryDirectory() as home:
+        mods = imported_after("import jira_reminder", home)
+        assert not {m for m in mods if m.startswith(("PyQt6", "requests", "cryptography"))}
+
+        mods = imported_after("import jira_reminder.app", home)
+        heavy = {"requests", "cryptography", "jira_reminder.ui", "jira_reminder.controller"}
+        assert not heavy & mods, heavy & mods
+        assert not (Path(home) / ".jira_reminder").exists()  # created on first write only
+
+        mods = imported_after("from jira_reminder import JiraClient", home)
+        assert "requests" in mods and "PyQt6" not in mods
+
+
+def test_qt_options_are_passed_through():
+    from jira_reminder.app import parse_args
+
+    args, rest = parse_args(["--startup-profile", "-platform", "offscreen"])
+    assert args.startup_profile and rest == ["-platform", "offscreen"]
+    assert not parse_args([])[0].startup_profile
+
+
+def test_profile_records_phases_until_finished():
+    prof = StartupProfile(enabled=False, t0=0.0)
+    prof.mark("imports")
+    prof.mark("lock")
+    prof.finish("first data")
+    prof.finish("first data")  # later refreshes are not startup
+    prof.mark("late")
+    assert [name for name, _ in prof.phases] == ["imports", "lock", "first data"]
+    assert all(sec >= 0 for _, sec in prof.phases)
+    report = prof.report()
+    assert "lock" in report and "total" in report
+
+
+def test_profile_hands_back_once_written():
+    prof = StartupProfile(enabled=True, t0=0.0)
+    done = []
+    prof.on_finish = lambda: done.append(prof.finished)
+    prof.mark("lock")
+    assert done == []
+    prof.finish("first data")
+    prof.finish("first data")
+    assert done == [True]
+
+
+if __name__ == "__main__":
+    test_imports_are_lazy_and_side_effect_free()
+    test_qt_options_are_passed_through()
+    test_profile_records_phases_until_finished()
+    test_profile_hands_back_once_written()
+    print("OK")
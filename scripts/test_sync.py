@@ -0,0 +1,190 @@
+"""
+Tests for incremental (delta) sync of the window issues.
+Uses a stub client; no network access.
+"""
+import sys
+from pathlib import Path
+from datetime import date, datetime, time, timedelta
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder.sync import IssueSync  # noqa: E402
+from jira_reminder.store import IssueStore  # noqa: E402
+
+TODAY = date.today()
+T0 = datetime.combine(TODAY, time(10, 0))  # sync clock; the window is computed for its day
+
+
+def issue(key, due_shift=0, category="new", updated="2025-01-01T10:00:00.000+0000"):
+    return {
+        "key": key,
+        "summary": key,
+        "duedate": (TODAY + timedelta(days=due_shift)).isoformat(),
+        "startdate": None,
+        "status_category": category,
+        "updated": updated,
+    }
+
+
+class StubClient:
+    def __init__(self):
+        self.window = []
+        self.changed = []
+        self.queries = []
+        self.cached = []
+
+    def jql_window(self, assignee):
+        return "WINDOW"
+
+    def jql_updated_since(self, assignee, minutes):
+        return f"UPDATED-{minutes}"
+
+    def iter_search(self, jql, page_size=50, limit=None):
+        self.queries.append(jql)
+        yield list(self.window)
+
+    def search(self, jql, max_results=50, use_cache=True):
+        self.queries.append(jql)
+        self.cached.append(use_cache)
+        return list(self.changed)
+
+
+def test_first_sync_is_full_then_delta():
+    client = StubClient()
+    client.window = [issue("A-1", -1), issue("A-2", 0)]
+    sync = IssueSync(client, "me@example.com")
+    t0 = T0
+
+    assert [x["key"] for x in sync.sync(now=t0)] == ["A-1", "A-2"]
+    assert client.queries == ["WINDOW"]
+
+    client.changed = [issue("A-3", 1)]
+    res = sync.sync(now=t0 + timedelta(minutes=5))
+    assert client.queries[-1] == "UPDATED-7"  # 5 min since last sync + 2 min overlap
+    assert [x["key"] for x in res] == ["A-1", "A-2", "A-3"]
+    assert client.cached == [False]  # the delta JQL is the same text every poll: never from the cache
+
+
+def test_delta_drops_done_and_moved_out_issues():
+    client = StubClient()
+    client.window = [issue("A-1", -1), issue("A-2", 0), issue("A-3", 1)]
+    sync = IssueSync(client, "me@example.com")
+    t0 = T0
+    sync.sync(now=t0)
+
+    client.changed = [issue("A-1", -1, category="done"), issue("A-2", 10)]
+    res = sync.sync(now=t0 + timedelta(minutes=5))
+    assert [x["key"] for x in res] == ["A-3"]
+    # done issues are kept as history, moved-out ones stay active but outside the window
+    assert sync.store.get("A-1")["status_category"] == "done"
+    assert sync.store.get("A-2")["duedate"] == (TODAY + timedelta(days=10)).isoformat()
+
+
+def test_delta_window_is_for_the_sync_day():
+    client = StubClient()
+    client.window = [issue("A-1", 2)]  # the day after tomorrow: outside today's window
+    sync = IssueSync(client, "me@example.com", full_every=timedelta(days=1))
+    now = datetime.combine(TODAY, datetime.min.time()).replace(hour=23, minute=58)
+    sync.sync(now=now)
+    assert sync.sync(now=now + timedelta(minutes=1)) == []
+    # a delta just after midnight counts from the new day, not from the machine's date.today()
+    res = sync.sync(now=now + timedelta(minutes=5))
+    assert client.queries[-1].startswith("UPDATED-") and [x["key"] for x in res] == ["A-1"]
+
+
+def test_full_reconcile_after_interval():
+    client = StubClient()
+    client.window = [issue("A-1", 0)]
+    sync = IssueSync(client, "me@example.com", full_every=timedelta(minutes=30))
+    t0 = T0
+    sync.sync(now=t0)
+    sync.sync(now=t0 + timedelta(minutes=10))
+    client.window = []  # e.g. reassigned away: invisible to a delta query
+    assert sync.sync(now=t0 + timedelta(minutes=31)) == []
+    assert client.queries == ["WINDOW", "UPDATED-12", "WINDOW"]
+
+
+def test_window_order_matches_jql():
+    client = StubClient()
+    client.window = [
+        issue("A-1", 1),
+        issue("A-2", -2, updated="2025-01-01T09:00:00.000+0000"),
+        issue("A-3", -2, updated="2025-01-01T11:00:00.000+0000"),
+    ]
+    sync = IssueSync(client, "me@example.com")
+    sync.sync(now=datetime(2025, 1, 1, 12, 0))
+    assert [x["key"] for x in sync.window_issues()] == ["A-3", "A-2", "A-1"]
+
+
+def test_sync_times_persist_in_store():
+    client = StubClient()
+    client.window = [issue("A-1", 0)]
+    store = IssueStore()
+    t0 = T0
+    IssueSync(client, "me@example.com", store=store).sync(now=t0)
+
+    # a new IssueSync over the same store (i.e. after a restart) continues with a delta
+    again = IssueSync(client, "me@example.com", store=store)
+    assert [x["key"] for x in again.sync(now=t0 + timedelta(minutes=3))] == ["A-1"]
+    assert client.queries == ["WINDOW", "UPDATED-5"]
+
+
+def test_store_buckets_and_query():
+    store = IssueStore()
+    store.upsert([
+        dict(issue("B-1", -1), project="ABC", priority="High"),
+        dict(issue("B-2", 0), project="XYZ", priority="Low"),
+        dict(issue("B-3", 1), project="ABC", priority="Low"),
+        dict(issue("B-4", -3, category="done"), project="ABC"),
+    ])
+    buckets = store.buckets(TODAY)
+    assert [x["key"] for x in buckets["overdue"]] == ["B-1"]
+    assert [x["key"] for x in buckets["today"]] == ["B-2"]
+    assert [x["key"] for x in buckets["tomorrow"]] == ["B-3"]
+    assert [x["key"] for x in store.query(project="ABC")] == ["B-1", "B-3"]
+    assert [x["key"] for x in store.query(project="ABC", include_done=True)] == ["B-4", "B-1", "B-3"]
+    assert [x["key"] for x in store.query(priority="Low", due_before=TODAY + timedelta(days=1))] == ["B-2"]
+
+    # midnight rollover: the same rows, re-bucketed for the next day
+    nxt = store.buckets(TODAY + timedelta(days=1))
+    assert [x["key"] for x in nxt["overdue"]] == ["B-1", "B-2"]
+    assert [x["key"] for x in nxt["today"]] == ["B-3"]
+
+
+def test_replace_active_is_one_transaction():
+    store = IssueStore()
+    store.upsert([issue("A-1", 0), issue("A-2", 1)])
+    try:
+        store.replace_active([issue("B-1", 0), {**issue("B-2", 0), "summary": object()}])  # cannot be stored
+        assert False, "expected a binding error"
+    except Exception:
+        pass
+    assert sorted(x["key"] for x in store.window(TODAY)) == ["A-1", "A-2"]  # the old window is kept
+    store.replace_active([issue("B-1", 0)])
+    assert [x["key"] for x in store.window(TODAY)] == ["B-1"]
+
+
+def test_store_is_cleared_for_another_account():
+    import tempfile
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "issues.sqlite3"
+        store = IssueStore(path, account="a|me")
+        store.upsert([issue("C-1", 0)])
+        store.close()
+        assert IssueStore(path, account="a|me").count() == 1
+        assert IssueStore(path, account="b|other").count() == 0
+
+
+if __name__ == "__main__":
+    test_first_sync_is_full_then_delta()
+    test_delta_drops_done_and_moved_out_issues()
+    test_delta_window_is_for_the_sync_day()
+    test_full_reconcile_after_interval()
+    test_window_order_matches_jql()
+    test_sync_times_persist_in_store()
+    test_store_buckets_and_query()
+    test_replace_active_is_one_transaction()
+    test_store_is_cleared_for_another_account()
+    print("OK")
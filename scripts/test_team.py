@@ -0,0 +1,117 @@
+# scripts/test_team.py
+"""
+Tests for team mode: `assignee in (...)` batches, per-assignee split, one pooled session.
+"""
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from bench import _client  # noqa: E402
+from fake_jira_server import FakeJira  # noqa: E402
+from jira_reminder.jira_client import make_session, partition_buckets  # noqa: E402
+from jira_reminder.models import Issue  # noqa: E402
+from jira_reminder.store import IssueStore  # noqa: E402
+from jira_reminder.team import fetch_team, team_members  # noqa: E402
+
+TEAM = tuple(f"dev{i}@example.com" for i in range(45))
+
+
+def test_assignee_clause():
+    client = _client("https://jira")
+    assert 'assignee = "a@x"' in client.jql_window("a@x")
+    assert 'assignee = "a@x"' in client.jql_window(["a@x"])
+    assert 'assignee in ("a@x", "b@x") AND' in client.jql_window(["a@x", "b@x"])
+    assert team_members(" A@x, b@x ,a@x,, ") == ["a@x", "b@x"]
+    assert team_members(["B@x", "b@x"]) == ["b@x"]
+
+
+def test_team_is_fetched_in_chunks_and_split_per_assignee():
+    with FakeJira(issues=180, assignees=TEAM) as jira:
+        client = _client(jira.url)
+        team = fetch_team(client, [t.upper() for t in TEAM] + ["nobody@example.com"], chunk_size=20)
+        assert len(jira.queries) == 3  # 46 people in chunks of 20, each answered in one page
+        assert all("assignee in (" in q for q in jira.queries)
+        assert list(team) == [*TEAM, "nobody@example.com"]
+        for person in TEAM:
+            assert all(it.assignee == person for bucket in team[person].values() for it in bucket)
+        assert team["nobody@example.com"] == {"overdue": [], "today": [], "tomorrow": []}
+
+        everyone = partition_buckets(it for page in client.iter_search("project = BENCH", 100) for it in page)
+        for name, issues in everyone.items():
+            assert sorted(it.key for p in TEAM for it in team[p][name]) == sorted(it.key for it in issues)
+
+
+def test_hidden_emails_are_filed_under_the_requested_email():
+    with FakeJira(issues=90, assignees=TEAM[:3], hide_emails=True) as jira:
+        client = _client(jira.url)
+        team = fetch_team(client, [*TEAM[:3], "nobody@example.com"], chunk_size=20)
+        assert len(jira.queries) == 1
+        assert jira.stats["requests"] == 1 + 4  # the window, then one user search per e-mail without issues
+        assert list(team) == [*TEAM[:3], "nobody@example.com"]
+        for i, person in enumerate(TEAM[:3]):
+            issues = [it for bucket in team[person].values() for it in bucket]
+            assert issues and all(it.assignee == f"acc-{i}" for it in issues)
+        assert team["nobody@example.com"] == {"overdue": [], "today": [], "tomorrow": []}
+
+        jira.hide_emails = False  # the same split as with the e-mails shown
+        visible = fetch_team(_client(jira.url), TEAM[:3])
+        for person in TEAM[:3]:
+            for name in ("overdue", "today", "tomorrow"):
+                assert [it.key for it in team[person][name]] == [it.key for it in visible[person][name]]
+
+
+def test_chunks_share_one_pooled_session():
+    session = make_session(pool_size=4)
+    adapter = session.get_adapter("http://127.0.0.1")
+    assert adapter._pool_maxsize == 4
+    with FakeJira(issues=100, assignees=TEAM, latency_ms=20) as jira:
+        client = _client(jira.url)
+        client.session = session
+        client.session.auth = (client.email, client.token)
+        seen = set()
+        original = session.post
+
+        def post(*args, **kwargs):
+            seen.add(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        session.post = post
+        fetch_team(client, TEAM, chunk_size=5, workers=4)
+        assert len(jira.queries) == 9
+        assert 1 < len(seen) <= 4  # chunks in parallel, never more than the pool holds
+
+
+def test_store_gains_the_assignee_column():
+    import sqlite3
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "issues.sqlite3"
+        db = sqlite3.connect(path)
+        db.execute(
+            "CREATE TABLE issues (key TEXT PRIMARY KEY, summary TEXT, duedate TEXT, startdate TEXT, issuetype TEXT,"
+            " project TEXT, priority TEXT, status TEXT, status_category TEXT, updated TEXT, seen_at TEXT NOT NULL)"
+        )
+        db.execute("INSERT INTO issues (key, seen_at) VALUES ('OLD-1', 'x')")
+        db.commit()
+        db.close()
+        store = IssueStore(path)
+        assert store.get("OLD-1").assignee is None
+        store.upsert([Issue(key="NEW-1", assignee="me@x")])
+        assert store.get("NEW-1").assignee == "me@x"
+        store.close()
+
+
+if __name__ == "__main__":
+    test_assignee_clause()
+    test_team_is_fetched_in_chunks_and_split_per_assignee()
+    test_hidden_emails_are_filed_under_the_requested_email()
+    test_chunks_share_one_pooled_session()
+    test_store_gains_the_assignee_column()
+    print("OK")
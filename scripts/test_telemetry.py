@@ -0,0 +1,75 @@
+# scripts/test_telemetry.py
+"""
+Tests for the metrics registry: counters, histograms, JSON dump and the Prometheus endpoint.
+"""
+import json
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from jira_reminder.telemetry import Telemetry  # noqa: E402
+
+
+def test_counters_and_histograms():
+    t = Telemetry()
+    t.inc("requests_total", endpoint="search/jql")
+    t.inc("requests_total", 2, endpoint="search/jql")
+    t.inc("requests_total", endpoint="count")
+    assert t.counter("requests_total", endpoint="search/jql") == 3
+
+    for ms in range(1, 101):
+        t.observe("latency_seconds", ms / 1000)
+    with t.span("latency_seconds"):
+        pass
+    hist = t.histogram("latency_seconds")
+    assert hist.count == 101 and 0.04 <= hist.quantile(0.5) <= 0.06
+    try:
+        with t.span("failing_seconds", step="x"):
+            raise KeyError("boom")
+    except KeyError:
+        pass
+    assert t.histogram("failing_seconds", step="x").count == 1
+
+
+def test_prometheus_text_and_json_dump():
+    t = Telemetry()
+    t.inc("bytes_total", 1500, endpoint='a"b')
+    t.observe("latency_seconds", 0.2, endpoint="count")
+    t.observe("latency_seconds", 3.0, endpoint="count")
+    text = t.to_prometheus()
+    assert "# TYPE bytes_total counter" in text
+    assert 'bytes_total{endpoint="a\\"b"} 1500' in text
+    assert 'latency_seconds_bucket{endpoint="count",le="0.25"} 1' in text
+    assert 'latency_seconds_bucket{endpoint="count",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{endpoint="count"} 2' in text
+
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "m" / "metrics.json"
+        t.dump(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+    (hist,) = data["histograms"]
+    assert hist["labels"] == {"endpoint": "count"} and hist["count"] == 2 and hist["p99"] == 3.0
+
+
+def test_endpoint_serves_metrics():
+    t = Telemetry()
+    t.inc("polls_total")
+    server = t.serve(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as r:
+            body = r.read().decode("utf-8")
+        assert r.status == 200 and "polls_total 1" in body
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    test_counters_and_histograms()
+    test_prometheus_text_and_json_dump()
+    test_endpoint_serves_metrics()
+    print("OK")
@@ -0,0 +1,172 @@
+"""
+Tests for the issue blocks: list model and card delegate (offscreen Qt, no network).
+"""
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from jira_reminder import metrics  # noqa: E402
+from jira_reminder.render_cache import RenderCache  # noqa: E402
+from jira_reminder.ui import IssuesCardList, IssueListModel, MainWindow, ISSUE_ROLE, URL_ROLE  # noqa: E402
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+
+def url(key):
+    return f"https://jira/browse/{key}"
+
+
+def issue(key, summary=None, status="To Do"):
+    return {"key": key, "summary": summary or key, "duedate": "2025-01-01", "status": status}
+
+
+def keys(model):
+    return [model.index(r).data(QtCore.Qt.ItemDataRole.DisplayRole) for r in range(model.rowCount())]
+
+
+class Spy:
+    def __init__(self, model):
+        self.events = []
+        model.modelReset.connect(lambda: self.events.append("reset"))
+        model.rowsInserted.connect(lambda _p, a, b: self.events.append(("insert", a, b)))
+        model.rowsRemoved.connect(lambda _p, a, b: self.events.append(("remove", a, b)))
+        model.dataChanged.connect(lambda a, b, _r=None: self.events.append(("changed", a.row(), b.row())))
+        model.layoutChanged.connect(lambda *_: self.events.append("layout"))
+
+
+def test_model_diff_keeps_unchanged_rows():
+    model = IssueListModel()
+    model.set_issues([issue("A-1"), issue("A-2"), issue("A-3")], url)
+    spy = Spy(model)
+
+    model.set_issues([issue("A-1"), issue("A-2", "renamed"), issue("A-3"), issue("A-4")])
+    assert spy.events == [("insert", 3, 3), ("changed", 1, 1)]
+    assert model.index(1).data(ISSUE_ROLE).summary == "renamed"
+    assert model.index(3).data(URL_ROLE) == url("A-4")
+
+    spy.events.clear()
+    model.set_issues([issue("A-1"), issue("A-2", "renamed")])
+    assert spy.events == [("remove", 2, 3)]
+
+    spy.events.clear()
+    current = QtCore.QPersistentModelIndex(model.index(0))
+    model.set_issues([issue("A-2"), issue("A-1")])
+    assert spy.events == ["layout"] and keys(model) == ["A-2", "A-1"]
+    assert current.row() == 1  # the row follows its issue instead of being torn down
+
+    spy.events.clear()
+    model.set_issues([issue("A-3"), issue("A-2"), issue("A-1")])
+    assert spy.events == ["reset"] and keys(model) == ["A-3", "A-2", "A-1"]
+
+
+def test_model_exposes_rows_in_batches_and_asks_for_more():
+    model = IssueListModel(batch=10)
+    model.set_issues([issue(f"A-{i}") for i in range(25)], url)
+    assert model.rowCount() == 10 and model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 25 and not model.canFetchMore()
+
+    asked = []
+    model.moreRequested.connect(lambda: asked.append(True))
+    model.total = 40
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert asked == [True] and not model.canFetchMore()  # one request at a time
+
+    model.set_issues([issue(f"A-{i}") for i in range(40)])
+    assert model.rowCount() == 25 and model.canFetchMore()
+
+
+def test_block_shows_whole_bucket_and_opens_clicked_issue():
+    block = IssuesCardList("Today")
+    block.set_issues([issue(f"A-{i}") for i in range(1000)], "https://jira/issues", url)
+    block.resize(block.size())
+    block.show()
+    app.processEvents()
+    view = block.view
+    while block.model.canFetchMore():
+        view.scrollToBottom()
+        app.processEvents()
+    assert block.model.rowCount() == 1000
+
+    opened = []
+    block.openLink.connect(opened.append)
+    view.clicked.emit(block.model.index(999))
+    assert opened == [url("A-999")]
+
+    img = QtGui.QImage(view.viewport().size(), QtGui.QImage.Format.Format_ARGB32)
+    view.viewport().render(img)
+    block.hide()
+
+
+def test_render_cache_reuses_pixmaps_per_scale():
+    cache = RenderCache()
+    img = QtGui.QImage(400, 300, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    p = QtGui.QPainter(img)
+    font = QtGui.QFont()
+    try:
+        pill = cache.pill(p, font, "Status: Done", ("#103528", "#06d6a0"))
+        assert cache.pill(p, font, "Status: Done", ("#103528", "#06d6a0")) is pill
+        cache.draw_shadow(p, QtCore.QRectF(40, 40, 300, 150))
+        shadow = cache._shadow
+        cache.draw_shadow(p, QtCore.QRectF(40, 40, 200, 100))
+        assert cache._shadow is shadow
+        assert img.pixelColor(190, 210).alpha() > 0  # shadow below the card
+
+        old = metrics.UI_SCALE
+        metrics.set_ui_scale(2.0)
+        try:
+            bigger = cache.pill(p, font, "Status: Done", ("#103528", "#06d6a0"))
+            assert bigger is not pill and bigger.height() > pill.height()
+            assert cache._shadow is None
+        finally:
+            metrics.set_ui_scale(old)
+    finally:
+        p.end()
+
+
+def test_scale_change_only_touches_subscribed_components():
+    class Listener:
+        calls = 0
+
+        def apply_scale(self):
+            Listener.calls += 1
+
+    win = MainWindow(QtGui.QIcon())
+    listener = Listener()
+    metrics.subscribe_scale(listener)
+    old = metrics.UI_SCALE
+    try:
+        width = win.width()
+        metrics.set_ui_scale(old * 2)
+        assert Listener.calls == 1
+        assert win.overdue.width() == metrics.BLOCK_WIDTH_PX() and win.width() > width * 1.5
+
+        metrics.set_ui_scale(old * 2)  # no change, no work
+        assert Listener.calls == 1
+
+        del listener
+        metrics.set_ui_scale(old)
+        assert Listener.calls == 1  # dropped once garbage collected
+        assert win.width() == width
+    finally:
+        metrics.set_ui_scale(old)
+
+
+if __name__ == "__main__":
+    test_model_diff_keeps_unchanged_rows()
+    test_model_exposes_rows_in_batches_and_asks_for_more()
+    test_block_shows_whole_bucket_and_opens_clicked_issue()
+    test_render_cache_reuses_pixmaps_per_scale()
+    test_scale_change_only_touches_subscribed_components()
+    print("OK")
@@ -1,4 +1,15 @@
 # src/jira_reminder/__init__.py
 from .metrics import APP_NAME, __version__
-from .jira_client import JiraClient
-from .controller import JiraReminderController
+
+# the client pulls in requests, the controller all of the UI: load them on first use only
+_LAZY = {"JiraClient": ".jira_client", "JiraReminderController": ".controller"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
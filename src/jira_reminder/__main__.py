@@ -0,0 +1,6 @@
+# src/jira_reminder/__main__.py
+import sys
+
+from .cli import main
+
+sys.exit(main())
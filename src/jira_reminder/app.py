@@ -1,23 +1,55 @@
 # src/jira_reminder/app.py
 from __future__ import annotations
 
+import argparse
 import sys
 import subprocess, os, shutil
 
+from .startup import STARTUP  # first, so the profile clock also covers the Qt import
 from PyQt6 import QtWidgets, QtCore
 
 from .metrics import APP_NAME, __version__, set_ui_scale
-from .paths import CONFIG_ENC_PATH, LOCK_PATH, CONFIG_PLAIN_PATH
+from . import ipc, paths
+from .paths import CONFIG_ENC_PATH, LOCK_PATH
 
+from .config import CONFIG
 from .logging_setup import setup_logging, log
-from .security import load_config
-from .ui import ConfigDialog
-from .controller import JiraReminderController
-
 
+# ui/controller (all of the widgets, requests) and security (cryptography) are imported in main()
+# only once this is known to be the only instance
+
+
+def parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """Our options; anything unknown is left for Qt (``-platform``, ``-style``...)."""
+    parser = argparse.ArgumentParser(
+        prog="jira-reminder",
+        description=f"{APP_NAME} v{__version__}",
+        epilog="Headless: jira-reminder report --help (no tray, for scripts and cron).",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="log how long each startup phase took (turns the log on)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve timings and counters in Prometheus text format on http://127.0.0.1:PORT/metrics",
+    )
+    parser.add_argument("--metrics-file", metavar="PATH", help="write timings and counters as JSON on quit")
+    cmd = parser.add_mutually_exclusive_group()
+    for command, text in (
+        ("show", "open the main window"),
+        ("refresh", "refresh from Jira"),
+        ("today", "show today's issues"),
+    ):
+        cmd.add_argument(f"--{command}", dest="command", action="store_const", const=command, help=text)
+    return parser.parse_known_args(argv)
 
 
 def ensure_single_instance_or_exit(parent=None):
+    paths.ensure_parent(LOCK_PATH)
     lock = QtCore.QLockFile(LOCK_PATH)
     lock.setStaleLockTime(60 * 60 * 1000)  # 1 hour
 
@@ -33,25 +65,60 @@ def ensure_single_instance_or_exit(parent=None):
     sys.exit(0)
 
 
+def _start_metrics_export(app: QtWidgets.QApplication, args: argparse.Namespace, cfg: dict) -> None:
+    """Metrics endpoint and/or JSON dump, from the command line or the ``metrics_port``/``metrics_file`` settings."""
+    from .telemetry import TELEMETRY
+
+    port = args.metrics_port if args.metrics_port is not None else int(cfg.get("metrics_port") or 0)
+    if port:
+        try:
+            endpoint = TELEMETRY.serve(port)
+            app.aboutToQuit.connect(endpoint.close)
+        except OSError as e:
+            log.warning("Cannot serve metrics on port %d: %s", port, e)
+    dump_path = args.metrics_file or cfg.get("metrics_file")
+    if dump_path:
+        app.aboutToQuit.connect(lambda: TELEMETRY.dump(os.path.expanduser(dump_path)))
+
+
 def main(argv: list[str] | None = None) -> int:
-    # Load plain settings (non-secure) if available to set UI scale and logging defaults
-    import json
-    ui_scale = 1.25
-    plain_settings = {}
+    args, qt_args = parse_args(sys.argv[1:] if argv is None else argv)
+    STARTUP.enabled = args.startup_profile
+    STARTUP.mark("imports")
+
+    # already running: hand the command over (a bare launch just brings the window up) and quit
+    if ipc.send_command(args.command or "show"):
+        return 0
+
+    # plain settings (non-secure) set UI scale and logging defaults; config.enc is not touched yet
+    plain = CONFIG.plain
     try:
-        if CONFIG_PLAIN_PATH.exists():
-            plain_settings = json.loads(CONFIG_PLAIN_PATH.read_text(encoding="utf-8"))
-            ui_scale = float(plain_settings.get("ui_scale", ui_scale))
-    except Exception:
-        plain_settings = {}
+        set_ui_scale(float(plain.get("ui_scale", 1.25)))
+    except (TypeError, ValueError):
+        set_ui_scale(1.25)
+
+    QtCore.QCoreApplication.setApplicationName(APP_NAME)
+    app = QtWidgets.QApplication([sys.argv[0], *qt_args])
+    STARTUP.mark("QApplication")
 
-    set_ui_scale(ui_scale)
+    # an instance that did not answer above (still starting, or an older version) is caught here,
+    # before decrypting anything or opening the log
+    lock = ensure_single_instance_or_exit()
+    server = ipc.CommandServer(app)
+    server.listen()
+    STARTUP.mark("lock")
+    setup_logging(bool(plain.get("logging")) or args.startup_profile, bool(plain.get("new_log")))
+    if args.startup_profile:
+        # the log was opened for the profile: back to the configured level once it is written
+        STARTUP.on_finish = lambda: setup_logging(bool(CONFIG.plain.get("logging")), False)
+    log.debug("App start %s v%s", APP_NAME, __version__)
+    log.debug("Single instance lock acquired: %s", lock.fileName())
 
     # Ensure secure config exists: show config dialog if encrypted config missing
-    QtCore.QCoreApplication.setApplicationName(APP_NAME)
-    app = QtWidgets.QApplication(sys.argv)
     if not CONFIG_ENC_PATH.exists():
-        dlg = ConfigDialog()
+        from .ui import ConfigDialog
+
+        dlg = ConfigDialog(store=CONFIG)
         dlg.exec()
         # after dialog, require encrypted config to exist; otherwise abort
         if not CONFIG_ENC_PATH.exists():
@@ -59,16 +126,12 @@ def main(argv: list[str] | None = None) -> int:
             return 1
 
     # load secure config (required for normal run)
-    try:
-        cfg = load_config()
-    except Exception as e:
-        QtWidgets.QMessageBox.critical(None, APP_NAME, f"Cannot load encrypted config: {e}")
+    # plain settings (poll interval etc.) overlaid by the secure config
+    cfg = CONFIG.combined()
+    if not CONFIG.has_secure():
+        QtWidgets.QMessageBox.critical(None, APP_NAME, f"Cannot load encrypted config: {CONFIG.secure_error}")
         return 1
-
-    lock = ensure_single_instance_or_exit()
-    setup_logging(bool(plain_settings.get("logging", False)), bool(plain_settings.get("new_log", False)))
-    log.debug("App start %s v%s", APP_NAME, __version__)
-    log.debug("Single instance lock acquired: %s", lock.fileName())
+    STARTUP.mark("config decrypt")
 
     font = app.font()
     ps = font.pointSizeF()
@@ -82,5 +145,16 @@ def main(argv: list[str] | None = None) -> int:
     app.setQuitOnLastWindowClosed(False)
     log.debug("QApplication initialized with UI scale %.2fx", UI_SCALE)
 
-    ctrl = JiraReminderController(app, cfg)
+    from .controller import JiraReminderController
+
+    STARTUP.mark("UI imports")
+    ctrl = JiraReminderController(app, cfg, CONFIG)
+    STARTUP.mark("controller")
+    server.commandReceived.connect(ctrl.handle_command)
+    _start_metrics_export(app, args, cfg)
+    if args.command:
+        QtCore.QTimer.singleShot(0, lambda: ctrl.handle_command(args.command))
+    # runs once the event loop has shown the tray icon and painted the restored snapshot;
+    # "first data" is marked by the controller when the first page of the startup sync arrives
+    QtCore.QTimer.singleShot(0, lambda: STARTUP.mark("first paint"))
     return app.exec()
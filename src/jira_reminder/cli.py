@@ -0,0 +1,333 @@
+# src/jira_reminder/cli.py
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from .config import CONFIG
+from .logging_setup import log
+from .metrics import APP_NAME, __version__
+from .models import Issue
+
+# the `jira-reminder` entry point: these subcommands run headless (no PyQt6, no tray, no lock);
+# anything else starts the desktop app
+HEADLESS_COMMANDS = ("report",)
+FORMATS = ("table", "json", "ics")
+BUCKET_TITLES = {"overdue": "Overdue", "today": "Today", "tomorrow": "Tomorrow"}
+
+EXIT_CONFIG = 1  # config.enc missing or unreadable
+EXIT_USAGE = 2  # as argparse
+EXIT_JIRA = 3  # Jira failed
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="jira-reminder",
+        description=f"{APP_NAME} v{__version__} headless commands",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    report = commands.add_parser(
+        "report",
+        help="print the overdue/today/tomorrow issues and exit",
+        description="Query Jira with the app's config and print the three blocks of the main window.",
+    )
+    report.add_argument("--format", "-f", choices=FORMATS, default="table")
+    report.add_argument(
+        "--bucket",
+        "-b",
+        action="append",
+        choices=tuple(BUCKET_TITLES),
+        help="only this block (repeatable; default: all three)",
+    )
+    report.add_argument(
+        "--assignee",
+        "-a",
+        action="append",
+        metavar="EMAIL",
+        help="report for someone else than the configured user (repeatable: team report)",
+    )
+    report.add_argument(
+        "--team",
+        action="store_true",
+        help="report for everyone in the team_assignees setting, batched into few queries",
+    )
+    report.add_argument(
+        "--offline",
+        action="store_true",
+        help="use the last result the desktop app saved instead of asking Jira",
+    )
+    report.add_argument("--output", "-o", metavar="PATH", help="write to a file instead of stdout")
+    report.add_argument("--verbose", "-v", action="store_true", help="debug log on stderr")
+    return parser.parse_args(argv)
+
+
+# --- data ---
+
+
+def fetch_buckets(client, assignee: str, today: date | None = None) -> Dict[str, List[Issue]]:
+    """The window query of the desktop app, paged in full and split into its three blocks."""
+    from .jira_client import MAX_PAGE_SIZE, partition_buckets
+    from .sync import WINDOW_LIMIT
+
+    jql = client.jql_window(assignee)
+    log.debug("Report JQL: %s", jql)
+    issues = [it for page in client.iter_search(jql, page_size=MAX_PAGE_SIZE, limit=WINDOW_LIMIT) for it in page]
+    return partition_buckets(issues, today)
+
+
+def snapshot_buckets(cfg: dict, assignee: str, today: date | None = None) -> Dict[str, List[Issue]] | None:
+    """The blocks from the desktop app's last snapshot, or None without one."""
+    from .jira_client import partition_buckets
+    from .snapshot import load_snapshot
+
+    loaded = load_snapshot(f'{cfg["jira_base_url"].rstrip("/")}|{assignee}')
+    if loaded is None:
+        return None
+    fetched_at, issues = loaded
+    log.debug("Report from the snapshot taken %s", fetched_at)
+    return partition_buckets(issues, today)
+
+
+# --- output formats ---
+
+
+def format_json(buckets: Dict[str, List[Issue]], base_url: str, assignee: str, today: date) -> str:
+    base = base_url.rstrip("/")
+    return json.dumps(
+        {
+            "assignee": assignee,
+            "date": today.isoformat(),
+            "buckets": {
+                name: [{**it.to_dict(), "url": f"{base}/browse/{it.key}"} for it in issues]
+                for name, issues in buckets.items()
+            },
+        },
+        indent=2,
+        ensure_ascii=False,
+    ) + "\n"
+
+
+def format_team_json(team: Dict[str, Dict[str, List[Issue]]], base_url: str, today: date) -> str:
+    base = base_url.rstrip("/")
+    return json.dumps(
+        {
+            "date": today.isoformat(),
+            "assignees": {
+                person: {
+                    name: [{**it.to_dict(), "url": f"{base}/browse/{it.key}"} for it in issues]
+                    for name, issues in buckets.items()
+                }
+                for person, buckets in team.items()
+            },
+        },
+        indent=2,
+        ensure_ascii=False,
+    ) + "\n"
+
+
+def format_table(buckets: Dict[str, List[Issue]], width: int | None = None) -> str:
+    """One section per block; summaries are cut to ``width`` columns when given (a terminal)."""
+    header = ("KEY", "STATUS", "PRIORITY", "DUE", "SUMMARY")
+    lines: list[str] = []
+    for name, issues in buckets.items():
+        if lines:
+            lines.append("")
+        lines.append(f"{BUCKET_TITLES[name]} ({len(issues)})")
+        if not issues:
+            continue
+        rows = [(it.key, it.status or "", it.priority or "", it.duedate or "", it.summary or "") for it in issues]
+        widths = [max(len(r[i]) for r in (header, *rows)) for i in range(4)]
+        for row in (header, *rows):
+            line = "  ".join(cell.ljust(w) for cell, w in zip(row, widths)) + "  " + row[4]
+            if width and len(line) > width:
+                line = line[: max(width - 1, 0)] + "…"
+            lines.append(line.rstrip())
+    return "\n".join(lines) + "\n"
+
+
+def _ics_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """RFC 5545 line folding: at most 75 octets per line, continuation lines start with a space."""
+    out, chunk, size = [], "", 0
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > 75:
+            out.append(chunk)
+            chunk, size = " ", 1
+        chunk += ch
+        size += n
+    out.append(chunk)
+    return "\r\n".join(out)
+
+
+def format_ics(buckets: Dict[str, List[Issue]], base_url: str, now: datetime | None = None) -> str:
+    """An all-day event per issue on its due date (start date without one); subscribe or import."""
+    base = base_url.rstrip("/")
+    host = urlparse(base).hostname or "jira"
+    stamp = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{APP_NAME}//{__version__}//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_text(APP_NAME)}",
+    ]
+    seen: set = set()
+    for name, issues in buckets.items():
+        for it in issues:
+            day = it.due or it.start
+            if it.key in seen or day is None:
+                continue
+            seen.add(it.key)
+            title = f"{it.key}: {it.summary or ''}"
+            details = "\n".join(
+                f"{label}: {value}"
+                for label, value in (("Status", it.status), ("Priority", it.priority), ("Assignee", it.assignee))
+                if value
+            )
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{it.key}@{host}",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+                f"SUMMARY:{_ics_text(title)}",
+                f"DESCRIPTION:{_ics_text(details)}",
+                f"URL:{base}/browse/{it.key}",
+                f"CATEGORIES:{BUCKET_TITLES[name]}",
+                "TRANSP:TRANSPARENT",
+                "END:VEVENT",
+            ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(map(_ics_fold, lines)) + "\r\n"
+
+
+def _write(text: str, output: str | None) -> None:
+    data = text.encode("utf-8")  # bytes, so the CRLFs of iCalendar survive on Windows
+    if output:
+        Path(output).expanduser().write_bytes(data)
+        return
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(text)
+    else:
+        out.write(data)
+        out.flush()
+
+
+# --- commands ---
+
+
+def report(args: argparse.Namespace) -> int:
+    cfg = CONFIG.combined()
+    if not CONFIG.has_secure():
+        print(f"{APP_NAME}: cannot load the encrypted config ({CONFIG.secure_error}).", file=sys.stderr)
+        print("Start the desktop app once to set it up.", file=sys.stderr)
+        return EXIT_CONFIG
+    today = date.today()
+    if args.team or (args.assignee and len(args.assignee) > 1):
+        return team_report(args, cfg, today)
+    assignee = args.assignee[0] if args.assignee else cfg["assignee_email"]
+
+    if args.offline:
+        buckets = snapshot_buckets(cfg, assignee, today)
+        if buckets is None:
+            print(f"{APP_NAME}: no saved result for {assignee} yet.", file=sys.stderr)
+            return EXIT_JIRA
+    else:
+        import requests
+
+        from .jira_client import JiraClient, client_options
+        from .resilience import JiraUnavailableError
+
+        client = JiraClient(**client_options(cfg))
+        try:
+            buckets = fetch_buckets(client, assignee, today)
+        except (requests.RequestException, JiraUnavailableError) as e:
+            print(f"{APP_NAME}: Jira request failed: {e}", file=sys.stderr)
+            return EXIT_JIRA
+        finally:
+            client.session.close()
+
+    if args.bucket:
+        buckets = {name: issues for name, issues in buckets.items() if name in args.bucket}
+    if args.format == "json":
+        text = format_json(buckets, cfg["jira_base_url"], assignee, today)
+    elif args.format == "ics":
+        text = format_ics(buckets, cfg["jira_base_url"])
+    else:
+        tty = not args.output and sys.stdout.isatty()
+        text = format_table(buckets, shutil.get_terminal_size().columns if tty else None)
+    _write(text, args.output)
+    return 0
+
+
+def team_report(args: argparse.Namespace, cfg: dict, today: date) -> int:
+    from .team import fetch_team, team_members
+
+    people = team_members(args.assignee or []) or team_members(cfg.get("team_assignees"))
+    if not people:
+        print(f"{APP_NAME}: no team_assignees in the config; list them or pass --assignee.", file=sys.stderr)
+        return EXIT_CONFIG
+    if args.offline:
+        print(f"{APP_NAME}: --offline has the desktop app's own issues only, not a team.", file=sys.stderr)
+        return EXIT_USAGE
+
+    import requests
+
+    from .jira_client import JiraClient, client_options
+    from .resilience import JiraUnavailableError
+    from .team import TEAM_CHUNK
+
+    chunk = int(cfg.get("team_chunk_size") or TEAM_CHUNK)
+    client = JiraClient(**client_options(cfg))  # one pooled session for all chunks
+    try:
+        team = fetch_team(client, people, chunk_size=chunk, today=today)
+    except (requests.RequestException, JiraUnavailableError) as e:
+        print(f"{APP_NAME}: Jira request failed: {e}", file=sys.stderr)
+        return EXIT_JIRA
+    finally:
+        client.session.close()
+
+    if args.bucket:
+        team = {p: {n: v for n, v in buckets.items() if n in args.bucket} for p, buckets in team.items()}
+    if args.format == "json":
+        text = format_team_json(team, cfg["jira_base_url"], today)
+    elif args.format == "ics":
+        merged: Dict[str, List[Issue]] = {}
+        for buckets in team.values():
+            for name, issues in buckets.items():
+                merged.setdefault(name, []).extend(issues)
+        text = format_ics(merged, cfg["jira_base_url"])
+    else:
+        tty = not args.output and sys.stdout.isatty()
+        width = shutil.get_terminal_size().columns if tty else None
+        text = "\n".join(f"== {person} ==\n{format_table(buckets, width)}" for person, buckets in team.items())
+    _write(text, args.output)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in HEADLESS_COMMANDS:
+        from .app import main as gui_main
+
+        return gui_main(argv)
+
+    args = parse_args(argv)
+    if args.verbose:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.DEBUG)
+    return report(args)
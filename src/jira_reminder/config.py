@@ -0,0 +1,209 @@
+# src/jira_reminder/config.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from . import paths
+from .logging_setup import log
+
+# defaults for the encrypted part, applied when a key is missing
+SECURE_DEFAULTS = {
+    "project_keys": [],
+    "issue_types": ["Sub-task - HW"],
+    "start_date_field": "customfield_10015",
+    "done_jql": None,
+}
+# keys that change how Jira is queried (a new JiraClient is needed)
+JIRA_KEYS = frozenset(
+    {"jira_base_url", "assignee_email", "api_token", "project_keys", "issue_types", "start_date_field", "done_jql"}
+)
+LOGGING_KEYS = frozenset({"logging", "new_log"})
+
+Listener = Callable[[set], None]
+
+
+def _stamp(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+class ConfigStore:
+    """
+    Plain (``config.json``) and secure (``config.enc``) settings, read once and served from memory.
+
+    ``reload()`` re-reads only a file whose mtime/size changed since it was last read, and tells the
+    subscribers which keys changed. Saving through the store updates memory and notifies as well,
+    so nothing has to re-read or re-decrypt the files. The two parts load independently: reading
+``plain`` never pays for the key derivation of ``config.enc``. Qt-free; ``workers.ConfigWatcher`` calls
+    ``reload()`` when the files change on disk. File locations are looked up in ``paths`` on every
+    reload, so tests can point them elsewhere.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._plain: dict = {}
+        self._secure: dict = {}
+        self._plain_stamp: tuple | None = None
+        self._secure_stamp: tuple | None = None
+        self._plain_loaded = False
+        self._secure_loaded = False
+        self.secure_error: Exception | None = None
+        self._listeners: list[Listener] = []
+
+    # --- reading ---
+
+    def _read_plain(self) -> dict | None:
+        """``config.json`` ({} without one), or None when it cannot be read or parsed."""
+        path = paths.CONFIG_PLAIN_PATH
+        try:
+            data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            if not isinstance(data, dict):
+                raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+            return data
+        except Exception as e:
+            log.warning("Cannot read %s, keeping the last good settings: %s", path, e)
+            return None
+
+    def _read_secure(self) -> dict:
+        from .security import decrypt_config
+
+        path = paths.CONFIG_ENC_PATH
+        self.secure_error = None
+        try:
+            if not path.exists():
+                raise FileNotFoundError(str(path))
+            return decrypt_config(path.read_bytes())
+        except Exception as e:
+            self.secure_error = e
+            if not isinstance(e, FileNotFoundError):
+                log.error("Cannot decrypt %s: %s", path, e)
+            return {}
+
+    def reload(self, force: bool = False, secure: bool = True) -> set:
+        """
+        Re-read changed files; returns the changed keys (subscribers are notified of them).
+        The first read of a part is not a change. ``secure=False`` leaves ``config.enc`` alone.
+        """
+        with self._lock:
+            changed: set = set()
+            plain_stamp = _stamp(paths.CONFIG_PLAIN_PATH)
+            if force or not self._plain_loaded or plain_stamp != self._plain_stamp:
+                new = self._read_plain()
+                if new is None:
+                    new = self._plain  # a half-saved or mistyped file is not an empty one
+                if self._plain_loaded:
+                    changed |= _diff(self._plain, new)
+                self._plain, self._plain_stamp, self._plain_loaded = new, plain_stamp, True
+            if secure:
+                secure_stamp = _stamp(paths.CONFIG_ENC_PATH)
+                if force or not self._secure_loaded or secure_stamp != self._secure_stamp:
+                    new = self._read_secure()
+                    if self._secure_loaded:
+                        changed |= _diff(self._secure, new)
+                    self._secure, self._secure_stamp, self._secure_loaded = new, secure_stamp, True
+        if changed:
+            log.debug("Config changed on disk: %s", ", ".join(sorted(changed)))
+            self._notify(changed)
+        return changed
+
+    def _ensure_loaded(self, secure: bool = True) -> None:
+        if not self._plain_loaded or (secure and not self._secure_loaded):
+            self.reload(secure=secure)
+
+    @property
+    def plain(self) -> dict:
+        self._ensure_loaded(secure=False)
+        with self._lock:
+            return dict(self._plain)
+
+    @property
+    def secure(self) -> dict:
+        self._ensure_loaded()
+        with self._lock:
+            return {**SECURE_DEFAULTS, **self._secure} if self._secure else {}
+
+    def has_secure(self) -> bool:
+        self._ensure_loaded()
+        return bool(self._secure)
+
+    def combined(self) -> dict:
+        """Plain settings overlaid by the secure ones (secure keys win), with defaults filled in."""
+        return {**self.plain, **self.secure}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.combined().get(key, default)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        return bool(self.get(key, default))
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        try:
+            return int(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        try:
+            return float(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    # --- writing ---
+
+    def save_plain(self, values: dict) -> None:
+        path = paths.ensure_parent(paths.CONFIG_PLAIN_PATH)
+        path.write_text(json.dumps(values, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._stored(values, secure=False)
+
+    def save_secure(self, values: dict) -> None:
+        from .security import encrypt_config
+
+        path = paths.ensure_parent(paths.CONFIG_ENC_PATH)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(encrypt_config(values))
+        os.replace(tmp, path)
+        self._stored(values, secure=True)
+
+    def _stored(self, values: dict, secure: bool) -> None:
+        self._ensure_loaded(secure=secure)
+        with self._lock:
+            if secure:
+                changed = _diff(self._secure, values)
+                self._secure, self._secure_stamp = dict(values), _stamp(paths.CONFIG_ENC_PATH)
+                self.secure_error = None
+            else:
+                changed = _diff(self._plain, values)
+                self._plain, self._plain_stamp = dict(values), _stamp(paths.CONFIG_PLAIN_PATH)
+        if changed:
+            self._notify(changed)
+
+    # --- subscribers ---
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call ``listener(changed_keys)`` after every change, whether saved here or edited on disk."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, changed: set) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(set(changed))
+            except Exception:
+                log.exception("Config listener failed")
+
+
+def _diff(old: dict, new: dict) -> set:
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+CONFIG = ConfigStore()  # the application's config; loaded on first use
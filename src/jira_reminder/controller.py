@@ -1,27 +1,44 @@
 # src/jira_reminder/controller.py
 from __future__ import annotations
 
-from datetime import datetime, time as dtime
+from datetime import date, datetime, timedelta
 
-import requests, sys, os
+import requests, sys, os, time
 from PyQt6 import QtWidgets, QtGui, QtCore
 
 from .metrics import APP_NAME
 from .logging_setup import log
 from .paths import asset_path
-from .jira_client import JiraClient
+from .jira_client import JiraClient, MAX_PAGE_SIZE, client_options, make_session, partition_buckets
+from .models import Issue
+from .resilience import CircuitBreaker, JiraUnavailableError
 from .ui import MainWindow, TodayPopup, ConfigDialog
+from .workers import FetchEngine, EventScheduler, ConfigWatcher
+from .config import ConfigStore, JIRA_KEYS, LOGGING_KEYS
+from .scheduler import Schedule, SCHEDULE_KEYS, dispatch_event
+from .snapshot import load_snapshot, save_snapshot
+from .reminders import Notification, ReminderRules
+from .sync import IssueSync
+from .store import IssueStore
+from .startup import STARTUP
+from .telemetry import TELEMETRY
+from . import paths
 from .logging_setup import setup_logging
 
 
 class JiraReminderController(QtCore.QObject):
-    def __init__(self, app: QtWidgets.QApplication, cfg: dict):
+    # circuit breaker state; emitted from worker threads, delivered on the GUI thread
+    jiraStateChanged = QtCore.pyqtSignal(str)
+
+    def __init__(self, app: QtWidgets.QApplication, cfg: dict, config: ConfigStore | None = None):
         super().__init__()
         self.app = app
         self.icon = self._load_icon()
 
         self.window = MainWindow(self.icon)
         self.window.refresh_btn.clicked.connect(self.refresh_all)
+        for name, block in self._blocks().items():
+            block.model.moreRequested.connect(lambda name=name: self._load_more(name))
 
         self.tray = QtWidgets.QSystemTrayIcon(self.icon)
         self.tray.setToolTip(APP_NAME)
@@ -48,23 +65,58 @@ class JiraReminderController(QtCore.QObject):
         self._click_timer.timeout.connect(self.show_today_popup)
 
         self.cfg = cfg
-        self.client = JiraClient(
-            base_url=cfg["jira_base_url"],
-            email=cfg["assignee_email"],
-            api_token=cfg["api_token"],
-            projects=cfg.get("project_keys", []),
-            issue_types=cfg.get("issue_types", ["Sub-task - HW"]),
-            start_date_field=cfg.get("start_date_field", "customfield_10015"),
-            done_jql_override=cfg.get("done_jql"),
+        self.breaker = CircuitBreaker(on_change=self.jiraStateChanged.emit)
+        self.session = make_session()  # survives client rebuilds on config changes, with its warm connections
+        self.client = self._make_client(cfg)
+        self.jiraStateChanged.connect(self._on_jira_state)
+        self._jira_down_announced = False
+
+        self._account = self._account_of(cfg)
+        self.store = IssueStore(paths.STORE_PATH, account=self._account)
+        self.sync = IssueSync(
+            self.client,
+            cfg["assignee_email"],
+            full_every=self._full_every(cfg),
+            store=self.store,
         )
 
-        self.today_issues: list[dict] = []
-        self._last_close_check: datetime | None = None
+        self.today_issues: list[Issue] = []
+        self._refresh_gen = 0
+        self._counted: dict[str, int] = {}  # per-block totals from Jira while the window is truncated
+        # pages of a truncated window loaded by scrolling past it: the next page token and the issues
+        self._more: dict | None = None
+        # blocking Jira calls run here so the tray and windows stay responsive
+        self.fetcher = FetchEngine(self)
+        self.app.aboutToQuit.connect(self.fetcher.shutdown)
+
+        self._data_fetched_at: datetime | None = None
+        self._rendered_on: date | None = None
 
         self._setup_timers()
+
+        # live reconfiguration when settings are saved or the files are edited
+        self.config = config
+        # the last readable secure settings: the app keeps running on them if config.enc breaks
+        self._secure_cfg = config.secure if config is not None else {}
+        if config is not None:
+            config.subscribe(self._on_config_changed)
+            self.config_watcher = ConfigWatcher(config, self)
+
+        # paint the last known data right away, then refresh in the background
+        self._restore_snapshot()
         self.refresh_all(initial=True)
-        self.__undone_check_period = 30 * 60  # 30 minutes
-        log.debug(f'The JireReminderController is initialized at {datetime.now().strftime("%d-%m-%Y %H:%M:%S")}')
+        log.debug("The JireReminderController is initialized at %s", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+
+    def _make_client(self, cfg: dict) -> JiraClient:
+        return JiraClient(**client_options(cfg), breaker=self.breaker, session=self.session)
+
+    @staticmethod
+    def _full_every(cfg: dict) -> timedelta:
+        return timedelta(minutes=int(cfg.get("full_sync_minutes", 60)))
+
+    @staticmethod
+    def _account_of(cfg: dict) -> str:
+        return f'{cfg["jira_base_url"].rstrip("/")}|{cfg["assignee_email"]}'
 
     def _load_icon(self) -> QtGui.QIcon:
         if sys.platform.startswith("win"):
@@ -91,121 +143,313 @@ class JiraReminderController(QtCore.QObject):
         return QtGui.QIcon(pm)
 
     def _setup_timers(self):
-        # Define a timer that ticks each minute
-        self.tick = QtCore.QTimer(self)
-        self.tick.setInterval(60_000)
-        self.tick.timeout.connect(self._on_tick)
-        self.tick.start()
-
-        # Define a timer that ticks each 1 hour
-        self.refresh_tick = QtCore.QTimer(self)
-        self.refresh_tick.setInterval(1 * 60 * 60 * 1000)
-        self.refresh_tick.timeout.connect(self.refresh_all)
-        self.refresh_tick.start()
+        # one single-shot timer armed for the next due event (digest, evening check, sync, midnight)
+        self.scheduler = EventScheduler(Schedule.from_config(self.cfg), self)
+        self.scheduler.fired.connect(self._on_event)
+        self.scheduler.start()
+
+    def _on_event(self, event: str, now: datetime):
+        log.debug("Scheduled event %s at %s", event, now.strftime("%H:%M:%S"))
+        dispatch_event(self, event, now)
+
+    # --- what each event does (``scheduler.EVENT_HANDLERS``; the simulation implements the same) ---
+
+    def on_midnight(self, now: datetime):
+        self._rollover(now.date())
+
+    def on_morning(self, now: datetime):
+        self.check_today_and_notify()
+
+    def on_evening(self, now: datetime):
+        self.fetcher.submit(self._has_closed_today, on_done=self._on_closed_today_checked)
+
+    def on_poll(self, now: datetime):
+        self._poll()
 
     def _on_tick_at(self, now: datetime):
-        log.debug("Tick at %s", now.strftime("%H:%M:%S"))
-        if now.hour == 10 and now.minute in (0, 1):
-            log.debug("10:00 check triggered")
-            self.check_today_and_notify()
-
-        if dtime(16, 30) <= dtime(now.hour, now.minute) <= dtime(19, 0):
-            seconds_passed = (int((now - self._last_close_check).total_seconds()) + 1) if self._last_close_check else float('inf')
-            log.debug("Evening check time window: now %s, last check %s, seconds passed %s", now.strftime("%H:%M:%S"), 
-                      self._last_close_check.strftime("%H:%M:%S") if self._last_close_check else "None", 
-                      seconds_passed)
-            
-            if (self._last_close_check is None) or (seconds_passed >= self.__undone_check_period):
-                self._last_close_check = now
-                has = self._has_closed_today()
-                log.debug("Evening check: has_closed_today=%s", has)
-                if not has:
-                    self.tray.showMessage(
-                        APP_NAME,
-                        "No tasks completed today. Choose at least one and get it to Done 💪",
-                        QtWidgets.QSystemTrayIcon.MessageIcon.Information,
-                        10_000,
-                    )
-
-    def _on_tick(self):
-        self._on_tick_at(datetime.now())
+        """Run whatever the scheduler has due at ``now``."""
+        self.scheduler.run_due(now)
+
+    @property
+    def rules(self) -> ReminderRules:
+        # built on use, so a reconnect (new client or assignee) is picked up without extra wiring
+        return ReminderRules(self.client, self.cfg["assignee_email"])
+
+    def _notify(self, note: Notification | None):
+        if note is None:
+            return
+        icon = (
+            QtWidgets.QSystemTrayIcon.MessageIcon.Warning
+            if note.level == "warning"
+            else QtWidgets.QSystemTrayIcon.MessageIcon.Information
+        )
+        self.tray.showMessage(APP_NAME, note.text, icon, note.timeout_ms)
+
+    def _on_closed_today_checked(self, has: bool):
+        log.debug("Evening check: has_closed_today=%s", has)
+        self._notify(ReminderRules.evening_message(has))
 
     def check_today_and_notify(self):
-        try:
-            jql_today = self.client.jql_for_day(self.cfg["assignee_email"], "today")
-            self.today_issues = self.client.search(jql_today, max_results=10)
-            if self.today_issues:
-                items = "\n".join([f"{x['key']}: {x['summary']}" for x in self.today_issues[:5]])
-                self.tray.showMessage(
-                    APP_NAME,
-                    f"Today's tasks:\n{items}",
-                    QtWidgets.QSystemTrayIcon.MessageIcon.Information,
-                    12_000,
-                )
-        except Exception as e:
-            log.exception("check_today_and_notify failed")
-            self.tray.showMessage(
-                APP_NAME,
-                f"Update error: {e}",
-                QtWidgets.QSystemTrayIcon.MessageIcon.Warning,
-                8000,
-            )
+        self.fetcher.submit(
+            self.rules.fetch_today,
+            on_done=self._on_today_checked,
+            on_error=self._on_today_check_failed,
+        )
+
+    def _on_today_checked(self, issues: list[Issue]):
+        self.today_issues = issues
+        self._notify(ReminderRules.today_message(issues))
+
+    def _on_today_check_failed(self, e: Exception):
+        log.error("check_today_and_notify failed", exc_info=e)
+        self._notify(ReminderRules.today_failed_message(e))
 
     def _has_closed_today(self) -> bool:
-        try:
-            jql = self.client.jql_closed_today(self.cfg["assignee_email"])
-            log.debug("Checking closed today with JQL: %s", jql)
-            log.debug("Checking closed today with JQL: %s", jql)
-            issues = self.client.search(jql, max_results=1)
-            return len(issues) > 0
-        except Exception:
-            log.exception("_has_closed_today failed")
-            return False
+        # runs on a pool thread
+        return self.rules.has_closed_today()
 
     def refresh_all(self, initial: bool = False):
-        try:
-            assignee = self.cfg["assignee_email"]
-            jql_over = self.client.jql_overdue(assignee)
-            jql_today = self.client.jql_for_day(assignee, "today")
-            jql_tom = self.client.jql_for_day(assignee, "tomorrow")
-
-            over_issues = self.client.search(jql_over, max_results=50)
-            self.today_issues = self.client.search(jql_today, max_results=50)
-            tom_issues = self.client.search(jql_tom, max_results=50)
+        """
+        Full refresh of the window with a confirmation toast. The ``initial`` refresh at startup is
+        silent and may be a delta if the persisted store was fully synced recently.
+        """
+        if not initial:
+            # an explicit refresh must not be answered from the search cache
+            self.client.invalidate()
+        self._start_sync(full=not initial, notify=not initial)
+
+    def _poll(self):
+        """Periodic incremental sync; the sync itself decides when a full reconcile is due."""
+        self._start_sync(full=False, notify=False)
+
+    def _start_sync(self, full: bool, notify: bool):
+        self._refresh_gen += 1
+        gen = self._refresh_gen
+        state = {
+            "issues": [],
+            "t0": time.perf_counter(),
+            "mode": "full" if full else "auto",
+            "full_syncs": self.sync.full_syncs,
+        }
+        self.window.refresh_btn.setEnabled(False)
+        # blocks are re-rendered as each page arrives, so the first page shows up immediately
+        self.fetcher.submit_iter(
+            self.sync.iter_sync,
+            full=full,
+            on_item=lambda issues: self._on_refresh_page(gen, state, issues),
+            on_done=lambda _: self._on_refresh_done(gen, state["issues"], notify, state),
+            on_error=lambda e: self._on_refresh_failed(gen, e, notify, state),
+        )
 
-            self.window.overdue.set_issues(
-                over_issues, self.client.make_issues_link(jql_over), self.client.make_issue_url
-            )
-            self.window.today.set_issues(
-                self.today_issues, self.client.make_issues_link(jql_today), self.client.make_issue_url
+    @staticmethod
+    def _observe_refresh(state: dict | None, outcome: str):
+        # whole cycle as the user sees it: request, every page, parsing and re-rendering the blocks
+        if state is not None:
+            elapsed = time.perf_counter() - state["t0"]
+            TELEMETRY.observe("refresh_seconds", elapsed, mode=state["mode"], outcome=outcome)
+
+    def _on_refresh_page(self, gen: int, state: dict, issues: list[Issue]):
+        if gen != self._refresh_gen:
+            log.debug("Dropping stale refresh page #%d", gen)
+            return
+        state["issues"] = issues
+        self._render_buckets(issues)
+        STARTUP.finish("first data")
+
+    def _on_refresh_done(self, gen: int, issues: list[Issue], notify: bool, state: dict | None = None):
+        self._observe_refresh(state, "ok")
+        if gen != self._refresh_gen:
+            log.debug("Dropping stale refresh result #%d", gen)
+            return
+        self.window.refresh_btn.setEnabled(True)
+        self._data_fetched_at = datetime.now()
+        self._mark_stale(None)
+        STARTUP.finish("first data")  # a delta sync with nothing new yields no pages
+        if state is not None and self.sync.full_syncs != state["full_syncs"]:
+            # the real totals only change with the window itself: ask once per full sync
+            self._counted = {}
+            if self.sync.truncated:
+                self._count_buckets()
+            if self._more is not None:
+                # pages loaded past the window follow the old listing: start them over
+                self._more = None
+                self._render_buckets(issues)
+        self.fetcher.submit(save_snapshot, self._account, list(issues), self._data_fetched_at)
+
+        if notify:
+            self.tray.showMessage(
+                APP_NAME,
+                "Data updated",
+                QtWidgets.QSystemTrayIcon.MessageIcon.Information,
+                3000,
             )
-            self.window.tomorrow.set_issues(
-                tom_issues, self.client.make_issues_link(jql_tom), self.client.make_issue_url
+
+    def _restore_snapshot(self):
+        snap = load_snapshot(self._account)
+        if snap is None:
+            return
+        fetched_at, issues = snap
+        log.debug("Rendering snapshot from %s (%d issues)", fetched_at.isoformat(), len(issues))
+        self._data_fetched_at = fetched_at
+        self._render_buckets(issues)
+        self._mark_stale(fetched_at)
+
+    def _mark_stale(self, fetched_at: datetime | None):
+        for block in self._blocks().values():
+            block.set_stale(fetched_at)
+
+    def _rollover(self, today: date):
+        """
+        New day: re-bucket the stored issues at once, then run a full sync. Issues that only now
+        enter the window (due the day after tomorrow at the last fetch) are not in the store, and
+        a delta sync would not see them because nothing about them was updated.
+        """
+        log.debug("Day changed, recomputing blocks from the local store")
+        self._counted = {}  # yesterday's totals; the full sync below counts again
+        self._more = None
+        self._show_buckets(self.store.buckets(today), today)
+        self._start_sync(full=True, notify=False)
+
+    def _render_buckets(self, issues: list[Issue]):
+        # one round-trip for all three blocks, split locally
+        self._show_buckets(partition_buckets(issues))
+
+    def _bucket_jqls(self) -> dict[str, str]:
+        assignee = self.cfg["assignee_email"]
+        return {
+            "overdue": self.client.jql_overdue(assignee),
+            "today": self.client.jql_for_day(assignee, "today"),
+            "tomorrow": self.client.jql_for_day(assignee, "tomorrow"),
+        }
+
+    def _show_buckets(self, buckets: dict[str, list[Issue]], day: date | None = None):
+        links = {name: self.client.make_issues_link(jql) for name, jql in self._bucket_jqls().items()}
+        self.today_issues = buckets["today"]
+        self._rendered_on = day or date.today()
+        # keep what the user scrolled in across polls
+        more = partition_buckets(self._more["issues"], self._rendered_on) if self._more else None
+        for name, block in self._blocks().items():
+            issues = buckets[name]
+            if more and more[name]:
+                known = {it.key for it in issues}
+                issues = issues + [it for it in more[name] if it.key not in known]
+            block.set_issues(issues, links[name], self.client.make_issue_url)
+            block.set_total(self._counted.get(name, len(buckets[name])))
+
+    def _count_buckets(self):
+        """The window fetch hit its cap: ask Jira for the real per-block totals without fetching issues."""
+        jqls = self._bucket_jqls()
+        for name in self._blocks():
+            self.fetcher.submit(
+                self.client.count, jqls[name], exact=True, on_done=lambda n, name=name: self._on_counted(name, n)
             )
 
-            if not initial:
+    def _on_counted(self, name: str, total: int | None):
+        if total is None:
+            log.debug("No total for %s from Jira, keeping the local count", name)
+            return  # the header keeps the count of the window
+        self._counted[name] = total
+        self._blocks()[name].set_total(total)
+
+    def _load_more(self, name: str):
+        """
+        A block was scrolled past everything the window fetch brought: load the window's next page
+        from where the full sync stopped and spread it over the blocks. A block the page adds
+        nothing to asks again, so paging goes on until it has rows or Jira has no more pages.
+        """
+        paging = self._more
+        if paging is None:
+            paging = self._more = {"token": self.sync.window_token, "issues": [], "loading": False}
+        if paging["token"] is None:
+            return  # the window was complete: the per-block totals were approximate
+        if paging["loading"]:
+            return  # the page in flight is for every block
+        paging["loading"] = True
+        log.debug("Loading the next window page for %s (%d loaded past the window)", name, len(paging["issues"]))
+        self.fetcher.submit(
+            self.client.search_page,
+            self.client.jql_window(self.cfg["assignee_email"]),
+            MAX_PAGE_SIZE,
+            paging["token"],
+            on_done=lambda result, paging=paging: self._on_more_loaded(paging, result),
+            on_error=lambda e, paging=paging: self._on_more_failed(paging, e),
+        )
+
+    def _on_more_loaded(self, paging: dict, result: tuple[list[Issue], str | None]):
+        if self._more is not paging:
+            log.debug("Dropping a window page loaded before the window was reset")
+            return
+        issues, paging["token"] = result
+        paging["loading"] = False
+        paging["issues"].extend(issues)
+        buckets = partition_buckets(issues, self._rendered_on)
+        for name, block in self._blocks().items():
+            block.model.append_issues(buckets[name])
+
+    def _on_more_failed(self, paging: dict, e: Exception):
+        log.warning("Loading more issues failed: %s", e)
+        if self._more is paging:
+            paging["loading"] = False
+            for block in self._blocks().values():
+                block.model.cancel_more()
+
+    def _on_refresh_failed(self, gen: int, e: Exception, notify: bool = True, state: dict | None = None):
+        self._observe_refresh(state, "error")
+        if gen != self._refresh_gen:
+            return
+        STARTUP.finish("first data (failed)")
+        self.window.refresh_btn.setEnabled(True)
+        # keep whatever is on screen, but say how old it is
+        if self._data_fetched_at is not None:
+            self._mark_stale(self._data_fetched_at)
+        if isinstance(e, JiraUnavailableError) or not notify:
+            # the breaker has already told the user; background syncs never pop errors on their own
+            log.warning("Refresh failed: %s", e)
+            return
+        if isinstance(e, requests.HTTPError):
+            log.error("JIRA HTTP error during refresh", exc_info=e)
+            text = f"JIRA HTTP error: {e}"
+        else:
+            log.error("Unexpected error during refresh", exc_info=e)
+            text = f"Error: {e}"
+        self.tray.showMessage(APP_NAME, text, QtWidgets.QSystemTrayIcon.MessageIcon.Critical, 8000)
+
+    def _on_jira_state(self, state: str):
+        if state == CircuitBreaker.OPEN:
+            until = (datetime.now() + timedelta(seconds=self.breaker.retry_in())).strftime("%H:%M")
+            self.tray.setToolTip(f"{APP_NAME} — Jira unreachable, next attempt at {until}")
+            if self._data_fetched_at is not None:
+                self._mark_stale(self._data_fetched_at)
+            if not self._jira_down_announced:
+                self._jira_down_announced = True
                 self.tray.showMessage(
                     APP_NAME,
-                    "Data updated",
+                    f"Jira is not reachable. Requests are paused until {until}; showing cached data.",
+                    QtWidgets.QSystemTrayIcon.MessageIcon.Warning,
+                    8000,
+                )
+        elif state == CircuitBreaker.CLOSED:
+            self.tray.setToolTip(APP_NAME)
+            if self._jira_down_announced:
+                self._jira_down_announced = False
+                self.tray.showMessage(
+                    APP_NAME,
+                    "Connection to Jira restored.",
                     QtWidgets.QSystemTrayIcon.MessageIcon.Information,
                     3000,
                 )
-        except requests.HTTPError as e:
-            log.exception("JIRA HTTP error during refresh")
-            self.tray.showMessage(
-                APP_NAME,
-                f"JIRA HTTP error: {e}",
-                QtWidgets.QSystemTrayIcon.MessageIcon.Critical,
-                8000,
-            )
-        except Exception as e:
-            log.exception("Unexpected error during refresh")
-            self.tray.showMessage(
-                APP_NAME,
-                f"Error: {e}",
-                QtWidgets.QSystemTrayIcon.MessageIcon.Critical,
-                8000,
-            )
+
+    def _blocks(self) -> dict:
+        return {"overdue": self.window.overdue, "today": self.window.today, "tomorrow": self.window.tomorrow}
+
+    def handle_command(self, command: str):
+        """A command forwarded by another launch (``--show``/``--refresh``/``--today``)."""
+        actions = {"show": self.show_main, "refresh": self.refresh_all, "today": self.show_today_popup}
+        action = actions.get(command)
+        if action is None:
+            log.warning("Unknown command %r", command)
+            return
+        action()
 
     def show_main(self):
         self.window.show()
@@ -213,24 +457,29 @@ class JiraReminderController(QtCore.QObject):
         self.window.activateWindow()
 
     def show_today_popup(self):
-        try:
-            if not self.today_issues:
-                jql_today = self.client.jql_for_day(self.cfg["assignee_email"], "today")
-                self.today_issues = self.client.search(jql_today, max_results=50)
-            else:
-                jql_today = self.client.jql_for_day(self.cfg["assignee_email"], "today")
-
-            more_url = self.client.make_issues_link(jql_today)
-            dlg = TodayPopup(self.today_issues, more_url, self.client.make_issue_url, self.window)
-            dlg.exec()
-        except Exception as e:
-            log.exception("show_today_popup failed")
-            self.tray.showMessage(
-                APP_NAME,
-                f"Error: {e}",
-                QtWidgets.QSystemTrayIcon.MessageIcon.Critical,
-                8000,
-            )
+        if self.today_issues:
+            self._open_today_popup(self.today_issues)
+            return
+        self.fetcher.submit(
+            self.rules.fetch_today,
+            on_done=self._open_today_popup,
+            on_error=self._on_popup_failed,
+        )
+
+    def _open_today_popup(self, issues: list[Issue]):
+        self.today_issues = issues
+        more_url = self.client.make_issues_link(self.rules.today_jql())
+        dlg = TodayPopup(self.today_issues, more_url, self.client.make_issue_url, self.window)
+        dlg.exec()
+
+    def _on_popup_failed(self, e: Exception):
+        log.error("show_today_popup failed", exc_info=e)
+        self.tray.showMessage(
+            APP_NAME,
+            f"Error: {e}",
+            QtWidgets.QSystemTrayIcon.MessageIcon.Critical,
+            8000,
+        )
 
     def _tray_activated(self, reason: QtWidgets.QSystemTrayIcon.ActivationReason):
         if reason == QtWidgets.QSystemTrayIcon.ActivationReason.Trigger:
@@ -246,18 +495,39 @@ class JiraReminderController(QtCore.QObject):
         try:
             dlg = ConfigDialog(self.window)
             if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-                # reload plain settings and apply immediate logging change
-                import json
-                from .paths import CONFIG_PLAIN_PATH
-
-                plain = {}
-                try:
-                    if CONFIG_PLAIN_PATH.exists():
-                        plain = json.loads(CONFIG_PLAIN_PATH.read_text(encoding="utf-8"))
-                except Exception:
-                    plain = {}
-
-                setup_logging(bool(plain.get("logging", False)), bool(plain.get("new_log", False)))
+                # the dialog saves through the config store; _on_config_changed applies the changes
                 QtWidgets.QMessageBox.information(self.window, APP_NAME, "Configuration saved.")
         except Exception:
             log.exception("_open_config failed")
+
+    def _on_config_changed(self, changed: set):
+        """Apply changed settings without restarting: logging, schedule, UI scale, sync and Jira access."""
+        secure = self.config.secure
+        if secure:
+            self._secure_cfg = secure
+        else:
+            log.warning("Secure config unavailable (%s), keeping the Jira settings in use", self.config.secure_error)
+        # replaced, not merged, so removed keys fall back to their defaults
+        cfg = {**self.config.plain, **self._secure_cfg}
+        self.cfg = cfg
+        if changed & LOGGING_KEYS:
+            setup_logging(bool(cfg.get("logging", False)), bool(cfg.get("new_log", False)))
+        if changed & set(SCHEDULE_KEYS):
+            self.scheduler.set_schedule(Schedule.from_config(self.cfg))
+        if "ui_scale" in changed:
+            ConfigDialog._apply_ui_scale(float(cfg.get("ui_scale", 1.25)))
+        if "full_sync_minutes" in changed:
+            self.sync.full_every = self._full_every(cfg)
+        if "cache_ttl_seconds" in changed:
+            self.client.cache_ttl = client_options(cfg)["cache_ttl"]
+            self.client.invalidate()  # stored under the old TTL
+        if changed & JIRA_KEYS and secure:
+            log.debug("Jira settings changed, reconnecting")
+            self.client = self._make_client(self.cfg)
+            self.sync.client = self.client
+            self.sync.assignee = self.cfg["assignee_email"]
+            account = self._account_of(self.cfg)
+            if account != self._account:
+                self._account = account
+                self.store.set_account(account)
+            self.refresh_all()
@@ -0,0 +1,90 @@
+# src/jira_reminder/ipc.py
+from __future__ import annotations
+
+import getpass
+import re
+
+from PyQt6 import QtCore, QtNetwork
+
+from .metrics import APP_NAME
+from .logging_setup import log
+
+COMMANDS = ("show", "refresh", "today")
+CONNECT_TIMEOUT_MS = 200
+MAX_COMMAND_BYTES = 64
+
+
+def server_name() -> str:
+    """Per-user name of the local socket / named pipe of the running instance."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", f"{APP_NAME}-{user}")
+
+
+def send_command(command: str, name: str | None = None, timeout_ms: int = CONNECT_TIMEOUT_MS) -> bool:
+    """
+    Hand ``command`` to the running instance. True once it is delivered; False when nobody is
+    listening (no instance, or a stale socket left by a crash). Blocking and event-loop free, so it
+    runs before any QApplication exists.
+    """
+    if command not in COMMANDS:
+        raise ValueError(f"Unknown command: {command}")
+    sock = QtNetwork.QLocalSocket()
+    sock.connectToServer(name or server_name())
+    if not sock.waitForConnected(timeout_ms):
+        return False
+    sock.write(command.encode("ascii") + b"\n")
+    ok = sock.waitForBytesWritten(timeout_ms)
+    sock.disconnectFromServer()
+    return ok
+
+
+class CommandServer(QtCore.QObject):
+    """
+    Listens for commands from later launches (``jira-reminder --show`` etc.) and re-emits them as
+    ``commandReceived``. Call ``listen()`` only while holding the single-instance lock: it removes
+    a socket left behind by a crashed instance.
+    """
+
+    commandReceived = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None, name: str | None = None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_connection)
+
+    def listen(self) -> bool:
+        QtNetwork.QLocalServer.removeServer(self.name)
+        if not self._server.listen(self.name):
+            log.warning("Command server not available: %s", self._server.errorString())
+            return False
+        log.debug("Command server listening on %s", self._server.fullServerName())
+        return True
+
+    def close(self) -> None:
+        self._server.close()
+
+    def _on_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            sock.readyRead.connect(lambda sock=sock: self._read(sock))
+            sock.disconnected.connect(sock.deleteLater)
+            if sock.bytesAvailable():
+                self._read(sock)
+
+    def _read(self, sock: QtNetwork.QLocalSocket) -> None:
+        if not sock.canReadLine():
+            if sock.bytesAvailable() > MAX_COMMAND_BYTES:
+                sock.abort()
+            return
+        command = bytes(sock.readLine(MAX_COMMAND_BYTES)).decode("ascii", "replace").strip()
+        sock.disconnectFromServer()
+        if command not in COMMANDS:
+            log.warning("Ignoring unknown command %r", command)
+            return
+        log.debug("Command from another launch: %s", command)
+        self.commandReceived.emit(command)
@@ -1,13 +1,50 @@
 # src/jira_reminder/jira_client.py
 from __future__ import annotations
 
-from typing import List, Dict
+import threading
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .logging_setup import log
+from .models import Issue
+from .telemetry import TELEMETRY
+from .resilience import RETRY_STATUSES, CircuitBreaker, RetryPolicy, parse_retry_after
+
+MAX_PAGE_SIZE = 100  # largest page /search/jql returns when fields are requested
+POOL_SIZE = 10  # keep-alive connections per host: enough for every worker sharing one session
+
+
+def make_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """A keep-alive session whose pool holds ``pool_size`` concurrent connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+class _Flight:
+    """A search request in progress; callers asking for the same query wait on it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: List[Issue] = []
+        self.error: Exception | None = None
+
+
+class SearchPage(list):
+    """A page of parsed issues; ``next_token`` continues the same query after it (None after the last)."""
+
+    next_token: str | None = None
 
 
 class JiraClient:
@@ -20,6 +57,11 @@ class JiraClient:
         issue_types: list[str],
         start_date_field: str | None = None,
         done_jql_override: str | None = None,
+        cache_ttl: float = 60.0,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        session: requests.Session | None = None,
+        clock: Callable[[], float] | None = None,
     ):
         self.base = base_url.rstrip("/")
         self.email = email
@@ -29,10 +71,25 @@ class JiraClient:
         self.start_date_field = start_date_field or "customfield_10015"
         self.done_override = (done_jql_override or "").strip()
 
-        self.session = requests.Session()
+        # pass ``session`` to share one connection pool between clients of the same account
+        self.session = session or make_session()
         self.session.auth = (self.email, self.token)
-        self.session.headers.update({"Accept": "application/json"})
-        log.debug(f"The JiraClient is intialized for user {self.email}")
+
+        # transport policy: retries with backoff, Retry-After, circuit breaker
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = time.sleep
+        # called with the endpoint before every HTTP attempt, retries included (request accounting)
+        self.on_request: Callable[[str], None] | None = None
+
+        # search() result cache and in-flight request table, shared by all worker threads
+        self.cache_ttl = cache_ttl
+        self.clock = clock or time.monotonic  # seconds; the cache TTL runs on it
+        self._cache: Dict[tuple, tuple[float, List[Issue]]] = {}
+        self._inflight: Dict[tuple, _Flight] = {}
+        self._cache_gen = 0
+        self._cache_lock = threading.Lock()
+        log.debug("The JiraClient is intialized for user %s", self.email)
 
     def _cf_key(self) -> str | None:
         if not self.start_date_field:
@@ -45,14 +102,32 @@ class JiraClient:
             return f"cf[{num}]"
         return s
 
-    def _base_constraints(self, assignee_email: str) -> str:
+    def _field_id(self) -> str | None:
+        """REST field id of the start date field (``cf[10015]`` -> ``customfield_10015``)."""
+        if not self.start_date_field:
+            return None
+        s = self.start_date_field.strip()
+        if s.startswith("cf[") and s.endswith("]"):
+            return f"customfield_{s[3:-1]}"
+        return s
+
+    @staticmethod
+    def _assignee_clause(assignee: str | Sequence[str]) -> str:
+        people = [assignee] if isinstance(assignee, str) else list(assignee)
+        if len(people) == 1:
+            return f'assignee = "{people[0]}"'
+        quoted = ", ".join(f'"{p}"' for p in people)
+        return f"assignee in ({quoted})"
+
+    def _base_constraints(self, assignee_email: str | Sequence[str], include_done: bool = False) -> str:
+        """Project/type/status filter for one assignee, or ``assignee in (...)`` for a list of them."""
         proj = ", ".join(self.projects)
         issuet = ", ".join([f'"{t}"' for t in self.issue_types]) if self.issue_types else ""
         parts = [
             f'project in ({proj})' if self.projects else "",
-            f'assignee = "{assignee_email}"',
+            self._assignee_clause(assignee_email),
             f'issuetype in ({issuet})' if issuet else "",
-            'statusCategory != Done',
+            'statusCategory != Done' if not include_done else "",
         ]
         return " AND ".join([p for p in parts if p])
 
@@ -74,65 +149,341 @@ class JiraClient:
             or_parts.append(f'({cf} = {target})')
         return f'{base} AND ({" OR ".join(or_parts)}) ORDER BY duedate ASC, updated DESC'
 
+    def jql_window(self, assignee_email: str | Sequence[str]) -> str:
+        """
+        One query covering overdue, today and tomorrow: everything with a due/start date
+        up to and including tomorrow. Split the result with ``partition_buckets``; for a list of
+        assignees, split it by ``Issue.assignee`` first (``team.fetch_team``).
+        """
+        base = self._base_constraints(assignee_email)
+        cf = self._cf_key()
+        target = "startOfDay('+1d')"
+        or_parts = [f'(duedate <= {target} AND duedate is not EMPTY)']
+        if cf:
+            or_parts.append(f'({cf} <= {target} AND {cf} is not EMPTY)')
+        return f'{base} AND ({" OR ".join(or_parts)}) ORDER BY duedate ASC, updated DESC'
+
+    def jql_updated_since(self, assignee_email: str, minutes: int) -> str:
+        """
+        Issues touched in the last ``minutes`` minutes, including ones that went to Done, so an
+        incremental sync can both update and drop entries. A relative offset avoids any mismatch
+        between the local clock and the Jira user's time zone.
+        """
+        base = self._base_constraints(assignee_email, include_done=True)
+        return f'{base} AND updated >= "-{max(1, int(minutes))}m" ORDER BY updated DESC'
+
     def jql_closed_today(self, assignee_email: str) -> str:
         if self.done_override:
             return self.done_override
         proj = f' AND project in ({", ".join(self.projects)})' if self.projects else ""
         return f'assignee = "{assignee_email}"{proj} AND status CHANGED TO Done DURING (startOfDay(), now()) ORDER BY resolutiondate DESC'
 
-    def search(self, jql: str, max_results: int = 50) -> List[Dict]:
+    def _search_fields(self) -> List[str]:
+        fields = ["summary", "duedate", "issuetype", "assignee", "project", "priority", "status", "updated"]
+        start_field = self._field_id()
+        if start_field:
+            fields.append(start_field)
+        return fields
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send one request through the retry policy and circuit breaker.
+
+        Timeouts, connection errors, 5xx and 429 are retried with backoff; ``Retry-After`` is
+        honoured, and one longer than the policy's ``max_delay`` opens the circuit for that long
+        instead of blocking a worker thread. The final response is returned as-is for the caller
+        to ``raise_for_status``.
+        """
+        endpoint = url.split("/rest/api/3/", 1)[-1]
+        attempt = 0
+        # once per logical request: retries of a half-open trial are still that trial, and only
+        # its final outcome closes or re-opens the circuit
+        self.breaker.before_request()
+        while True:
+            if self.on_request is not None:
+                self.on_request(endpoint)
+            t0 = time.perf_counter()
+            try:
+                r = getattr(self.session, method)(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                TELEMETRY.observe("jira_http_request_seconds", time.perf_counter() - t0, endpoint=endpoint)
+                TELEMETRY.inc("jira_http_errors_total", endpoint=endpoint, error=type(e).__name__)
+                if attempt < self.retry.retries:
+                    TELEMETRY.inc("jira_http_retries_total", endpoint=endpoint)
+                    wait = self.retry.delay(attempt)
+                    log.warning("%s %s failed (%s), retry %d in %.1f s", method.upper(), url, e, attempt + 1, wait)
+                    self._sleep(wait)
+                    attempt += 1
+                    continue
+                self.breaker.record_failure()
+                raise
+            except Exception as e:
+                # not retried (a broken body, redirect loop, ...), but still an outcome: every exit
+                # has to settle the breaker, or a half-open trial would never end
+                TELEMETRY.observe("jira_http_request_seconds", time.perf_counter() - t0, endpoint=endpoint)
+                TELEMETRY.inc("jira_http_errors_total", endpoint=endpoint, error=type(e).__name__)
+                self.breaker.record_failure()
+                raise
+            TELEMETRY.observe("jira_http_request_seconds", time.perf_counter() - t0, endpoint=endpoint)
+            TELEMETRY.inc("jira_http_responses_total", endpoint=endpoint, status=r.status_code)
+            TELEMETRY.inc("jira_http_received_bytes_total", len(getattr(r, "content", None) or b""), endpoint=endpoint)
+            if r.status_code not in RETRY_STATUSES:
+                self.breaker.record_success()
+                return r
+            retry_after = parse_retry_after((getattr(r, "headers", None) or {}).get("Retry-After"))
+            too_long = retry_after is not None and retry_after > self.retry.max_delay
+            if attempt < self.retry.retries and not too_long:
+                TELEMETRY.inc("jira_http_retries_total", endpoint=endpoint)
+                wait = self.retry.delay(attempt, retry_after)
+                log.warning("HTTP %s from %s, retry %d in %.1f s", r.status_code, url, attempt + 1, wait)
+                self._sleep(wait)
+                attempt += 1
+                continue
+            self.breaker.record_failure(open_for=retry_after if too_long else None)
+            return r
+
+    def _search_page(self, jql: str, max_results: int, fields: List[str], next_token: str | None = None) -> Dict:
         url = f"{self.base}/rest/api/3/search/jql"
         payload = {
             "jql": jql,
             "maxResults": max_results,
-            "fields": ["summary", "duedate", "issuetype", "assignee", "project", "priority", "status"],
+            "fields": fields,
         }
+        if next_token:
+            payload["nextPageToken"] = next_token
         log.debug("POST %s", url)
         log.debug("JQL: %s", jql)
         try:
-            r = self.session.post(url, json=payload, timeout=30)
+            r = self._request("post", url, json=payload, timeout=30)
             log.debug("HTTP %s %s", r.status_code, r.reason)
             r.raise_for_status()
-            data = r.json()
+            with TELEMETRY.span("jira_json_decode_seconds"):
+                return r.json()
         except requests.HTTPError as e:
             if getattr(e, "response", None) is not None and e.response.status_code in (404, 405):
                 log.warning("POST /search/jql not accepted, trying GET fallback")
-                r = self.session.get(
-                    url,
-                    params={
-                        "jql": jql,
-                        "maxResults": max_results,
-                        "fields": "summary,duedate,issuetype,assignee,project",
-                    },
-                    timeout=30,
-                )
+                params = {
+                    "jql": jql,
+                    "maxResults": max_results,
+                    "fields": ",".join(fields),
+                }
+                if next_token:
+                    params["nextPageToken"] = next_token
+                r = self._request("get", url, params=params, timeout=30)
                 log.debug("HTTP %s %s (GET fallback)", r.status_code, r.reason)
                 r.raise_for_status()
-                data = r.json()
+                return r.json()
+            body = e.response.text if getattr(e, "response", None) is not None else str(e)
+            log.error("JIRA HTTP error: %s\nResponse body:\n%s", e, body)
+            raise
+
+    def count(self, jql: str, exact: bool = False) -> int | None:
+        """
+        Number of issues matching ``jql`` without downloading them, via
+        ``/rest/api/3/search/approximate-count``. Where that endpoint is not available it falls back
+        to a one-issue search with minimal fields, which gives the ``total`` only on servers that
+        still report it and otherwise only tells 0 from "at least 1"; with ``exact`` that case
+        returns None instead of a number that is not the total.
+        """
+        url = f"{self.base}/rest/api/3/search/approximate-count"
+        log.debug("POST %s", url)
+        log.debug("JQL: %s", jql)
+        r = self._request("post", url, json={"jql": jql}, timeout=30)
+        log.debug("HTTP %s %s", r.status_code, r.reason)
+        if r.status_code in (404, 405):
+            log.warning("approximate-count not available, falling back to a 1-issue search")
+            data = self._search_page(jql, 1, ["id"])
+            if data.get("total") is not None:
+                return int(data["total"])
+            return None if exact else len(data.get("issues", []))
+        r.raise_for_status()
+        return int(r.json().get("count", 0))
+
+    def account_id(self, email: str) -> str | None:
+        """
+        The account id of the user with ``email`` via ``/rest/api/3/user/search``, which matches the
+        e-mail even where the profile hides it from responses. None without a single match.
+        """
+        url = f"{self.base}/rest/api/3/user/search"
+        log.debug("GET %s", url)
+        r = self._request("get", url, params={"query": email}, timeout=30)
+        log.debug("HTTP %s %s", r.status_code, r.reason)
+        r.raise_for_status()
+        users = [u for u in r.json() if u.get("accountId")]
+        exact = [u for u in users if (u.get("emailAddress") or "").lower() == email.lower()]
+        if len(exact) == 1 or len(users) == 1:
+            return (exact or users)[0]["accountId"]
+        return None
+
+    def _parse_issue(self, it: Dict) -> Issue:
+        start_field = self._field_id()
+        f = it.get("fields", {})
+        status = f.get("status") or {}
+        return Issue(
+            key=it["key"],
+            summary=f.get("summary", "(no summary)"),
+            duedate=f.get("duedate"),
+            startdate=f.get(start_field) if start_field else None,
+            issuetype=(f.get("issuetype") or {}).get("name"),
+            project=(f.get("project") or {}).get("key"),
+            priority=(f.get("priority") or {}).get("name"),
+            status=status.get("name"),
+            status_category=(status.get("statusCategory") or {}).get("key"),
+            updated=f.get("updated"),
+            assignee=_assignee_id(f.get("assignee")),
+        )
+
+    def iter_search(self, jql: str, page_size: int = 50, limit: int | None = None) -> Iterator[SearchPage]:
+        """
+        Yield parsed issues page by page, following ``nextPageToken`` until the last page
+        or until ``limit`` issues have been yielded in total. Each page carries the token of the
+        next one, so a search cut off by ``limit`` can be continued with ``search_page``.
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        fields = self._search_fields()
+        token: str | None = None
+        seen = 0
+        while limit is None or seen < limit:
+            size = page_size if limit is None else min(page_size, limit - seen)
+            data = self._search_page(jql, size, fields, token)
+            raw = data.get("issues", [])
+            with TELEMETRY.span("jira_parse_issues_seconds"):
+                page = SearchPage(self._parse_issue(it) for it in raw[:size])
+            seen += len(page)
+            token = data.get("nextPageToken")
+            last = not raw or not token or data.get("isLast")
+            page.next_token = None if last else token
+            if page:
+                yield page
+            if last:
+                break
+            log.debug("Fetching next page after %d issues", seen)
+
+    def search_page(
+        self, jql: str, page_size: int = 50, next_token: str | None = None
+    ) -> Tuple[List[Issue], str | None]:
+        """
+        One page of ``jql`` starting at ``next_token`` (the first page without one), uncached.
+        Returns the page and the token of the next one, None after the last.
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        data = self._search_page(jql, page_size, self._search_fields(), next_token)
+        raw = data.get("issues", [])
+        with TELEMETRY.span("jira_parse_issues_seconds"):
+            page = [self._parse_issue(it) for it in raw[:page_size]]
+        token = data.get("nextPageToken")
+        return page, (token if raw and token and not data.get("isLast") else None)
+
+    def search(self, jql: str, max_results: int = 50, use_cache: bool = True) -> List[Issue]:
+        """
+        Return up to ``max_results`` issues for ``jql``.
+
+        Results are cached for ``cache_ttl`` seconds, and concurrent callers asking for the same
+        (JQL, fields, max_results) share one HTTP request instead of issuing their own.
+        ``use_cache=False`` always asks Jira: a relative-time query such as ``updated >= "-7m"``
+        reads the same on every poll but means something new each time.
+        """
+        if not use_cache:
+            return [it for page in self.iter_search(jql, page_size=max_results, limit=max_results) for it in page]
+        key = (jql, tuple(self._search_fields()), max_results)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] > self.clock():
+                TELEMETRY.inc("jira_search_cache_total", result="hit")
+                log.debug("Search cache hit")
+                return list(hit[1])
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            gen = self._cache_gen
+
+        TELEMETRY.inc("jira_search_cache_total", result="miss" if leader else "joined")
+        if not leader:
+            log.debug("Joining in-flight search")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return list(flight.result)
+
+        try:
+            parsed: List[Issue] = []
+            for page in self.iter_search(jql, page_size=max_results, limit=max_results):
+                parsed.extend(page)
+            flight.result = parsed
+            with self._cache_lock:
+                # a result fetched across an invalidate() may already be outdated: don't keep it
+                if self.cache_ttl > 0 and gen == self._cache_gen:
+                    now = self.clock()
+                    self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                    self._cache[key] = (now + self.cache_ttl, parsed)
+            return list(parsed)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, jql: str | None = None) -> None:
+        """Drop cached search results (all of them, or only those for ``jql``)."""
+        with self._cache_lock:
+            self._cache_gen += 1
+            if jql is None:
+                self._cache.clear()
             else:
-                body = e.response.text if getattr(e, "response", None) is not None else str(e)
-                log.error("JIRA HTTP error: %s\nResponse body:\n%s", e, body)
-                raise
-        issues = data.get("issues", [])
-        parsed: List[Dict] = []
-        for it in issues:
-            key = it["key"]
-            f = it.get("fields", {})
-            parsed.append(
-                {
-                    "key": key,
-                    "summary": f.get("summary", "(no summary)"),
-                    "duedate": f.get("duedate"),
-                    "issuetype": (f.get("issuetype") or {}).get("name"),
-                    "project": (f.get("project") or {}).get("key"),
-                    "priority": (f.get("priority") or {}).get("name"),
-                    "status": (f.get("status") or {}).get("name"),
-                }
-            )
-        return parsed
+                self._cache = {k: v for k, v in self._cache.items() if k[0] != jql}
 
     def make_issue_url(self, key: str) -> str:
         return f"{self.base}/browse/{key}"
 
     def make_issues_link(self, jql: str) -> str:
         return f"{self.base}/issues/?jql={quote_plus(jql)}"
+
+
+def _assignee_id(user: Mapping | None) -> str | None:
+    """The assignee's e-mail, or the account id where the profile hides it."""
+    if not user:
+        return None
+    email = user.get("emailAddress")
+    return email.lower() if email else user.get("accountId")
+
+
+def client_options(cfg: dict) -> dict:
+    """``JiraClient`` keyword arguments for the combined app config (``ConfigStore.combined()``)."""
+    return {
+        "base_url": cfg["jira_base_url"],
+        "email": cfg["assignee_email"],
+        "api_token": cfg["api_token"],
+        "projects": cfg.get("project_keys", []),
+        "issue_types": cfg.get("issue_types", ["Sub-task - HW"]),
+        "start_date_field": cfg.get("start_date_field", "customfield_10015"),
+        "done_jql_override": cfg.get("done_jql"),
+        "cache_ttl": float(cfg.get("cache_ttl_seconds", 60)),
+    }
+
+
+BUCKETS = ("overdue", "today", "tomorrow")
+
+
+def partition_buckets(issues: Iterable[Mapping], today: date | None = None) -> Dict[str, List[Issue]]:
+    """
+    Split the result of a ``jql_window`` search into overdue/today/tomorrow buckets.
+
+    Mirrors the per-bucket JQL: an issue lands in a bucket if either its due date or its
+    start date matches, so it may appear in more than one bucket. Input order is kept.
+    """
+    today = today or date.today()
+    tomorrow = today + timedelta(days=1)
+    buckets: Dict[str, List[Issue]] = {name: [] for name in BUCKETS}
+    for it in map(Issue.from_dict, issues):
+        dates = it.dates()
+        if any(d < today for d in dates):
+            buckets["overdue"].append(it)
+        if today in dates:
+            buckets["today"].append(it)
+        if tomorrow in dates:
+            buckets["tomorrow"].append(it)
+    return buckets
+
@@ -1,25 +1,88 @@
 # src/jira_reminder/logging_setup.py
 from __future__ import annotations
 
+import atexit
+import gzip
+import os
+import queue
+import shutil
 import sys
 import logging
+from datetime import date, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-from .paths import LOG_PATH
+from .paths import LOG_PATH, ensure_parent
 
 log = logging.getLogger("JiraReminder")
 
+LOG_MAX_BYTES = 2 * 1024 * 1024  # per segment
+LOG_BACKUPS = 5  # compressed segments kept next to the live log
 
-def setup_logging(enabled: bool, new_log: bool) -> None:
+# the background writer; records are queued by the calling thread and written by this one
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rolls the log over when it would grow past ``max_bytes`` or on the first record of a new day,
+    gzipping the old segment (``jira_reminder.log.1.gz`` ... ``.N.gz``, oldest dropped).
+    """
+
+    def __init__(self, path, max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS):
+        super().__init__(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotate
+        try:
+            self._day = date.fromtimestamp(os.path.getmtime(self.baseFilename))
+        except OSError:
+            self._day = date.today()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if date.fromtimestamp(record.created) != self._day and os.path.exists(self.baseFilename):
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._day = date.today()
+
+
+def _gzip_rotate(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def setup_logging(
+    enabled: bool,
+    new_log: bool,
+    path=None,
+    max_bytes: int = LOG_MAX_BYTES,
+    backups: int = LOG_BACKUPS,
+) -> None:
+    """
+    Turn the DEBUG log on or off. Safe to call again (live config changes): it never stacks
+    handlers, and ``new_log`` (roll the previous log over) only applies when the log is opened.
+    Writing, rotation and compression happen on a background thread.
+    """
+    global _listener, _queue_handler
     if not enabled:
+        shutdown_logging()
+        log.setLevel(logging.WARNING)  # debug calls return before formatting anything
         return
 
     log.setLevel(logging.DEBUG)
+    if _listener is not None:
+        return
 
     # File log
-    fh = logging.FileHandler(LOG_PATH, encoding="utf-8", mode="w" if new_log else "a")
+    fh = CompressingRotatingFileHandler(ensure_parent(path or LOG_PATH), max_bytes, backups)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
-    log.addHandler(fh)
+    if new_log and os.path.exists(fh.baseFilename) and os.path.getsize(fh.baseFilename):
+        fh.doRollover()
+    handlers: list[logging.Handler] = [fh]
 
     # Console log (якщо реальний TTY)
     try:
@@ -27,10 +90,33 @@ def setup_logging(enabled: bool, new_log: bool) -> None:
             sh = logging.StreamHandler(sys.stdout)
             sh.setLevel(logging.DEBUG)
             sh.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-            log.addHandler(sh)
+            handlers.append(sh)
     except Exception:
         pass
 
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(q)
+    _listener = QueueListener(q, *handlers, respect_handler_level=True)
+    _listener.start()
+    log.addHandler(_queue_handler)
+
     # Менше шуму від HTTP
     logging.getLogger("urllib3").setLevel(logging.INFO)
     logging.getLogger("requests").setLevel(logging.INFO)
+    log.debug("Logging to %s (started %s)", fh.baseFilename, datetime.now().isoformat(timespec="seconds"))
+
+
+def shutdown_logging() -> None:
+    """Flush what is queued, close the files and detach from the logger."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        log.removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for h in _listener.handlers:
+            h.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -1,6 +1,8 @@
 # src/jira_reminder/metrics.py
 from __future__ import annotations
 
+import weakref
+
 APP_NAME = "Jira Reminder"
 __version__ = "0.10.0"  # x-release-please-version
 
@@ -9,13 +11,31 @@ __version__ = "0.10.0"  # x-release-please-version
 UI_SCALE: float = 1.0  # буде оновлено в app.main() згідно з аргументом --ui-scale
 BASE_FONT_SIZE: float = 12.0  # application base font point size (unscaled)
 
+# scale-aware components; weak, so a closed window simply drops out
+_scale_listeners: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def subscribe_scale(obj) -> None:
+    """Call ``obj.apply_scale()`` after every change of UI_SCALE, for as long as ``obj`` is alive."""
+    _scale_listeners.add(obj)
+
 
 def set_ui_scale(value: float) -> None:
     """
     Оновлює глобальний масштаб UI з обмеженнями [0.75; 2.5].
+    Підписані компоненти (subscribe_scale) перераховують свою геометрію.
     """
     global UI_SCALE
-    UI_SCALE = max(0.75, min(2.5, float(value)))
+    new = max(0.75, min(2.5, float(value)))
+    if new == UI_SCALE:
+        return
+    UI_SCALE = new
+    for obj in list(_scale_listeners):
+        try:
+            obj.apply_scale()
+        except RuntimeError:
+            # the Qt side of the object is already deleted
+            _scale_listeners.discard(obj)
 
 
 def set_base_font_size(value: float) -> None:
@@ -0,0 +1,147 @@
+# src/jira_reminder/models.py
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, timedelta
+from enum import IntEnum
+from typing import Any, Dict, Iterator
+
+
+class Priority(IntEnum):
+    """Jira's default priority scheme; anything else is ``NONE``."""
+
+    NONE = 0
+    LOWEST = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    HIGHEST = 5
+
+    @classmethod
+    def parse(cls, name: str | None) -> "Priority":
+        return cls.__members__.get((name or "").strip().upper(), cls.NONE)
+
+    @property
+    def label(self) -> str:
+        return "" if self is Priority.NONE else self.name.title()
+
+
+_STATUS_NAMES = {
+    "done": "done", "resolved": "done", "closed": "done", "accepted": "done",
+    "in progress": "inprogress", "implementing": "inprogress", "in review": "inprogress",
+    "to do": "todo", "todo": "todo", "backlog": "todo", "open": "todo",
+}
+_STATUS_CATEGORIES = {"done": "done", "indeterminate": "inprogress", "new": "todo"}
+
+
+def status_state(name: str | None, category: str | None = None) -> str:
+    """Badge state of a status: done/inprogress/todo/other. Well-known names win over the category."""
+    n = (name or "").strip().lower()
+    return _STATUS_NAMES.get(n) or _STATUS_CATEGORIES.get((category or "").strip().lower(), "other")
+
+
+def _as_date(value) -> date | None:
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class Issue(Mapping):
+    """
+    One Jira issue as shown by the app, built once when a search result is parsed.
+
+    The raw fields are readable like a dict (``issue["key"]``, ``issue.get("duedate")``) so code
+    that handles plain dicts keeps working; ``due``, ``start``, ``status_state`` and
+    ``priority_level`` are parsed up front so rendering does not re-parse strings.
+    """
+
+    FIELDS = (
+        "key",
+        "summary",
+        "duedate",
+        "startdate",
+        "issuetype",
+        "project",
+        "priority",
+        "status",
+        "status_category",
+        "updated",
+        "assignee",
+    )
+    __slots__ = FIELDS + ("due", "start", "status_state", "priority_level")
+
+    def __init__(
+        self,
+        key: str,
+        summary: str | None = None,
+        duedate: str | None = None,
+        startdate: str | None = None,
+        issuetype: str | None = None,
+        project: str | None = None,
+        priority: str | None = None,
+        status: str | None = None,
+        status_category: str | None = None,
+        updated: str | None = None,
+        assignee: str | None = None,
+    ):
+        self.key = key
+        self.summary = summary
+        self.duedate = duedate
+        self.startdate = startdate
+        self.issuetype = issuetype
+        self.project = project
+        self.priority = priority
+        self.status = status
+        self.status_category = (status_category or "").strip().lower() or None
+        self.updated = updated
+        self.assignee = assignee  # e-mail (lower case) or account id
+        self.due = _as_date(duedate)
+        self.start = _as_date(startdate)
+        self.status_state = status_state(status, self.status_category)
+        self.priority_level = Priority.parse(priority)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Issue":
+        if isinstance(data, Issue):
+            return data
+        return cls(**{f: data.get(f) for f in cls.FIELDS})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f: getattr(self, f) for f in self.FIELDS}
+
+    def dates(self) -> list[date]:
+        return [d for d in (self.due, self.start) if d]
+
+    def due_state(self, today: date | None = None) -> str:
+        """overdue/today/tomorrow/future by due date, or "none" without one."""
+        if self.due is None:
+            return "none"
+        today = today or date.today()
+        if self.due < today:
+            return "overdue"
+        if self.due == today:
+            return "today"
+        if self.due == today + timedelta(days=1):
+            return "tomorrow"
+        return "future"
+
+    # --- dict compatibility ---
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Issue({self.key!r}, due={self.duedate!r}, status={self.status!r})"
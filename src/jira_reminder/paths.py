@@ -5,7 +5,8 @@ import os
 import sys
 import pathlib
 
-MAGIC = b"JRM1"  # file header
+MAGIC = b"JRM1"  # file header: magic, salt, nonce, ciphertext (scrypt n=2**14, r=8, p=1)
+MAGIC_V2 = b"JRM2"  # file header followed by the scrypt parameters (n as log2, r, p), then as JRM1
 
 
 def _base_path() -> str:
@@ -46,12 +47,19 @@ def user_home() -> pathlib.Path:
 
 
 def app_dir() -> pathlib.Path:
-    p = user_home() / ".jira_reminder"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return user_home() / ".jira_reminder"
+
+
+def ensure_parent(path) -> pathlib.Path:
+    """Create the directory ``path`` lives in (the app dir is only created once something is written)."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 CONFIG_ENC_PATH = app_dir() / "config.enc"
 LOG_PATH = app_dir() / "jira_reminder.log"
 LOCK_PATH = str(app_dir() / "app.lock")
 CONFIG_PLAIN_PATH = app_dir() / "config.json"
+SNAPSHOT_PATH = app_dir() / "snapshot.json"
+STORE_PATH = app_dir() / "issues.sqlite3"
@@ -0,0 +1,72 @@
+# src/jira_reminder/reminders.py
+from __future__ import annotations
+
+from typing import List, NamedTuple
+
+from .logging_setup import log
+from .models import Issue
+from .resilience import JiraUnavailableError
+
+TODAY_PAGE = 50  # same key as the Today popup, so a click right after the digest shares the result
+
+
+class Notification(NamedTuple):
+    """A tray message: ``level`` is "info" or "warning", ``timeout_ms`` how long it stays up."""
+
+    text: str
+    level: str = "info"
+    timeout_ms: int = 10_000
+
+
+class ReminderRules:
+    """
+    What the scheduled reminders ask Jira and what they tell the user, without Qt.
+
+    The controller runs the Jira calls on its worker pool and shows the returned ``Notification``
+    in the tray; ``simulation.Simulation`` runs the very same calls inline on a virtual clock.
+    """
+
+    def __init__(self, client, assignee: str):
+        self.client = client
+        self.assignee = assignee
+
+    # --- morning digest ---
+
+    def today_jql(self) -> str:
+        return self.client.jql_for_day(self.assignee, "today")
+
+    def fetch_today(self) -> List[Issue]:
+        return self.client.search(self.today_jql(), max_results=TODAY_PAGE)
+
+    @staticmethod
+    def today_message(issues: List[Issue]) -> Notification | None:
+        if not issues:
+            return None
+        items = "\n".join([f"{x.key}: {x.summary}" for x in issues[:5]])
+        return Notification(f"Today's tasks:\n{items}", timeout_ms=12_000)
+
+    @staticmethod
+    def today_failed_message(e: Exception) -> Notification | None:
+        if isinstance(e, JiraUnavailableError):
+            return None  # the circuit breaker has already told the user
+        return Notification(f"Update error: {e}", level="warning", timeout_ms=8000)
+
+    # --- evening check ---
+
+    def has_closed_today(self) -> bool:
+        try:
+            jql = self.client.jql_closed_today(self.assignee)
+            log.debug("Checking closed today with JQL: %s", jql)
+            return self.client.count(jql) > 0
+        except JiraUnavailableError:
+            # unknown rather than "nothing closed": don't nag while Jira is down
+            raise
+        except Exception:
+            log.exception("has_closed_today failed")
+            return False
+
+    @staticmethod
+    def evening_message(has_closed: bool) -> Notification | None:
+        if has_closed:
+            return None
+        return Notification("No tasks completed today. Choose at least one and get it to Done 💪")
@@ -0,0 +1,133 @@
+# src/jira_reminder/render_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from . import metrics
+from .logging_setup import log
+
+SHADOW_BLUR = 22       # same look the per-card QGraphicsDropShadowEffect used to give
+SHADOW_OFFSET = 4
+SHADOW_ALPHA = 140
+CARD_RADIUS = 12
+PILL_CACHE_SIZE = 512  # due dates make pill texts fairly varied; keep the most recent ones
+
+
+class RenderCache:
+    """
+    Pre-rendered pieces of an issue card, so painting a card is a handful of pixmap blits.
+
+    The drop shadow is rendered (and blurred) once as a nine-patch and stretched to any card size;
+    badge pills are rendered once per text, colours and font. Everything is keyed by ``UI_SCALE``
+    and device pixel ratio: when either changes, the cache starts over.
+    """
+
+    def __init__(self):
+        self._key: tuple | None = None
+        self._shadow: QtGui.QPixmap | None = None
+        self._pills: OrderedDict[tuple, QtGui.QPixmap] = OrderedDict()
+
+    def _check(self, dpr: float) -> None:
+        key = (metrics.UI_SCALE, dpr)
+        if key != self._key:
+            if self._key is not None:
+                log.debug("Render cache reset for scale %.2f, dpr %.2f", *key)
+            self._key = key
+            self._shadow = None
+            self._pills.clear()
+
+    def clear(self) -> None:
+        self._key = None
+
+    # --- shadow ---
+
+    def _render_shadow(self, dpr: float) -> QtGui.QPixmap:
+        blur, radius = metrics.S(SHADOW_BLUR), metrics.S(CARD_RADIUS)
+        core = 2 * (blur + radius) + 2  # big enough for the blur to reach full opacity in the middle
+        side = core + 2 * blur
+        src = QtGui.QImage(int(side * dpr), int(side * dpr), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        src.setDevicePixelRatio(dpr)
+        src.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(src)
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        p.setPen(QtCore.Qt.PenStyle.NoPen)
+        p.setBrush(QtGui.QColor(0, 0, 0, SHADOW_ALPHA))
+        p.drawRoundedRect(QtCore.QRectF(blur, blur, core, core), radius, radius)
+        p.end()
+
+        # let Qt blur it exactly like the graphics effect did, but only this once
+        scene = QtWidgets.QGraphicsScene()
+        item = scene.addPixmap(QtGui.QPixmap.fromImage(src))
+        effect = QtWidgets.QGraphicsBlurEffect()
+        effect.setBlurRadius(blur)
+        item.setGraphicsEffect(effect)
+        out = QtGui.QImage(src.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        out.setDevicePixelRatio(dpr)
+        out.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(out)
+        scene.render(p, QtCore.QRectF(0, 0, side, side), QtCore.QRectF(0, 0, side, side))
+        p.end()
+        return QtGui.QPixmap.fromImage(out)
+
+    def draw_shadow(self, p: QtGui.QPainter, card: QtCore.QRectF) -> None:
+        """Paint the shadow of a card occupying ``card``: nine-patch corners, stretched edges and centre."""
+        dpr = p.device().devicePixelRatioF()
+        self._check(dpr)
+        if self._shadow is None:
+            self._shadow = self._render_shadow(dpr)
+        pix = self._shadow
+        blur, radius = metrics.S(SHADOW_BLUR), metrics.S(CARD_RADIUS)
+        m = 2 * blur + radius  # patch margin in logical px; leaves a 2 px stretchable centre
+        side = pix.width() / dpr
+        t = card.translated(0, metrics.S(SHADOW_OFFSET)).adjusted(-blur, -blur, blur, blur)
+
+        xs_dst = (t.left(), t.left() + m, t.right() - m, t.right())
+        ys_dst = (t.top(), t.top() + m, t.bottom() - m, t.bottom())
+        src_edges = (0, m, side - m, side)  # the patch is square
+        if xs_dst[2] < xs_dst[1] or ys_dst[2] < ys_dst[1]:
+            return  # card smaller than its own corners
+        for r in range(3):
+            for c in range(3):
+                dst = QtCore.QRectF(
+                    QtCore.QPointF(xs_dst[c], ys_dst[r]), QtCore.QPointF(xs_dst[c + 1], ys_dst[r + 1])
+                )
+                src = QtCore.QRectF(
+                    QtCore.QPointF(src_edges[c] * dpr, src_edges[r] * dpr),
+                    QtCore.QPointF(src_edges[c + 1] * dpr, src_edges[r + 1] * dpr),
+                )
+                p.drawPixmap(dst, pix, src)
+
+    # --- pills ---
+
+    def pill(self, p: QtGui.QPainter, font: QtGui.QFont, text: str, colors: tuple[str, str]) -> QtGui.QPixmap:
+        """A rounded badge with ``text`` in ``colors`` (background, foreground); its logical size is the pill size."""
+        dpr = p.device().devicePixelRatioF()
+        self._check(dpr)
+        key = (text, colors, font.key())
+        pix = self._pills.get(key)
+        if pix is not None:
+            self._pills.move_to_end(key)
+            return pix
+
+        fm = QtGui.QFontMetrics(font)
+        w, h = fm.horizontalAdvance(text) + metrics.S(16), fm.height() + metrics.S(4)
+        pix = QtGui.QPixmap(int(w * dpr), int(h * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+        bg, fg = colors
+        q = QtGui.QPainter(pix)
+        q.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        q.setPen(QtCore.Qt.PenStyle.NoPen)
+        q.setBrush(QtGui.QColor(bg))
+        q.drawRoundedRect(QtCore.QRectF(0, 0, w, h), metrics.S(10), metrics.S(10))
+        q.setFont(font)
+        q.setPen(QtGui.QColor(fg))
+        q.drawText(QtCore.QRectF(0, 0, w, h), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+        q.end()
+
+        self._pills[key] = pix
+        if len(self._pills) > PILL_CACHE_SIZE:
+            self._pills.popitem(last=False)
+        return pix
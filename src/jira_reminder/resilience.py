@@ -0,0 +1,138 @@
+# src/jira_reminder/resilience.py
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import requests
+
+from .logging_setup import log
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class JiraUnavailableError(requests.RequestException):
+    """Raised without touching the network while the circuit breaker is open."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Jira is unavailable, next attempt in {int(retry_in)} s")
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter; ``Retry-After`` wins when given."""
+
+    def __init__(self, retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Stops calling Jira after ``threshold`` consecutive failed requests.
+
+    While open every call fails fast with ``JiraUnavailableError``. After ``cooldown`` seconds one
+    trial request is let through (half-open); its outcome closes or re-opens the circuit.
+    ``on_change(state)`` is called on every state transition, from the calling thread.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        threshold: int = 3,
+        cooldown: float = 120.0,
+        on_change: Callable[[str], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.on_change = on_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def retry_in(self) -> float:
+        return max(0.0, self._open_until - self._clock())
+
+    def _set(self, state: str) -> bool:
+        # called with the lock held; the callback runs after release
+        if state != self._state:
+            log.warning("Jira circuit breaker: %s -> %s", self._state, state)
+            self._state = state
+            return True
+        return False
+
+    def _notify(self, changed: bool) -> None:
+        if changed and self.on_change:
+            try:
+                self.on_change(self._state)
+            except Exception:
+                log.exception("Circuit breaker callback failed")
+
+    def before_request(self) -> None:
+        with self._lock:
+            changed = False
+            if self._state == self.OPEN:
+                left = self._open_until - self._clock()
+                if left > 0:
+                    raise JiraUnavailableError(left)
+                changed = self._set(self.HALF_OPEN)
+                self._trial = True
+            elif self._state == self.HALF_OPEN:
+                if self._trial:
+                    raise JiraUnavailableError(0)
+                self._trial = True
+        self._notify(changed)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial = False
+            changed = self._set(self.CLOSED)
+        self._notify(changed)
+
+    def record_failure(self, open_for: float | None = None) -> None:
+        """Count a failed request; ``open_for`` (e.g. a long Retry-After) opens the circuit at once."""
+        with self._lock:
+            self._failures += 1
+            self._trial = False
+            changed = False
+            if open_for is not None or self._state == self.HALF_OPEN or self._failures >= self.threshold:
+                self._open_until = self._clock() + max(self.cooldown if open_for is None else open_for, 0.0)
+                changed = self._set(self.OPEN)
+        self._notify(changed)
@@ -0,0 +1,145 @@
+# src/jira_reminder/scheduler.py
+from __future__ import annotations
+
+from datetime import date, datetime, time as dtime, timedelta
+
+MORNING = "morning"    # today's tasks digest
+EVENING = "evening"    # "nothing closed today" check, repeated inside the evening window
+POLL = "poll"          # background sync
+MIDNIGHT = "midnight"  # day rollover
+
+# Upper bound for a single sleep: after a suspend/resume or a clock change the next
+# event is recomputed at most this late.
+MAX_SLEEP = timedelta(minutes=15)
+
+# the method each event runs on its target; JiraReminderController and simulation.Simulation both
+# implement all of them, so the app and its simulation cannot disagree on what the events are
+EVENT_HANDLERS = {MORNING: "on_morning", EVENING: "on_evening", POLL: "on_poll", MIDNIGHT: "on_midnight"}
+
+# plain config keys read by Schedule.from_config
+SCHEDULE_KEYS = ("morning_time", "evening_start", "evening_end", "evening_interval_minutes", "poll_minutes")
+
+
+def dispatch_event(target, event: str, now: datetime) -> None:
+    """Run ``event`` due at ``now`` on ``target`` (``target.on_<event>(now)``, see ``EVENT_HANDLERS``)."""
+    getattr(target, EVENT_HANDLERS[event])(now)
+
+
+def _parse_time(value, default: dtime) -> dtime:
+    if isinstance(value, dtime):
+        return value
+    try:
+        return dtime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class Schedule:
+    """When reminders and syncs happen. Built from plain config via ``from_config``."""
+
+    def __init__(
+        self,
+        morning: dtime = dtime(10, 0),
+        morning_grace: timedelta = timedelta(hours=1),
+        evening_start: dtime = dtime(16, 30),
+        evening_end: dtime = dtime(19, 0),
+        evening_every: timedelta = timedelta(minutes=30),
+        poll_every: timedelta = timedelta(minutes=5),
+    ):
+        self.morning = morning
+        self.morning_grace = morning_grace
+        self.evening_start = evening_start
+        self.evening_end = evening_end
+        self.evening_every = evening_every
+        self.poll_every = poll_every
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "Schedule":
+        d = cls()
+        return cls(
+            morning=_parse_time(cfg.get("morning_time"), d.morning),
+            evening_start=_parse_time(cfg.get("evening_start"), d.evening_start),
+            evening_end=_parse_time(cfg.get("evening_end"), d.evening_end),
+            evening_every=timedelta(minutes=int(cfg.get("evening_interval_minutes", 30))),
+            poll_every=timedelta(minutes=int(cfg.get("poll_minutes", 5))),
+        )
+
+
+class ReminderScheduler:
+    """
+    Qt-free scheduling state: which events are due at a moment and when the next one is.
+
+    ``due(now)`` returns the events to run at ``now`` and records them as done, so each event
+    fires exactly once no matter how often or how late it is asked. ``next_wakeup(now)`` gives
+    the earliest moment ``due`` will return something new.
+    """
+
+    def __init__(self, schedule: Schedule, now: datetime | None = None):
+        now = now or datetime.now()
+        self.schedule = schedule
+        self.day: date = now.date()
+        self.last_morning: date | None = None
+        self.last_evening: datetime | None = None
+        self.next_poll: datetime = now + schedule.poll_every
+
+    def set_schedule(self, schedule: Schedule, now: datetime | None = None) -> None:
+        now = now or datetime.now()
+        self.schedule = schedule
+        self.next_poll = min(self.next_poll, now + schedule.poll_every)
+
+    # --- rules ---
+
+    def _morning_at(self, day: date) -> datetime:
+        return datetime.combine(day, self.schedule.morning)
+
+    def _morning_due(self, now: datetime) -> bool:
+        start = self._morning_at(now.date())
+        return self.last_morning != now.date() and start <= now < start + self.schedule.morning_grace
+
+    def _in_evening(self, now: datetime) -> bool:
+        return self.schedule.evening_start <= now.time() <= self.schedule.evening_end
+
+    def _evening_due(self, now: datetime) -> bool:
+        if not self._in_evening(now):
+            return False
+        last = self.last_evening
+        return last is None or last.date() != now.date() or now - last >= self.schedule.evening_every
+
+    def due(self, now: datetime) -> list[str]:
+        events: list[str] = []
+        if now.date() > self.day:
+            self.day = now.date()
+            events.append(MIDNIGHT)
+        if self._morning_due(now):
+            self.last_morning = now.date()
+            events.append(MORNING)
+        if self._evening_due(now):
+            self.last_evening = now
+            events.append(EVENING)
+        if now >= self.next_poll:
+            self.next_poll = now + self.schedule.poll_every
+            events.append(POLL)
+        return events
+
+    def next_wakeup(self, now: datetime) -> datetime:
+        s = self.schedule
+        today = now.date()
+        tomorrow = today + timedelta(days=1)
+        candidates = [datetime.combine(tomorrow, dtime(0, 0)), self.next_poll, now + MAX_SLEEP]
+
+        morning = self._morning_at(today)
+        if self.last_morning != today and now < morning + s.morning_grace:
+            candidates.append(max(morning, now))
+        else:
+            candidates.append(self._morning_at(tomorrow))
+
+        ev_start = datetime.combine(today, s.evening_start)
+        ev_end = datetime.combine(today, s.evening_end)
+        nxt = ev_start
+        if self.last_evening is not None and self.last_evening.date() == today:
+            nxt = max(nxt, self.last_evening + s.evening_every)
+        nxt = max(nxt, now)
+        candidates.append(nxt if nxt <= ev_end else datetime.combine(tomorrow, s.evening_start))
+
+        return max(now, min(candidates))
+
@@ -4,15 +4,36 @@ from __future__ import annotations
 import os
 import json
 import uuid
+import atexit
+import struct
 import platform
 import getpass
+import threading
+from functools import lru_cache
 
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from .paths import CONFIG_ENC_PATH, MAGIC
+from .paths import CONFIG_ENC_PATH, MAGIC, MAGIC_V2
 from .logging_setup import log
 
+# scrypt parameters for newly written files: n = 2**KDF_N_LOG2. Stored in the JRM2 header,
+# so they can be raised later without breaking existing files.
+KDF_N_LOG2 = 14
+KDF_R = 8
+KDF_P = 1
+_V1_PARAMS = (14, 8, 1)  # implied by a JRM1 header
+
+_SALT_LEN = 16
+_NONCE_LEN = 12
+_PARAMS = struct.Struct(">BBB")
+
+# derived keys for this process, by (salt, n_log2, r, p); wiped on exit
+_key_cache: dict[tuple, bytearray] = {}
+_key_lock = threading.Lock()
+# salt of the config last read or written, reused on save so a save right after a load needs no KDF
+_current_salt: tuple[bytes, tuple] | None = None
+
 
 def _read_machine_id() -> str:
     mid = None
@@ -34,37 +55,96 @@ def _read_machine_id() -> str:
     return mid
 
 
-def _derive_key_scrypt(salt: bytes) -> bytes:
-    ident = f"{_read_machine_id()}::{getpass.getuser()}::{platform.platform()}".encode("utf-8")
-    kdf = Scrypt(salt=salt, length=32, n=2**14, r=8, p=1)
-    return kdf.derive(ident)
+@lru_cache(maxsize=1)
+def _machine_identity() -> bytes:
+    """Key material bound to this machine and user; does not change while the app runs."""
+    return f"{_read_machine_id()}::{getpass.getuser()}::{platform.platform()}".encode("utf-8")
+
+
+def _derive_key_scrypt(salt: bytes, params: tuple = _V1_PARAMS) -> bytes:
+    n_log2, r, p = params
+    key_id = (salt, n_log2, r, p)
+    with _key_lock:
+        key = _key_cache.get(key_id)
+        if key is None:
+            log.debug("Deriving config key (scrypt n=2**%d, r=%d, p=%d)", n_log2, r, p)
+            kdf = Scrypt(salt=salt, length=32, n=2**n_log2, r=r, p=p)
+            key = _key_cache[key_id] = bytearray(kdf.derive(_machine_identity()))
+        return bytes(key)
+
+
+def wipe_key_cache() -> None:
+    """Overwrite and forget every derived key (runs at exit)."""
+    global _current_salt
+    with _key_lock:
+        for key in _key_cache.values():
+            key[:] = bytes(len(key))
+        _key_cache.clear()
+        _current_salt = None
+
+
+atexit.register(wipe_key_cache)
 
 
 def encrypt_config(obj: dict) -> bytes:
+    global _current_salt
     raw = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
-    salt = os.urandom(16)
-    key = _derive_key_scrypt(salt)
+    params = (KDF_N_LOG2, KDF_R, KDF_P)
+    if _current_salt is not None and _current_salt[1] == params:
+        salt = _current_salt[0]
+    else:
+        salt = os.urandom(_SALT_LEN)
+    key = _derive_key_scrypt(salt, params)
     aes = AESGCM(key)
-    nonce = os.urandom(12)
-    ct = aes.encrypt(nonce, raw, None)
-    return MAGIC + salt + nonce + ct
+    nonce = os.urandom(_NONCE_LEN)  # always fresh: only the salt is reused
+    header = MAGIC_V2 + _PARAMS.pack(*params) + salt
+    ct = aes.encrypt(nonce, raw, header)  # the header is authenticated along with the payload
+    _current_salt = (salt, params)
+    return header + nonce + ct
+
+
+def _check_params(params: tuple) -> None:
+    """
+    Only the scrypt costs this app writes (JRM1's and the current ones) are accepted: the header is
+    only authenticated after the key is derived, and a forged one must not make us allocate
+    gigabytes or spin for minutes first.
+    """
+    written = (_V1_PARAMS, (KDF_N_LOG2, KDF_R, KDF_P))
+    n_log2, r, p = params
+    if not (
+        min(w[0] for w in written) <= n_log2 <= max(w[0] for w in written)
+        and r in {w[1] for w in written}
+        and p in {w[2] for w in written}
+    ):
+        raise ValueError(f"Unsupported config KDF parameters (n=2**{n_log2}, r={r}, p={p}).")
 
 
 def decrypt_config(blob: bytes) -> dict:
-    if not blob.startswith(MAGIC):
+    global _current_salt
+    if blob.startswith(MAGIC_V2):
+        params = _PARAMS.unpack_from(blob, len(MAGIC_V2))
+        _check_params(params)
+        pos = len(MAGIC_V2) + _PARAMS.size
+        aad = blob[:pos + _SALT_LEN]  # JRM2 authenticates its whole header: magic, KDF params, salt
+    elif blob.startswith(MAGIC):
+        params = _V1_PARAMS
+        pos = len(MAGIC)
+        aad = None
+    else:
         raise ValueError("Bad config file header.")
-    salt = blob[4:20]
-    nonce = blob[20:32]
-    ct = blob[32:]
-    key = _derive_key_scrypt(salt)
+    salt = blob[pos:pos + _SALT_LEN]
+    nonce = blob[pos + _SALT_LEN:pos + _SALT_LEN + _NONCE_LEN]
+    ct = blob[pos + _SALT_LEN + _NONCE_LEN:]
+    key = _derive_key_scrypt(salt, params)
     aes = AESGCM(key)
-    raw = aes.decrypt(nonce, ct, None)
+    raw = aes.decrypt(nonce, ct, aad)
+    _current_salt = (salt, params)
     return json.loads(raw.decode("utf-8"))
 
 
 def load_config() -> dict:
     data = CONFIG_ENC_PATH.read_bytes()
-    log.debug(f"Load Config PATH: {CONFIG_ENC_PATH}")
+    log.debug("Load Config PATH: %s", CONFIG_ENC_PATH)
     obj = decrypt_config(data)
     # Inject defaults if anything is missing
     obj.setdefault("project_keys", [])
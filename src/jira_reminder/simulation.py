@@ -0,0 +1,187 @@
+# src/jira_reminder/simulation.py
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from .logging_setup import log
+from .reminders import Notification, ReminderRules
+from .resilience import JiraUnavailableError
+from .scheduler import ReminderScheduler, Schedule, dispatch_event
+
+COUNTED_CALLS = ("search", "count", "iter_search", "search_page")
+
+
+class VirtualClock:
+    """A settable ``now()``; pass it wherever a clock is injectable (``EventScheduler(clock=...)``)."""
+
+    def __init__(self, start: datetime):
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, delta: timedelta) -> datetime:
+        self.now += delta
+        return self.now
+
+
+class _CountingClient:
+    """
+    Passes everything through to ``client`` and counts Jira requests per simulated day.
+
+    A real ``JiraClient`` is counted through its ``on_request`` hook, once per HTTP attempt, so
+    searches its cache answers cost nothing, as in the app; each is booked under the public method
+    that caused it. A fake without the hook is counted per call, ``iter_search`` per page.
+    """
+
+    def __init__(self, client, clock: VirtualClock):
+        self._client = client
+        self._clock = clock
+        self._method: str | None = None
+        self.calls: Counter = Counter()  # (day, method) -> requests
+        self.counts_http = hasattr(client, "on_request")
+        if self.counts_http:
+            client.on_request = lambda endpoint: self._count(self._method or "other")
+
+    def _count(self, method: str) -> None:
+        self.calls[(self._clock.now.date(), method)] += 1
+
+    def _call(self, name: str, fn, *args, **kwargs):
+        outer, self._method = self._method, name
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            self._method = outer
+        if not self.counts_http and (name != "iter_search" or result is not None):
+            self._count(name)
+        return result
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in COUNTED_CALLS:
+            return attr
+        if name == "iter_search":
+            def pages(*args, **kwargs):
+                it = attr(*args, **kwargs)
+                while True:
+                    page = self._call(name, next, it, None)
+                    if page is None:
+                        return
+                    yield page
+            return pages
+        return lambda *args, **kwargs: self._call(name, attr, *args, **kwargs)
+
+
+class Simulation:
+    """
+    The reminder schedule on a virtual clock, without Qt or real time passing.
+
+    ``ReminderScheduler`` decides when events happen and ``ReminderRules`` what is asked and
+    shown, exactly as in the app; the only difference is that Jira calls run inline against
+    ``client`` (normally a fake) instead of on the worker pool. Jumping from one wake-up to the
+    next makes a simulated week a matter of milliseconds. ``suspend`` models a sleeping laptop.
+    """
+
+    def __init__(
+        self,
+        client,
+        assignee: str,
+        schedule: Schedule | None = None,
+        start: datetime | None = None,
+        sync=None,
+    ):
+        self.clock = VirtualClock(start or datetime.combine(date.today(), datetime.min.time()))
+        if hasattr(client, "cache_ttl"):
+            # a real JiraClient: its search cache expires on simulated time, not wall-clock time
+            client.clock = lambda: self.clock.now.timestamp()
+        self.client = _CountingClient(client, self.clock)
+        self.rules = ReminderRules(self.client, assignee)
+        self.scheduler = ReminderScheduler(schedule or Schedule(), now=self.clock.now)
+        self.sync = sync  # IssueSync driving POLL/MIDNIGHT; its Jira calls are counted too
+        if sync is not None:
+            sync.client = self.client
+        self.events: List[Tuple[datetime, str]] = []
+        self.notifications: List[Tuple[datetime, Notification]] = []
+        self.today_issues: list = []
+
+    # --- driving ---
+
+    def step(self) -> datetime:
+        """Jump to the next wake-up and run what is due there."""
+        now = self.scheduler.next_wakeup(self.clock.now)
+        self.clock.now = now
+        for event in self.scheduler.due(now):
+            self.events.append((now, event))
+            dispatch_event(self, event, now)
+        return now
+
+    def run_until(self, end: datetime) -> "Simulation":
+        """Run every wake-up before ``end`` (exclusive), then stop the clock at ``end``."""
+        while self.scheduler.next_wakeup(self.clock.now) < end:
+            self.step()
+        self.clock.now = max(self.clock.now, end)
+        return self
+
+    def run(self, days: float = 7) -> "Simulation":
+        return self.run_until(self.clock.now + timedelta(days=days))
+
+    def suspend(self, until: datetime) -> "Simulation":
+        """The machine sleeps: no timers fire until ``until``, then it catches up like the app does."""
+        self.clock.now = max(self.clock.now, until)
+        return self
+
+    # --- what each event does (``scheduler.EVENT_HANDLERS``, as JiraReminderController) ---
+
+    def on_morning(self, now: datetime) -> None:
+        try:
+            self.today_issues = self.rules.fetch_today()
+            self._notify(now, ReminderRules.today_message(self.today_issues))
+        except Exception as e:
+            self._notify(now, ReminderRules.today_failed_message(e))
+
+    def on_evening(self, now: datetime) -> None:
+        try:
+            self._notify(now, ReminderRules.evening_message(self.rules.has_closed_today()))
+        except JiraUnavailableError:
+            pass
+
+    def on_poll(self, now: datetime) -> None:
+        if self.sync is None:
+            return
+        try:
+            self.sync.sync(now=now)
+        except Exception as e:
+            log.debug("Simulated poll failed: %s", e)
+
+    def on_midnight(self, now: datetime) -> None:
+        if self.sync is None:
+            return
+        self.sync.store.buckets(now.date())
+        try:
+            self.sync.sync(full=True, now=now)
+        except Exception as e:
+            log.debug("Simulated midnight sync failed: %s", e)
+
+    def _notify(self, now: datetime, note: Notification | None) -> None:
+        if note is not None:
+            self.notifications.append((now, note))
+
+    # --- results ---
+
+    def per_day(self) -> Dict[date, dict]:
+        """Per simulated day: Jira requests (total and by method), events fired and notifications shown."""
+        days: Dict[date, dict] = {}
+
+        def day(d: date) -> dict:
+            return days.setdefault(d, {"requests": 0, "calls": Counter(), "events": Counter(), "notifications": 0})
+
+        for (d, method), n in self.client.calls.items():
+            day(d)["requests"] += n
+            day(d)["calls"][method] += n
+        for at, event in self.events:
+            day(at.date())["events"][event] += 1
+        for at, _note in self.notifications:
+            day(at.date())["notifications"] += 1
+        return dict(sorted(days.items()))
@@ -0,0 +1,61 @@
+# src/jira_reminder/snapshot.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from . import paths
+from .logging_setup import log
+from .models import Issue
+
+SNAPSHOT_VERSION = 1
+
+# saves run on fetch-pool threads: one at a time, so they never share the temp file,
+# and a save older than the one already written is dropped
+_save_lock = threading.Lock()
+_saved: tuple[str, datetime] | None = None
+
+
+def save_snapshot(account: str, issues: list[Issue], fetched_at: datetime | None = None) -> None:
+    """
+    Persist the last window query result for ``account``.
+
+    The raw issue list is stored rather than the three blocks, so a snapshot loaded on a later
+    day is re-partitioned against that day.
+    """
+    global _saved
+    fetched_at = fetched_at or datetime.now()
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "account": account,
+        "fetched_at": fetched_at.isoformat(timespec="seconds"),
+        "issues": [Issue.from_dict(it).to_dict() for it in issues],
+    }
+    with _save_lock:
+        if _saved is not None and _saved[0] == account and fetched_at < _saved[1]:
+            log.debug("Snapshot from %s skipped: a newer one is already saved", fetched_at)
+            return
+        path = paths.ensure_parent(paths.SNAPSHOT_PATH)
+        tmp = path.with_suffix(".tmp")
+        # write-then-rename so a crash mid-write never leaves a truncated snapshot behind
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        _saved = (account, fetched_at)
+    log.debug("Snapshot saved: %d issues", len(issues))
+
+
+def load_snapshot(account: str) -> tuple[datetime, list[Issue]] | None:
+    """Return ``(fetched_at, issues)`` of the stored snapshot, or None if missing/foreign/corrupt."""
+    path = paths.SNAPSHOT_PATH
+    try:
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != SNAPSHOT_VERSION or data.get("account") != account:
+            return None
+        return datetime.fromisoformat(data["fetched_at"]), [Issue.from_dict(it) for it in data.get("issues") or []]
+    except Exception:
+        log.exception("Cannot read snapshot %s", path)
+        return None
@@ -0,0 +1,57 @@
+# src/jira_reminder/startup.py
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from .logging_setup import log
+
+_T0 = time.perf_counter()  # as close to process start as the package gets
+
+
+class StartupProfile:
+    """
+    Wall-clock timings of the startup phases, logged once the first data is on screen.
+
+    ``mark(phase)`` closes the phase that ran since the previous mark; ``finish(phase)`` closes the
+    last one and writes the report. Marks after ``finish`` are ignored, so the controller can mark
+    every refresh without checking whether startup is already over. ``on_finish`` runs once the
+    report is written (the app uses it to put the log back to its configured level). Qt-free.
+    """
+
+    def __init__(self, enabled: bool = False, t0: float | None = None):
+        self.enabled = enabled
+        self.t0 = _T0 if t0 is None else t0
+        self._last = self.t0
+        self.phases: list[tuple[str, float]] = []
+        self.finished = False
+        self.on_finish: Callable[[], None] | None = None
+
+    def mark(self, phase: str) -> None:
+        if self.finished:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def finish(self, phase: str) -> None:
+        if self.finished:
+            return
+        self.mark(phase)
+        self.finished = True
+        if self.enabled:
+            log.info("%s", self.report())
+        if self.on_finish is not None:
+            self.on_finish()
+
+    def total(self) -> float:
+        return self._last - self.t0
+
+    def report(self) -> str:
+        lines = ["Startup profile:"]
+        lines += [f"  {name:<20} {sec * 1000:8.1f} ms" for name, sec in self.phases]
+        lines.append(f"  {'total':<20} {self.total() * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+STARTUP = StartupProfile()  # enabled by ``--startup-profile``
@@ -0,0 +1,185 @@
+# src/jira_reminder/store.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping
+
+from .logging_setup import log
+from .models import Issue
+
+COLUMNS = Issue.FIELDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key             TEXT PRIMARY KEY,
+    summary         TEXT,
+    duedate         TEXT,
+    startdate       TEXT,
+    issuetype       TEXT,
+    project         TEXT,
+    priority        TEXT,
+    status          TEXT,
+    status_category TEXT,
+    updated         TEXT,
+    seen_at         TEXT NOT NULL,
+    assignee        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issues_duedate ON issues (duedate);
+CREATE INDEX IF NOT EXISTS idx_issues_startdate ON issues (startdate);
+CREATE INDEX IF NOT EXISTS idx_issues_status_category ON issues (status_category);
+CREATE INDEX IF NOT EXISTS idx_issues_priority ON issues (priority);
+CREATE INDEX IF NOT EXISTS idx_issues_project ON issues (project);
+
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_ORDER = "ORDER BY duedate IS NULL, duedate ASC, updated DESC"
+_ACTIVE = "COALESCE(status_category, '') != 'done'"
+
+
+class IssueStore:
+    """
+    Local SQLite table of issues keyed by issue key.
+
+    Done issues are kept as history; everything else is "active". A full sync replaces the active
+    rows, a delta sync upserts. Safe to use from the worker pool and the GUI thread.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", account: str | None = None):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+            self._migrate()
+        if account is not None:
+            self.set_account(account)
+
+    def _migrate(self) -> None:
+        # columns added after the first release; old rows read them as NULL until the next sync
+        have = {row[1] for row in self._db.execute("PRAGMA table_info(issues)")}
+        for column in ("assignee",):
+            if column not in have:
+                self._db.execute(f"ALTER TABLE issues ADD COLUMN {column} TEXT")
+
+    def set_account(self, account: str) -> None:
+        """Bind the store to ``account``; issues of any other account are dropped."""
+        if self.get_meta("account") != account:
+            # never show one account's issues to another
+            log.debug("Issue store belongs to another account, clearing %s", self.path)
+            self.clear()
+            self.set_meta("account", account)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # --- writes ---
+
+    def _insert(self, issues: Iterable[Mapping]) -> None:
+        # called inside a transaction
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [tuple(it.get(c) for c in COLUMNS) + (now,) for it in issues]
+        cols = ", ".join(COLUMNS) + ", seen_at"
+        marks = ", ".join("?" * (len(COLUMNS) + 1))
+        self._db.executemany(f"INSERT OR REPLACE INTO issues ({cols}) VALUES ({marks})", rows)
+
+    def upsert(self, issues: Iterable[Mapping]) -> None:
+        with self._lock, self._db:
+            self._insert(issues)
+
+    def replace_active(self, issues: Iterable[Mapping]) -> None:
+        """
+        Drop every active row and store ``issues`` (the result of a full window fetch), in one
+        transaction: readers never see an empty window, and a failure keeps the old one.
+        """
+        with self._lock, self._db:
+            self._db.execute(f"DELETE FROM issues WHERE {_ACTIVE}")
+            self._insert(issues)
+
+    def remove(self, keys: Iterable[str]) -> None:
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM issues WHERE key = ?", [(k,) for k in keys])
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM issues")
+            self._db.execute("DELETE FROM meta")
+
+    # --- reads ---
+
+    def _select(self, where: str = "1", params: tuple = (), limit: int | None = None) -> List[Issue]:
+        sql = f"SELECT {', '.join(COLUMNS)} FROM issues WHERE {where} {_ORDER}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return [Issue(*r) for r in self._db.execute(sql, params)]
+
+    def get(self, key: str) -> Issue | None:
+        rows = self._select("key = ?", (key,))
+        return rows[0] if rows else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def query(
+        self,
+        project: str | None = None,
+        status_category: str | None = None,
+        priority: str | None = None,
+        due_before: date | None = None,
+        include_done: bool = False,
+        limit: int | None = None,
+    ) -> List[Issue]:
+        """Filter stored issues; ``due_before`` matches due or start date strictly before it."""
+        where, params = [], []
+        if not include_done:
+            where.append(_ACTIVE)
+        if project:
+            where.append("project = ?")
+            params.append(project)
+        if status_category:
+            where.append("status_category = ?")
+            params.append(status_category)
+        if priority:
+            where.append("priority = ?")
+            params.append(priority)
+        if due_before:
+            where.append("(duedate < ? OR startdate < ?)")
+            params += [due_before.isoformat()] * 2
+        return self._select(" AND ".join(where) or "1", tuple(params), limit)
+
+    def window(self, today: date | None = None) -> List[Issue]:
+        """Active issues due or started on or before tomorrow, in window JQL order."""
+        tomorrow = ((today or date.today()) + timedelta(days=1)).isoformat()
+        return self._select(f"{_ACTIVE} AND (duedate <= ? OR startdate <= ?)", (tomorrow, tomorrow))
+
+    def buckets(self, today: date | None = None) -> Dict[str, List[Issue]]:
+        """Overdue/today/tomorrow straight from the table, e.g. for a midnight rollover."""
+        today = today or date.today()
+        d0, d1 = today.isoformat(), (today + timedelta(days=1)).isoformat()
+        return {
+            "overdue": self._select(f"{_ACTIVE} AND (duedate < ? OR startdate < ?)", (d0, d0)),
+            "today": self._select(f"{_ACTIVE} AND (duedate = ? OR startdate = ?)", (d0, d0)),
+            "tomorrow": self._select(f"{_ACTIVE} AND (duedate = ? OR startdate = ?)", (d1, d1)),
+        }
+
+    # --- sync bookkeeping ---
+
+    def get_meta(self, name: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str | None) -> None:
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
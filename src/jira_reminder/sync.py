@@ -0,0 +1,123 @@
+# src/jira_reminder/sync.py
+from __future__ import annotations
+
+import math
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List
+
+from .jira_client import JiraClient, MAX_PAGE_SIZE
+from .logging_setup import log
+from .models import Issue
+from .store import IssueStore
+
+WINDOW_LIMIT = 1000  # safety cap for a full window fetch
+
+
+def _window_order(issues: List[Issue]) -> List[Issue]:
+    """Same order as the window JQL: ``ORDER BY duedate ASC, updated DESC`` (no due date last)."""
+    res = sorted(issues, key=lambda x: x.updated or "", reverse=True)
+    res.sort(key=lambda x: (x.due is None, x.due or date.min))
+    return res
+
+
+class IssueSync:
+    """
+    Keeps an ``IssueStore`` current with incremental queries.
+
+    A full sync replaces the active issues in the store with the result of ``jql_window``. A delta
+    sync only asks for issues updated since the previous sync (plus ``overlap``) and upserts them;
+    done issues stay in the store as history and issues moved out of the window simply stop
+    matching ``IssueStore.window``. Removals that a delta cannot see (e.g. reassignment to someone
+    else) are picked up by the periodic full sync every ``full_every``.
+
+    Sync times are kept in the store, so with a persistent store a restart continues with a delta.
+    """
+
+    def __init__(
+        self,
+        client: JiraClient,
+        assignee_email: str,
+        full_every: timedelta = timedelta(hours=1),
+        overlap: timedelta = timedelta(minutes=2),
+        store: IssueStore | None = None,
+    ):
+        self.client = client
+        self.assignee = assignee_email
+        self.full_every = full_every
+        self.overlap = overlap
+        self.store = store or IssueStore()
+        self.truncated = False  # last full sync stopped at WINDOW_LIMIT
+        self.window_token: str | None = None  # where the truncated window fetch stopped
+        self.full_syncs = 0  # completed full syncs, so callers can tell a full cycle from a delta
+        self._lock = threading.Lock()
+
+    def _get_time(self, name: str) -> datetime | None:
+        val = self.store.get_meta(name)
+        try:
+            return datetime.fromisoformat(val) if val else None
+        except ValueError:
+            return None
+
+    @property
+    def last_sync(self) -> datetime | None:
+        return self._get_time("last_sync")
+
+    @property
+    def last_full(self) -> datetime | None:
+        return self._get_time("last_full")
+
+    def needs_full(self, now: datetime) -> bool:
+        last_sync, last_full = self.last_sync, self.last_full
+        if last_full is None or last_sync is None or last_sync > now:
+            return True
+        return now - last_full >= self.full_every
+
+    def window_issues(self, today: date | None = None) -> List[Issue]:
+        return self.store.window(today)
+
+    def iter_sync(self, full: bool = False, now: datetime | None = None) -> Iterator[List[Issue]]:
+        """
+        Bring the table up to date and yield the current window issues. A full sync yields after
+        every page so callers can render progressively; a delta sync yields once.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            if full or self.needs_full(now):
+                yield from self._full(now)
+            else:
+                yield self._delta(now)
+
+    def sync(self, full: bool = False, now: datetime | None = None) -> List[Issue]:
+        res: List[Issue] = []
+        for res in self.iter_sync(full, now):
+            pass
+        return res
+
+    def _full(self, now: datetime) -> Iterator[List[Issue]]:
+        fetched: Dict[str, Issue] = {}
+        jql = self.client.jql_window(self.assignee)
+        token = None
+        for page in self.client.iter_search(jql, page_size=MAX_PAGE_SIZE, limit=WINDOW_LIMIT):
+            token = getattr(page, "next_token", None)
+            for it in map(Issue.from_dict, page):
+                fetched[it.key] = it
+            yield _window_order(list(fetched.values()))
+        self.truncated = len(fetched) >= WINDOW_LIMIT
+        self.window_token = token if self.truncated else None
+        self.store.replace_active(fetched.values())
+        self.full_syncs += 1
+        self.store.set_meta("last_sync", now.isoformat())
+        self.store.set_meta("last_full", now.isoformat())
+        log.debug("Full sync: %d issues", len(fetched))
+        if not fetched:
+            yield []
+
+    def _delta(self, now: datetime) -> List[Issue]:
+        minutes = math.ceil((now - self.last_sync + self.overlap).total_seconds() / 60)
+        jql = self.client.jql_updated_since(self.assignee, minutes)
+        changed = self.client.search(jql, max_results=WINDOW_LIMIT, use_cache=False)
+        self.store.upsert(changed)
+        self.store.set_meta("last_sync", now.isoformat())
+        log.debug("Delta sync over %d min: %d changed, %d in store", minutes, len(changed), self.store.count())
+        return self.window_issues(now.date())
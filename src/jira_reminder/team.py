@@ -0,0 +1,90 @@
+# src/jira_reminder/team.py
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, Iterable, Iterator, List
+
+from .jira_client import MAX_PAGE_SIZE, POOL_SIZE, partition_buckets
+from .logging_setup import log
+from .models import Issue
+from .sync import WINDOW_LIMIT
+
+TEAM_CHUNK = 20  # assignees per `assignee in (...)` query
+UNKNOWN = "(unknown)"  # issues whose assignee the response does not name
+
+
+def team_members(value) -> List[str]:
+    """``team_assignees`` from the config (a list or a comma-separated string): lower case, no duplicates."""
+    if isinstance(value, str):
+        value = value.split(",")
+    members: List[str] = []
+    for email in value or []:
+        email = str(email).strip().lower()
+        if email and email not in members:
+            members.append(email)
+    return members
+
+
+def chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    size = max(1, size)
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def fetch_team(
+    client,
+    assignees: Iterable[str],
+    chunk_size: int = TEAM_CHUNK,
+    today: date | None = None,
+    workers: int = POOL_SIZE,
+) -> Dict[str, Dict[str, List[Issue]]]:
+    """
+    The window query for a whole team: assignee -> overdue/today/tomorrow.
+
+    One ``assignee in (...)`` query per ``chunk_size`` people instead of one per person and block;
+    the chunks run concurrently on the client's session (one pooled connection each), and the
+    result is split per assignee and bucket locally. Every requested assignee gets an entry.
+    Where a profile hides the e-mail (the Cloud default), Jira answers with the account id: the
+    requested e-mails that got no issues are then looked up once by user search and those issues
+    filed under the e-mail. Account ids that match nobody stay under the id (or ``UNKNOWN``)
+    rather than being dropped.
+    """
+    people = team_members(list(assignees))
+    batches = list(chunked(people, chunk_size))
+
+    def fetch(batch: List[str]) -> List[Issue]:
+        jql = client.jql_window(batch)
+        limit = WINDOW_LIMIT * len(batch)
+        return [it for page in client.iter_search(jql, page_size=MAX_PAGE_SIZE, limit=limit) for it in page]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(batches), workers)), thread_name_prefix="team") as pool:
+        results = list(pool.map(fetch, batches))
+    log.debug("Team window: %d assignees in %d queries", len(people), len(batches))
+
+    by_person: Dict[str, List[Issue]] = {p: [] for p in people}
+    hidden: Dict[str, List[Issue]] = {}  # account id -> issues, where the e-mail is not shown
+    for issues in results:
+        for it in issues:
+            who = it.assignee or UNKNOWN
+            (by_person if who in by_person else hidden).setdefault(who, []).append(it)
+    if hidden:
+        by_person.update(_file_hidden(client, [p for p in people if not by_person[p]], hidden, workers))
+    return {p: partition_buckets(issues, today) for p, issues in by_person.items()}
+
+
+def _file_hidden(
+    client, emails: List[str], hidden: Dict[str, List[Issue]], workers: int
+) -> Dict[str, List[Issue]]:
+    """File the issues of hidden e-mails under the requested e-mail their account id belongs to."""
+    accounts: Dict[str, str] = {}
+    if emails and set(hidden) - {UNKNOWN}:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(emails), workers)), thread_name_prefix="team") as pool:
+            accounts = {a: e for e, a in zip(emails, pool.map(client.account_id, emails)) if a}
+    filed: Dict[str, List[Issue]] = {}
+    for account, issues in hidden.items():
+        filed.setdefault(accounts.get(account, account), []).extend(issues)
+    unmatched = sorted(set(hidden) - set(accounts))
+    if unmatched:
+        log.warning("Team window: no requested e-mail for assignee(s) %s (e-mail hidden)", ", ".join(unmatched))
+    return filed
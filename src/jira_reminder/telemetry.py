@@ -0,0 +1,204 @@
+# src/jira_reminder/telemetry.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from .logging_setup import log
+
+# seconds; wide enough for a 30 s Jira timeout at the top
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+ROLLING_SAMPLES = 512  # recent observations kept per histogram for percentiles
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Cumulative bucket counts since start, plus the most recent samples for percentiles."""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "recent")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.recent: deque = deque(maxlen=ROLLING_SAMPLES)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.recent.append(value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {str(le): n for le, n in zip((*self.buckets, "+Inf"), self.counts)},
+        }
+
+
+class Telemetry:
+    """
+    In-memory counters and timing histograms, labelled Prometheus-style.
+
+    Recording is a dict lookup under a lock, cheap enough for every HTTP request and block render.
+    Read it back with ``snapshot()``, ``dump(path)`` (JSON) or ``to_prometheus()``; ``serve(port)``
+    exposes the latter on ``http://127.0.0.1:<port>/metrics``. Qt-free and thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[tuple[str, Labels], float] = {}
+        self._histograms: Dict[tuple[str, Labels], Histogram] = {}
+        self.started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def span(self, name: str, **labels) -> Iterator[None]:
+        """Time the block into histogram ``name`` (seconds), also when it raises."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get((name, _labels(labels)), 0)
+
+    def histogram(self, name: str, **labels) -> Histogram | None:
+        with self._lock:
+            return self._histograms.get((name, _labels(labels)))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    # --- export ---
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in sorted(self._counters.items())]
+            histograms = [
+                {"name": n, "labels": dict(l), **h.to_dict()} for (n, l), h in sorted(self._histograms.items())
+            ]
+        return {"started": self.started, "taken": time.time(), "counters": counters, "histograms": histograms}
+
+    def dump(self, path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        log.debug("Metrics written to %s", path)
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        typed: set = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}{_fmt_labels(labels)} {_fmt_num(value)}")
+            for (name, labels), hist in sorted(self._histograms.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} histogram")
+                total = 0
+                for le, n in zip((*hist.buckets, "+Inf"), hist.counts):
+                    total += n
+                    lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', str(le)),))} {total}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {_fmt_num(hist.sum)}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> "MetricsServer":
+        return MetricsServer(self, port, host)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _fmt_num(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsServer:
+    """Prometheus text endpoint (``GET /metrics``) on a daemon thread; local only by default."""
+
+    def __init__(self, telemetry: Telemetry, port: int, host: str = "127.0.0.1"):
+        registry = telemetry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                log.debug("metrics endpoint: " + fmt, *args)
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        log.debug("Metrics endpoint on http://%s:%d/metrics", host, self.port)
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+TELEMETRY = Telemetry()  # the application's metrics
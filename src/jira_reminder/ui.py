@@ -1,10 +1,11 @@
 # src/jira_reminder/ui.py
 from __future__ import annotations
 
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 
 from PyQt6 import QtWidgets, QtGui, QtCore
 
+from . import metrics
 from .metrics import (
     S,
     BLOCK_WIDTH_PX,
@@ -15,281 +16,388 @@ from .metrics import (
     APP_NAME,
 )
 from .logging_setup import log
-
-
-class FlowLayout(QtWidgets.QLayout):
-    def __init__(self, parent=None, margin=0, hspacing=6, vspacing=6):
+from .config import CONFIG, ConfigStore
+from .models import Issue
+from .render_cache import CARD_RADIUS, RenderCache
+from .telemetry import TELEMETRY
+
+RENDER_CACHE = RenderCache()  # shared by every card view
+
+
+ISSUE_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
+URL_ROLE = QtCore.Qt.ItemDataRole.UserRole + 2
+
+# card palette (painted by IssueCardDelegate)
+CARD_BG = "#1e1f24"
+CARD_BORDER = {"overdue": "#ff6b6b", "today": "#ffd166", "tomorrow": "#06d6a0"}
+CARD_BORDER_DEFAULT = "#3a3f44"
+BADGE_DEFAULT = ("#2b3036", "#c9d1d9")
+DUE_BADGE = {
+    "overdue": ("#3a0f0f", "#ff9b9b"),
+    "today": ("#3a2e0f", "#ffd166"),
+    "tomorrow": ("#103528", "#06d6a0"),
+    "future": ("#2b3036", "#9aa5b1"),
+    "none": ("#2b3036", "#9aa5b1"),
+}
+PRIORITY_BADGE = {
+    "Highest": ("#3a0f0f", "#ff9b9b"),
+    "High": ("#3a220f", "#ffb27a"),
+    "Medium": ("#243248", "#8ab8ff"),
+    "Low": ("#123a22", "#5ad1a0"),
+    "Lowest": ("#2b3036", "#aab2bd"),
+}
+STATUS_BADGE = {
+    "done": ("#103528", "#06d6a0"),
+    "inprogress": ("#20324a", "#8ab8ff"),
+    "todo": ("#3a2e0f", "#ffd166"),
+    "other": ("#2b3036", "#c9d1d9"),
+}
+
+
+class IssueListModel(QtCore.QAbstractListModel):
+    """
+    Issues of one block. Rows are exposed to the view in batches of ``batch`` as it scrolls
+    (``canFetchMore``/``fetchMore``); once every known issue is shown and ``total`` says Jira has
+    more, ``moreRequested`` asks the owner to load them.
+    """
+
+    moreRequested = QtCore.pyqtSignal()
+
+    def __init__(self, parent=None, batch: int = 50):
         super().__init__(parent)
-        self._items: list[QtWidgets.QLayoutItem] = []
-        self.setContentsMargins(margin, margin, margin, margin)
-        self._hspace = hspacing
-        self._vspace = vspacing
-
-    def addItem(self, item): self._items.append(item)
-    def count(self): return len(self._items)
-    def itemAt(self, i): return self._items[i] if 0 <= i < len(self._items) else None
-    def takeAt(self, i): return self._items.pop(i) if 0 <= i < len(self._items) else None
-    def expandingDirections(self): return QtCore.Qt.Orientation(0)
-    def hasHeightForWidth(self): return True
-
-    def heightForWidth(self, width):
-        return self._doLayout(QtCore.QRect(0, 0, width, 0), testOnly=True)
-
-    def setGeometry(self, rect):
-        super().setGeometry(rect)
-        self._doLayout(rect, testOnly=False)
-
-    def sizeHint(self):
-        return self.minimumSize()
-
-    def minimumSize(self):
-        s = QtCore.QSize(0, 0)
-        m = self.contentsMargins()
-        for item in self._items:
-            s = s.expandedTo(item.sizeHint())
-        s += QtCore.QSize(m.left() + m.right(), m.top() + m.bottom())
-        return s
-
-    def _doLayout(self, rect, testOnly):
-        m = self.contentsMargins()
-        effectiveRect = rect.adjusted(m.left(), m.top(), -m.right(), -m.bottom())
-        x = effectiveRect.x()
-        y = effectiveRect.y()
-        lineHeight = 0
-
-        for item in self._items:
-            spaceX = self._hspace
-            spaceY = self._vspace
-            nextX = x + item.sizeHint().width() + spaceX
-            if nextX - spaceX > effectiveRect.right() and lineHeight > 0:
-                x = effectiveRect.x()
-                y = y + lineHeight + spaceY
-                nextX = x + item.sizeHint().width() + spaceX
-                lineHeight = 0
-            if not testOnly:
-                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), item.sizeHint()))
-            x = nextX
-            lineHeight = max(lineHeight, item.sizeHint().height())
-        return y + lineHeight - rect.y() + m.bottom()
-
-
-class IssueCard(QtWidgets.QFrame):
-    clicked = QtCore.pyqtSignal(str)  # url
-
-    def __init__(self, issue: dict, url_builder, parent=None):
+        self.batch = batch
+        self.total: int | None = None
+        self._issues: list[Issue] = []
+        self._shown = 0
+        self._url_builder = None
+        self._more_pending = False
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._shown
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._shown:
+            return None
+        it = self._issues[index.row()]
+        if role == ISSUE_ROLE:
+            return it
+        if role == URL_ROLE:
+            return self._url_builder(it.key) if self._url_builder else None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return it.key
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return it.summary
+        return None
+
+    def issues(self) -> list[Issue]:
+        return list(self._issues)
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._shown < len(self._issues) or self._wants_remote()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        if self._shown < len(self._issues):
+            end = min(len(self._issues), self._shown + self.batch)
+            self.beginInsertRows(QtCore.QModelIndex(), self._shown, end - 1)
+            self._shown = end
+            self.endInsertRows()
+        elif self._wants_remote():
+            self._more_pending = True
+            self.moreRequested.emit()
+
+    def _wants_remote(self) -> bool:
+        return not self._more_pending and self.total is not None and self.total > len(self._issues)
+
+    def set_issues(self, issues: list[Issue], url_builder=None) -> None:
+        """
+        Replace the issues, keyed by issue key. When the shown keys stay in the same order only the
+        changed rows are reported (``dataChanged``) and rows are appended or dropped at the end, so
+        the view keeps its scroll position and repaints just what changed. A reordering with the
+        same number of rows shown (a poll moving an issue) is a layout change that carries the
+        current and selected rows along by key; only a reordering that also resizes resets.
+        """
+        new = list(dict((it.key, it) for it in map(Issue.from_dict, issues)).values())
+        self._url_builder = url_builder or self._url_builder
+        self._more_pending = False
+        shown = min(len(new), max(self._shown, self.batch))
+        old_keys = [it.key for it in self._issues[: self._shown]]
+        new_keys = [it.key for it in new[:shown]]
+        common = min(len(old_keys), len(new_keys))
+
+        if old_keys[:common] != new_keys[:common]:
+            if shown != self._shown:
+                self.beginResetModel()
+                self._issues, self._shown = new, shown
+                self.endResetModel()
+                return
+            rows = {key: r for r, key in enumerate(new_keys)}
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            moved = [
+                self.index(rows[old_keys[i.row()]]) if old_keys[i.row()] in rows else QtCore.QModelIndex()
+                for i in persistent
+            ]
+            self._issues = new
+            self.changePersistentIndexList(persistent, moved)
+            self.layoutChanged.emit()
+            return
+
+        changed = [r for r in range(common) if self._issues[r] != new[r]]
+        if self._shown > shown:
+            self.beginRemoveRows(QtCore.QModelIndex(), shown, self._shown - 1)
+            self._issues, self._shown = new, shown
+            self.endRemoveRows()
+        elif shown > self._shown:
+            self.beginInsertRows(QtCore.QModelIndex(), self._shown, shown - 1)
+            self._issues, self._shown = new, shown
+            self.endInsertRows()
+        else:
+            self._issues = new
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+
+    def append_issues(self, issues: list[Issue]) -> None:
+        """
+        Add issues loaded past the known ones (keys already there are skipped). After a
+        ``moreRequested`` the view is scrolled to the end, so the first batch is revealed at once
+        (or, with nothing new, the next page is asked for).
+        """
+        keys = {it.key for it in self._issues}
+        for it in map(Issue.from_dict, issues):
+            if it.key not in keys:
+                keys.add(it.key)
+                self._issues.append(it)
+        if self._more_pending:
+            self._more_pending = False
+            self.fetchMore()
+
+    def cancel_more(self) -> None:
+        """The ``moreRequested`` page failed: let the next scroll ask again."""
+        self._more_pending = False
+
+
+class IssueCardDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints an issue as a card: key and due pill, two lines of summary, type/priority/status pills.
+    The shadow and the pills come pre-rendered from a ``RenderCache``.
+    """
+
+    def __init__(self, parent=None, cache: RenderCache | None = None):
         super().__init__(parent)
-        self.setObjectName("Card")
-        self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-
-        shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(22)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QtGui.QColor(0, 0, 0, 140))
-        self.setGraphicsEffect(shadow)
-
-        self.issue = issue
-        self.url = url_builder(issue["key"])
-
-        key_lbl = QtWidgets.QLabel(f"<b>{issue['key']}</b>")
-        key_lbl.setTextFormat(QtCore.Qt.TextFormat.RichText)
-        key_lbl.setToolTip(issue.get("summary") or "")
-
-        summary = QtWidgets.QLabel(issue.get("summary") or "(no summary)")
-        summary.setWordWrap(True)
-        summary.setObjectName("Summary")
-        summary.setSizePolicy(
-            QtWidgets.QSizePolicy.Policy.Expanding,
-            QtWidgets.QSizePolicy.Policy.Preferred,
-        )
-        # ensure multi-line text is top-aligned inside its layout cell
-        summary.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignLeft)
-
-        due = issue.get("duedate")
-        due_lbl = QtWidgets.QLabel(self._due_text(due))
-        due_state = self._due_state(due)
-        due_lbl.setObjectName("DuePill")
-        due_lbl.setProperty("state", due_state)
-
-        top = QtWidgets.QHBoxLayout()
-        top.addWidget(key_lbl)
-        top.addStretch(1)
-        top.addWidget(due_lbl)
-
-        itype = issue.get("issuetype") or "Issue"
-        prio = (issue.get("priority") or "").strip() or "—"
-        stat = (issue.get("status") or "").strip() or "—"
-
-        badges = FlowLayout(hspacing=S(6), vspacing=S(6))
-
-        def _badge(text, objname, **props):
-            lbl = QtWidgets.QLabel(text)
-            lbl.setObjectName(objname)
-            lbl.setProperty("badge", True)
-            for k, v in props.items():
-                lbl.setProperty(k, v)
-            return lbl
-
-        badges.addWidget(_badge(itype, "TypeBadge"))
-        badges.addWidget(_badge(f"Priority: {prio}", "PriorityBadge", level=prio))
-        badges.addWidget(_badge(f"Status: {stat}", "StatusBadge", state=self._status_state(stat)))
-
-        badges.addItem(
-            QtWidgets.QSpacerItem(
-                0,
-                0,
-                QtWidgets.QSizePolicy.Policy.Expanding,
-                QtWidgets.QSizePolicy.Policy.Minimum,
-            )
-        )
+        self.cache = cache or RENDER_CACHE
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return QtCore.QSize(option.rect.width(), CARD_HEIGHT_PX() + GAP_PX())
+
+    def paint(self, p: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        it: Issue | None = index.data(ISSUE_ROLE)
+        if it is None:
+            return
+        due_state = it.due_state()
+        hover = bool(option.state & QtWidgets.QStyle.StateFlag.State_MouseOver)
+        card = QtCore.QRectF(option.rect).adjusted(1, 1, -1, -GAP_PX() - 1)
+        radius = S(CARD_RADIUS)
+
+        p.save()
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        self.cache.draw_shadow(p, card)
+
+        border = QtGui.QColor(CARD_BORDER.get(due_state, CARD_BORDER_DEFAULT))
+        p.setPen(QtGui.QPen(border.lighter(130) if hover else border, 1))
+        p.setBrush(QtGui.QColor(CARD_BG))
+        p.drawRoundedRect(card, radius, radius)
+
+        inner = card.adjusted(S(14), S(12), -S(14), -S(12))
+        font = QtGui.QFont(option.font)
+        fm = QtGui.QFontMetrics(font)
+        line = fm.height()
+
+        # key + due pill
+        due_text = f"Due {it.duedate}" if it.due else "No due"
+        pill_w = self._pill(p, font, due_text, DUE_BADGE[due_state], inner.right(), inner.top(), align_right=True)
+        bold = QtGui.QFont(font)
+        bold.setBold(True)
+        p.setFont(bold)
+        p.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        key_rect = QtCore.QRectF(inner.left(), inner.top(), inner.width() - pill_w - S(8), line + S(4))
+        p.drawText(key_rect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, it.key)
+
+        # summary, at most two lines
+        p.setFont(font)
+        p.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        top = key_rect.bottom() + S(6)
+        summary_rect = QtCore.QRectF(inner.left(), top, inner.width(), line * 2)
+        p.drawText(summary_rect, int(QtCore.Qt.TextFlag.TextWordWrap) | int(QtCore.Qt.AlignmentFlag.AlignTop),
+                   self._two_lines(fm, it.summary or "(no summary)", int(inner.width())))
+
+        # badges
+        prio = (it.priority or "").strip() or "—"
+        stat = (it.status or "").strip() or "—"
+        x = inner.left()
+        y = summary_rect.bottom() + S(8)
+        for text, colors in (
+            (it.issuetype or "Issue", BADGE_DEFAULT),
+            (f"Priority: {prio}", PRIORITY_BADGE.get(it.priority_level.label, BADGE_DEFAULT)),
+            (f"Status: {stat}", STATUS_BADGE[it.status_state]),
+        ):
+            x += self._pill(p, font, text, colors, x, y) + S(6)
+        p.restore()
+
+    def _pill(self, p: QtGui.QPainter, font: QtGui.QFont, text: str, colors: tuple[str, str], x: float, y: float,
+              align_right: bool = False) -> float:
+        pix = self.cache.pill(p, font, text, colors)
+        w = pix.width() / pix.devicePixelRatio()
+        p.drawPixmap(QtCore.QPointF(x - w if align_right else x, y), pix)
+        return w
 
-        btn_open = QtWidgets.QPushButton("Open")
-        btn_open.clicked.connect(lambda: self.clicked.emit(self.url))
-        actions = QtWidgets.QHBoxLayout()
-        actions.addStretch(1)
-        actions.addWidget(btn_open)
-
-        lay = QtWidgets.QVBoxLayout(self)
-        lay.setContentsMargins(14, 12, 14, 12)
-        lay.setSpacing(8)
-        lay.addLayout(top)
-        lay.addWidget(summary)
-        lay.addLayout(badges)
-        lay.addLayout(actions)
-
-        self.setProperty("state", due_state)
-
-        sp = self.sizePolicy()
-        sp.setHorizontalPolicy(QtWidgets.QSizePolicy.Policy.Expanding)
-        sp.setVerticalPolicy(QtWidgets.QSizePolicy.Policy.Fixed)
-        self.setSizePolicy(sp)
-
-        log.debug(f"The IssueCard for {issue['key']} is initialized")
-
-    def mousePressEvent(self, e: QtGui.QMouseEvent) -> None:
-        if e.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.url)
-        super().mousePressEvent(e)
-
-    def _due_text(self, iso: str | None) -> str:
-        if not iso:
-            return "No due"
-        return f"Due {iso}"
-
-    def _due_state(self, iso: str | None) -> str:
-        if not iso:
-            return "none"
-        try:
-            d = datetime.fromisoformat(iso).date()
-        except Exception:
-            return "none"
-        today = date.today()
-        if d < today:
-            return "overdue"
-        if d == today:
-            return "today"
-        if d == today + timedelta(days=1):
-            return "tomorrow"
-        return "future"
-
-    def _status_state(self, name: str) -> str:
-        n = (name or "").strip().lower()
-        if n in {"done", "resolved", "closed", "accepted"}:
-            return "done"
-        if n in {"in progress", "implementing", "in review"}:
-            return "inprogress"
-        if n in {"to do", "todo", "backlog", "open"}:
-            return "todo"
-        return "other"
+    @staticmethod
+    def _two_lines(fm: QtGui.QFontMetrics, text: str, width: int) -> str:
+        """Word-wrap ``text`` into two lines, eliding the second one."""
+        words = text.split()
+        first = ""
+        while words and fm.horizontalAdvance((first + " " + words[0]).strip()) <= width:
+            first = (first + " " + words.pop(0)).strip()
+        if not first and words:
+            return fm.elidedText(text, QtCore.Qt.TextElideMode.ElideRight, width)
+        rest = " ".join(words)
+        return first + ("\n" + fm.elidedText(rest, QtCore.Qt.TextElideMode.ElideRight, width) if rest else "")
+
+
+class _TimedListView(QtWidgets.QListView):
+    """List view that reports how long painting its visible cards takes (``ui_block_paint_seconds``)."""
+
+    def __init__(self, block: str, parent=None):
+        super().__init__(parent)
+        self.block = block
+
+    def paintEvent(self, e):
+        with TELEMETRY.span("ui_block_paint_seconds", block=self.block):
+            super().paintEvent(e)
 
 
 class IssuesCardList(QtWidgets.QWidget):
+    """
+    One block (Overdue/Today/Tomorrow): a header and every issue of the bucket as a painted card.
+    Only the rows in view are painted, so a bucket of thousands of issues costs no more widgets
+    than an empty one.
+    """
+
     openLink = QtCore.pyqtSignal(str)
 
     def __init__(self, title: str, parent=None):
         super().__init__(parent)
+        self._title = title
+        self._total: int | None = None
+        self._stale_at: datetime | None = None
         self.label = QtWidgets.QLabel(f"<b>{title}</b>")
 
-        self.container = QtWidgets.QWidget()
-        self.vbox = QtWidgets.QVBoxLayout(self.container)
-        self.vbox.setContentsMargins(0, 0, 0, 0)
-        self.vbox.setSpacing(GAP_PX())
-
-        self.scroll = QtWidgets.QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll.setWidget(self.container)
-
-        self.show_more_btn = QtWidgets.QPushButton("Show more")
-        self.show_more_btn.setFixedHeight(SHOW_MORE_H_PX())
+        self.model = IssueListModel(self)
+        self.view = _TimedListView(title)
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(IssueCardDelegate(self.view))
+        self.view.setUniformItemSizes(True)
+        self.view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.view.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.view.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.view.setMouseTracking(True)
+        self.view.viewport().setAutoFillBackground(False)
+        self.view.setStyleSheet("QListView { background: transparent; }")
+        self.view.clicked.connect(self._on_clicked)
+
+        self.show_more_btn = QtWidgets.QPushButton("Open in Jira")
         self.show_more_btn.setVisible(False)
         self.show_more_btn.clicked.connect(self._open_more)
 
-        lay = QtWidgets.QVBoxLayout(self)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.setSpacing(GAP_PX())
-        lay.addWidget(self.label)
-        lay.addWidget(self.scroll)
-        lay.addWidget(self.show_more_btn, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
+        self._lay = QtWidgets.QVBoxLayout(self)
+        self._lay.setContentsMargins(0, 0, 0, 0)
+        self._lay.addWidget(self.label)
+        self._lay.addWidget(self.view, 1)
+        self._lay.addWidget(self.show_more_btn, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
 
-        self.setFixedWidth(BLOCK_WIDTH_PX())
-        self.setFixedHeight(BLOCK_HEIGHT_PX())
-        # ensure two full cards are visible; add small padding to account for card margins/shadows
-        self.scroll.setMinimumHeight(CARD_HEIGHT_PX() * 2 + GAP_PX() + S(12))
-        self.scroll.setMaximumHeight(CARD_HEIGHT_PX() * 2 + GAP_PX() + S(12))
+        self.apply_scale()
+        metrics.subscribe_scale(self)
 
         self._more_url = None
-        self._url_builder = None
-        log.debug(f"The IssueCardList for {title} is initialized")
+        log.debug("The IssueCardList for %s is initialized", title)
 
-    def _clear_cards(self):
-        while self.vbox.count():
-            item = self.vbox.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
+    def apply_scale(self):
+        """Recompute the metrics-derived geometry after a UI_SCALE change."""
+        self._lay.setSpacing(GAP_PX())
+        self.show_more_btn.setFixedHeight(SHOW_MORE_H_PX())
+        self.view.verticalScrollBar().setSingleStep(S(24))
+        self.setFixedSize(BLOCK_WIDTH_PX(), BLOCK_HEIGHT_PX())
+        # card height changed: drop the cached uniform row size
+        self.view.doItemsLayout()
 
-    def set_issues(self, issues: list[dict], more_url: str | None, url_builder):
-        self._clear_cards()
+    def set_issues(self, issues: list[Issue], more_url: str | None, url_builder):
         self._more_url = more_url
-        self._url_builder = url_builder
         self.show_more_btn.setVisible(bool(more_url))
-
-        for it in issues[:2]:
-            card = IssueCard(it, url_builder)
-            card.setFixedHeight(CARD_HEIGHT_PX())
-            card.clicked.connect(self.openLink.emit)
-            self.vbox.addWidget(card)
-
-        self.vbox.addStretch(1)
+        with TELEMETRY.span("ui_block_update_seconds", block=self._title):
+            self.model.set_issues(issues, url_builder)
+
+    def set_total(self, total: int | None):
+        """Show the number of issues in the bucket next to the title (None hides it)."""
+        self._total = total
+        self.model.total = total
+        self._update_label()
+
+    def set_stale(self, fetched_at: datetime | None):
+        """Mark the block as showing cached data from ``fetched_at`` (None clears the mark)."""
+        self._stale_at = fetched_at
+        self._update_label()
+
+    def _update_label(self):
+        text = f"<b>{self._title}</b>"
+        if self._total is not None:
+            text += f" <b>({self._total})</b>"
+        tip = ""
+        if self._stale_at is not None:
+            at = self._stale_at
+            stamp = at.strftime("%H:%M") if at.date() == date.today() else at.strftime("%d %b %H:%M")
+            text += f" <span style='color:#9aa5b1'>· cached {stamp}</span>"
+            tip = "Jira is not reachable yet; showing the last downloaded data."
+        self.label.setText(text)
+        self.label.setToolTip(tip)
 
     def _open_more(self):
         if self._more_url:
             self.openLink.emit(self._more_url)
 
+    def _on_clicked(self, index: QtCore.QModelIndex):
+        url = index.data(URL_ROLE)
+        if url:
+            self.openLink.emit(url)
+
 
 class TodayPopup(QtWidgets.QDialog):
-    def __init__(self, issues: list[dict], more_url: str, url_builder, parent=None):
+    def __init__(self, issues: list[Issue], more_url: str, url_builder, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Today's tasks")
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowType.Tool)
         self.setModal(False)
 
         self.block = IssuesCardList("Today", self)
-        outer = QtWidgets.QVBoxLayout(self)
-        outer.setContentsMargins(GAP_PX(), GAP_PX(), GAP_PX(), GAP_PX())
-        outer.setSpacing(0)
-        outer.addWidget(self.block)
+        self._outer = QtWidgets.QVBoxLayout(self)
+        self._outer.setSpacing(0)
+        self._outer.addWidget(self.block)
 
         self.block.openLink.connect(lambda url: __import__("webbrowser").open(url))
 
         self.block.set_issues(issues, more_url, url_builder)
 
-        win_w = BLOCK_WIDTH_PX() + GAP_PX() * 2
-        win_h = BLOCK_HEIGHT_PX() + GAP_PX() * 2
-        self.setFixedSize(win_w, win_h)
+        self.apply_scale()
+        metrics.subscribe_scale(self)
+
+    def apply_scale(self):
+        gap = GAP_PX()
+        self._outer.setContentsMargins(gap, gap, gap, gap)
+        self.setFixedSize(BLOCK_WIDTH_PX() + gap * 2, BLOCK_HEIGHT_PX() + gap * 2)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -301,44 +409,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.setStyleSheet(
             """
-            QFrame#Card { border: 1px solid #3a3f44; background: #1e1f24; border-radius: 12px; }
-            QFrame#Card[state="overdue"]   { border-color: #ff6b6b; }
-            QFrame#Card[state="today"]     { border-color: #ffd166; }
-            QFrame#Card[state="tomorrow"]  { border-color: #06d6a0; }
-
-            QLabel#Summary { color: palette(text); }
-
-            QLabel[badge="true"] {
-                padding: 2px 8px;
-                border-radius: 10px;
-                background: #2b3036;
-                color: #c9d1d9;
-            }
-
-            QLabel#DuePill[state="overdue"]  { background: #3a0f0f; color: #ff9b9b; padding: 2px 8px; border-radius: 10px; }
-            QLabel#DuePill[state="today"]    { background: #3a2e0f; color: #ffd166; padding: 2px 8px; border-radius: 10px; }
-            QLabel#DuePill[state="tomorrow"] { background: #103528; color: #06d6a0; padding: 2px 8px; border-radius: 10px; }
-            QLabel#DuePill[state="future"],
-            QLabel#DuePill[state="none"]     { background: #2b3036; color: #9aa5b1; padding: 2px 8px; border-radius: 10px; }
-
-            QLabel#PriorityBadge[level="Highest"] { background: #3a0f0f; color: #ff9b9b; }
-            QLabel#PriorityBadge[level="High"]    { background: #3a220f; color: #ffb27a; }
-            QLabel#PriorityBadge[level="Medium"]  { background: #243248; color: #8ab8ff; }
-            QLabel#PriorityBadge[level="Low"]     { background: #123a22; color: #5ad1a0; }
-            QLabel#PriorityBadge[level="Lowest"]  { background: #2b3036; color: #aab2bd; }
-
-            QLabel#StatusBadge[state="done"]       { background: #103528; color: #06d6a0; }
-            QLabel#StatusBadge[state="inprogress"] { background: #20324a; color: #8ab8ff; }
-            QLabel#StatusBadge[state="todo"]       { background: #3a2e0f; color: #ffd166; }
-            QLabel#StatusBadge[state="other"]      { background: #2b3036; color: #c9d1d9; }
-
             QPushButton { padding: 6px 12px; border-radius: 8px; }
             """
         )
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
-        grid = QtWidgets.QGridLayout(central)
+        grid = self._grid = QtWidgets.QGridLayout(central)
 
         self.overdue = IssuesCardList("Overdue")
         self.today = IssuesCardList("Today")
@@ -354,28 +431,32 @@ class MainWindow(QtWidgets.QMainWindow):
         self.refresh_btn = QtWidgets.QPushButton("Refresh")
         grid.addWidget(self.refresh_btn, 2, 1, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
 
-        grid.setHorizontalSpacing(GAP_PX())
-        grid.setVerticalSpacing(GAP_PX())
-        grid.setContentsMargins(GAP_PX(), GAP_PX(), GAP_PX(), GAP_PX())
-
         grid.addWidget(self.overdue, 0, 0)
         grid.addWidget(self.today, 0, 1)
         grid.addWidget(self.tomorrow, 1, 0)
 
-        grid.addItem(
-            QtWidgets.QSpacerItem(
-                BLOCK_WIDTH_PX(),
-                BLOCK_HEIGHT_PX(),
-                QtWidgets.QSizePolicy.Policy.Fixed,
-                QtWidgets.QSizePolicy.Policy.Fixed,
-            ),
-            1,
-            1,
+        self._spacer = QtWidgets.QSpacerItem(
+            BLOCK_WIDTH_PX(),
+            BLOCK_HEIGHT_PX(),
+            QtWidgets.QSizePolicy.Policy.Fixed,
+            QtWidgets.QSizePolicy.Policy.Fixed,
         )
-
-        win_w = BLOCK_WIDTH_PX() * 2 + GAP_PX() * 3
-        win_h = BLOCK_HEIGHT_PX() * 2 + GAP_PX() * 3
-        self.setFixedSize(win_w, win_h)
+        grid.addItem(self._spacer, 1, 1)
+
+        self.apply_scale()
+        metrics.subscribe_scale(self)
+
+    def apply_scale(self):
+        """Recompute the metrics-derived geometry after a UI_SCALE change (the blocks do their own)."""
+        gap = GAP_PX()
+        self._grid.setHorizontalSpacing(gap)
+        self._grid.setVerticalSpacing(gap)
+        self._grid.setContentsMargins(gap, gap, gap, gap)
+        self._spacer.changeSize(
+            BLOCK_WIDTH_PX(), BLOCK_HEIGHT_PX(), QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        self._grid.invalidate()
+        self.setFixedSize(BLOCK_WIDTH_PX() * 2 + gap * 3, BLOCK_HEIGHT_PX() * 2 + gap * 3)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         event.ignore()
@@ -385,12 +466,10 @@ class MainWindow(QtWidgets.QMainWindow):
 class SecureConfigDialog(QtWidgets.QDialog):
     """Dialog to edit the encrypted (secure) configuration portion."""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store: ConfigStore | None = None):
         super().__init__(parent)
         self.setWindowTitle("Secure configuration")
-
-        from .paths import CONFIG_ENC_PATH
-        from .security import decrypt_config
+        self.store = store or CONFIG
 
         self.base_url = QtWidgets.QLineEdit()
         self.email = QtWidgets.QLineEdit()
@@ -426,36 +505,22 @@ class SecureConfigDialog(QtWidgets.QDialog):
         outer.addLayout(form)
         outer.addLayout(btns)
 
-        # try to pre-load if encrypted config exists
-        try:
-            if CONFIG_ENC_PATH.exists():
-                data = CONFIG_ENC_PATH.read_bytes()
-                cfg = decrypt_config(data)
-                self.base_url.setText(cfg.get("jira_base_url", ""))
-                self.email.setText(cfg.get("assignee_email", ""))
-                # don't pre-fill api_token for security, leave empty
-                self.projects.setText(", ".join(cfg.get("project_keys", [])))
-                self.issue_types.setText(", ".join(cfg.get("issue_types", [])))
-                self.start_date_field.setText(cfg.get("start_date_field", "customfield_10015"))
-                self.done_jql.setText(cfg.get("done_jql") or "")
-        except Exception:
-            # ignore decryption errors here
-            pass
+        # pre-load the current secure config (already decrypted in memory, if it could be)
+        cfg = self.store.secure
+        if cfg:
+            self.base_url.setText(cfg.get("jira_base_url", ""))
+            self.email.setText(cfg.get("assignee_email", ""))
+            # don't pre-fill api_token for security, leave empty
+            self.projects.setText(", ".join(cfg.get("project_keys", [])))
+            self.issue_types.setText(", ".join(cfg.get("issue_types", [])))
+            self.start_date_field.setText(cfg.get("start_date_field", "customfield_10015"))
+            self.done_jql.setText(cfg.get("done_jql") or "")
 
     def get_values(self) -> dict:
         # Preserve existing API token if the field is left blank.
         api_token_val = self.api_token.text().strip()
         if not api_token_val:
-            try:
-                from .paths import CONFIG_ENC_PATH
-                from .security import decrypt_config
-
-                if CONFIG_ENC_PATH.exists():
-                    existing = decrypt_config(CONFIG_ENC_PATH.read_bytes()) or {}
-                    api_token_val = existing.get("api_token")
-            except Exception:
-                # If anything goes wrong reading/decrypting, leave as None
-                api_token_val = None
+            api_token_val = self.store.secure.get("api_token")
 
         return {
             "jira_base_url": self.base_url.text().strip(),
@@ -471,12 +536,10 @@ class SecureConfigDialog(QtWidgets.QDialog):
 class ConfigDialog(QtWidgets.QDialog):
     """Main configuration dialog. Non-secure settings live in a plain JSON file; secure settings are optional and edited via SecureConfigDialog."""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store: ConfigStore | None = None):
         super().__init__(parent)
         self.setWindowTitle("Jira Reminder — Configuration")
-
-        import json
-        from .paths import CONFIG_PLAIN_PATH
+        self.store = store or CONFIG
 
         self.chk_logging = QtWidgets.QCheckBox("Enable DEBUG logging")
         self.chk_new_log = QtWidgets.QCheckBox("Create new log file on start")
@@ -486,6 +549,19 @@ class ConfigDialog(QtWidgets.QDialog):
         # show only two decimals and step of 0.05
         self.spin_ui.setDecimals(2)
         self.spin_ui.setValue(1.25)
+        self.spin_poll = QtWidgets.QSpinBox()
+        self.spin_poll.setRange(1, 240)
+        self.spin_poll.setSuffix(" min")
+        self.spin_poll.setValue(5)
+        self.time_morning = QtWidgets.QTimeEdit(QtCore.QTime(10, 0))
+        self.time_evening_start = QtWidgets.QTimeEdit(QtCore.QTime(16, 30))
+        self.time_evening_end = QtWidgets.QTimeEdit(QtCore.QTime(19, 0))
+        for te in (self.time_morning, self.time_evening_start, self.time_evening_end):
+            te.setDisplayFormat("HH:mm")
+        self.spin_evening = QtWidgets.QSpinBox()
+        self.spin_evening.setRange(5, 240)
+        self.spin_evening.setSuffix(" min")
+        self.spin_evening.setValue(30)
 
         btn_edit_secure = QtWidgets.QPushButton("Edit secure settings...")
         btn_edit_secure.clicked.connect(self._open_secure)
@@ -499,6 +575,11 @@ class ConfigDialog(QtWidgets.QDialog):
         form.addRow(self.chk_logging)
         form.addRow(self.chk_new_log)
         form.addRow("UI scale:", self.spin_ui)
+        form.addRow("Check Jira every:", self.spin_poll)
+        form.addRow("Today's tasks digest at:", self.time_morning)
+        form.addRow("'Nothing closed' reminders from:", self.time_evening_start)
+        form.addRow("... until:", self.time_evening_end)
+        form.addRow("... every:", self.spin_evening)
         form.addRow(btn_edit_secure)
 
         btns = QtWidgets.QHBoxLayout()
@@ -512,8 +593,8 @@ class ConfigDialog(QtWidgets.QDialog):
 
         # load plain config if present
         try:
-            if CONFIG_PLAIN_PATH.exists():
-                data = json.loads(CONFIG_PLAIN_PATH.read_text(encoding="utf-8"))
+            data = self.store.plain
+            if data:
                 self.chk_logging.setChecked(bool(data.get("logging", False)))
                 self.chk_new_log.setChecked(bool(data.get("new_log", False)))
                 # keep only two decimals when loading
@@ -522,25 +603,29 @@ class ConfigDialog(QtWidgets.QDialog):
                 except Exception:
                     val = 1.25
                 self.spin_ui.setValue(val)
+                self.spin_poll.setValue(int(data.get("poll_minutes", 5)))
+                self.spin_evening.setValue(int(data.get("evening_interval_minutes", 30)))
+                for te, key in (
+                    (self.time_morning, "morning_time"),
+                    (self.time_evening_start, "evening_start"),
+                    (self.time_evening_end, "evening_end"),
+                ):
+                    t = QtCore.QTime.fromString(str(data.get(key, "")), "HH:mm")
+                    if t.isValid():
+                        te.setTime(t)
         except Exception:
             pass
 
     def _open_secure(self):
-        dlg = SecureConfigDialog(self)
+        dlg = SecureConfigDialog(self, self.store)
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             vals = dlg.get_values()
-            # write encrypted config
-            from .security import encrypt_config
-            from .paths import CONFIG_ENC_PATH
             try:
-                CONFIG_ENC_PATH.write_bytes(encrypt_config(vals))
+                self.store.save_secure(vals)
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save secure config: {e}")
 
     def _on_save(self):
-        import json
-        from .paths import CONFIG_PLAIN_PATH
-
         # quantize ui_scale to nearest 0.05 and store with 2 decimals
         raw_scale = float(self.spin_ui.value())
         quant = round(round(raw_scale / 0.05) * 0.05, 2)
@@ -554,109 +639,53 @@ class ConfigDialog(QtWidgets.QDialog):
             "logging": bool(self.chk_logging.isChecked()),
             "new_log": bool(self.chk_new_log.isChecked()),
             "ui_scale": quant,
+            "poll_minutes": int(self.spin_poll.value()),
+            "morning_time": self.time_morning.time().toString("HH:mm"),
+            "evening_start": self.time_evening_start.time().toString("HH:mm"),
+            "evening_end": self.time_evening_end.time().toString("HH:mm"),
+            "evening_interval_minutes": int(self.spin_evening.value()),
         }
         try:
-            CONFIG_PLAIN_PATH.write_text(json.dumps(plain, ensure_ascii=False, indent=2), encoding="utf-8")
+            # keep settings this dialog doesn't edit (e.g. cache_ttl_seconds)
+            self.store.save_plain({**self.store.plain, **plain})
             # apply UI scale immediately
             try:
-                # update global UI scale: compute a stable BASE_FONT_SIZE from current font and previous UI_SCALE
-                from .metrics import set_ui_scale, UI_SCALE as _old_ui_scale, set_base_font_size, BLOCK_WIDTH_PX, BLOCK_HEIGHT_PX, GAP_PX, CARD_HEIGHT_PX
-                app = QtWidgets.QApplication.instance()
-                if app:
-                    # measure current application font size and infer unscaled base
-                    font = app.font()
-                    curr_ps = font.pointSizeF() or 12.0
-                    try:
-                        old_scale = float(_old_ui_scale) if _old_ui_scale and float(_old_ui_scale) > 0 else 1.0
-                    except Exception:
-                        old_scale = 1.0
-
-                    base = curr_ps / old_scale if old_scale else curr_ps
-                    # store base and then set new scale
-                    set_base_font_size(base)
-                    set_ui_scale(plain["ui_scale"])
-
-                    # apply scaled font based on stable base
-                    from .metrics import UI_SCALE
-                    font.setPointSizeF(max(7.5, base * UI_SCALE))
-                    app.setFont(font)
-
-                    # Full immediate re-layout: iterate all widgets and update sizes/polish
-                    try:
-                        for w in app.allWidgets():
-                            try:
-                                w.setFont(font)
-                            except Exception:
-                                pass
-
-                            # Adjust known components that use fixed sizes based on metrics
-                            try:
-                                # MainWindow: recompute fixed size
-                                if isinstance(w, MainWindow):
-                                    win_w = BLOCK_WIDTH_PX() * 2 + GAP_PX() * 3
-                                    win_h = BLOCK_HEIGHT_PX() * 2 + GAP_PX() * 3
-                                    w.setFixedSize(win_w, win_h)
-                            except Exception:
-                                pass
-
-                            try:
-                                # IssuesCardList uses fixed width/height
-                                if isinstance(w, IssuesCardList):
-                                    w.setFixedWidth(BLOCK_WIDTH_PX())
-                                    w.setFixedHeight(BLOCK_HEIGHT_PX())
-                                    # update scroll limits
-                                    w.scroll.setMinimumHeight(CARD_HEIGHT_PX() * 2 + GAP_PX() + S(12))
-                                    w.scroll.setMaximumHeight(CARD_HEIGHT_PX() * 2 + GAP_PX() + S(12))
-                            except Exception:
-                                pass
-
-                            try:
-                                # IssueCard: adjust fixed height
-                                if isinstance(w, IssueCard):
-                                    w.setFixedHeight(CARD_HEIGHT_PX())
-                            except Exception:
-                                pass
-
-                            # trigger style polish and geometry updates
-                            try:
-                                w.style().unpolish(w)
-                                w.style().polish(w)
-                                w.updateGeometry()
-                                w.update()
-                            except Exception:
-                                pass
-                    except Exception:
-                        # be resilient: don't fail saving on re-layout errors
-                        pass
+                self._apply_ui_scale(plain["ui_scale"])
             except Exception:
                 # don't block saving on UI-scale application errors
-                pass
+                log.exception("Cannot apply UI scale %.2f", plain["ui_scale"])
 
             self.accept()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save config: {e}")
 
     @staticmethod
-    def load_combined() -> dict:
-        """Return combined configuration dict by reading encrypted config (if present) and overlaying plain settings."""
-        import json
-        from .paths import CONFIG_PLAIN_PATH, CONFIG_ENC_PATH
-        from .security import decrypt_config
-
-        plain = {}
-        try:
-            if CONFIG_PLAIN_PATH.exists():
-                plain = json.loads(CONFIG_PLAIN_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            plain = {}
-
-        secure = {}
+    def _apply_ui_scale(scale: float):
+        """
+        Rescale the running UI. Only the scale-aware components subscribed in ``metrics`` recompute
+        their geometry, with window updates paused so everything is laid out in a single pass.
+        """
+        app = QtWidgets.QApplication.instance()
+        if app is None or scale == metrics.UI_SCALE:
+            return
+        # infer the unscaled base font size from the current font and scale
+        font = app.font()
+        base = (font.pointSizeF() or metrics.BASE_FONT_SIZE) / (metrics.UI_SCALE or 1.0)
+        metrics.set_base_font_size(base)
+
+        windows = [w for w in app.topLevelWidgets() if w.updatesEnabled()]
+        for w in windows:
+            w.setUpdatesEnabled(False)
         try:
-            if CONFIG_ENC_PATH.exists():
-                secure = decrypt_config(CONFIG_ENC_PATH.read_bytes())
-        except Exception:
-            secure = {}
+            metrics.set_ui_scale(scale)
+            font.setPointSizeF(max(7.5, base * metrics.UI_SCALE))
+            app.setFont(font)  # propagates to every widget without an explicit font
+        finally:
+            for w in windows:
+                w.setUpdatesEnabled(True)
 
-        # combine: secure keys take precedence for JIRA-related fields
-        res = {**plain, **secure}
-        return res
+    @staticmethod
+    def load_combined() -> dict:
+        """Return the combined configuration: plain settings overlaid by the secure ones."""
+        CONFIG.reload()
+        return CONFIG.combined()
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import itertools
+from datetime import datetime
+from typing import Callable
+
+from PyQt6 import QtCore
+
+from . import paths
+from .config import ConfigStore
+from .logging_setup import log
+from .scheduler import ReminderScheduler, Schedule
+
+
+class _Job(QtCore.QRunnable):
+    """Runs one callable on a pool thread and reports back through the engine's signal."""
+
+    def __init__(
+        self, engine: "FetchEngine", job_id: int, fn: Callable, args: tuple, kwargs: dict, stream: bool = False
+    ):
+        super().__init__()
+        self._engine = engine
+        self._id = job_id
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._stream = stream
+
+    def run(self) -> None:
+        try:
+            res = self._fn(*self._args, **self._kwargs)
+            if self._stream:
+                for item in res:
+                    self._engine._item.emit(self._id, item)
+                res = None
+        except Exception as e:
+            self._engine._finished.emit(self._id, False, e)
+        else:
+            self._engine._finished.emit(self._id, True, res)
+
+
+class FetchEngine(QtCore.QObject):
+    """
+    Background executor for blocking Jira calls.
+
+    Jobs run on a private QThreadPool; their callbacks are always invoked on the thread that owns
+    the engine (the GUI thread), so they may touch widgets directly.
+    """
+
+    _finished = QtCore.pyqtSignal(int, bool, object)
+    _item = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, parent: QtCore.QObject | None = None, max_threads: int = 4):
+        super().__init__(parent)
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._ids = itertools.count(1)
+        self._callbacks: dict[int, tuple[Callable | None, Callable | None]] = {}
+        self._item_callbacks: dict[int, Callable] = {}
+        self._finished.connect(self._dispatch)
+        self._item.connect(self._dispatch_item)
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        on_done: Callable | None = None,
+        on_error: Callable | None = None,
+        **kwargs,
+    ) -> int:
+        """Run ``fn(*args, **kwargs)`` in the pool. Returns the job id."""
+        job_id = next(self._ids)
+        self._callbacks[job_id] = (on_done, on_error)
+        self.pool.start(_Job(self, job_id, fn, args, kwargs))
+        return job_id
+
+    def submit_iter(
+        self,
+        fn: Callable,
+        *args,
+        on_item: Callable,
+        on_done: Callable | None = None,
+        on_error: Callable | None = None,
+        **kwargs,
+    ) -> int:
+        """
+        Run the generator returned by ``fn(*args, **kwargs)`` in the pool. ``on_item`` is called on
+        the GUI thread for every yielded item, then ``on_done(None)`` once the generator is exhausted.
+        """
+        job_id = next(self._ids)
+        self._callbacks[job_id] = (on_done, on_error)
+        self._item_callbacks[job_id] = on_item
+        self.pool.start(_Job(self, job_id, fn, args, kwargs, stream=True))
+        return job_id
+
+    def pending(self) -> int:
+        return len(self._callbacks)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until all queued jobs have finished (callbacks are delivered by the event loop)."""
+        return self.pool.waitForDone(msecs)
+
+    def shutdown(self, msecs: int = 2000) -> None:
+        self.pool.clear()
+        self.pool.waitForDone(msecs)
+        self._callbacks.clear()
+        self._item_callbacks.clear()
+
+    @QtCore.pyqtSlot(int, object)
+    def _dispatch_item(self, job_id: int, item: object) -> None:
+        on_item = self._item_callbacks.get(job_id)
+        if on_item is None:
+            return
+        try:
+            on_item(item)
+        except Exception:
+            log.exception("Background job %d item callback failed", job_id)
+
+    @QtCore.pyqtSlot(int, bool, object)
+    def _dispatch(self, job_id: int, ok: bool, payload: object) -> None:
+        on_done, on_error = self._callbacks.pop(job_id, (None, None))
+        self._item_callbacks.pop(job_id, None)
+        try:
+            if ok:
+                if on_done:
+                    on_done(payload)
+            elif on_error:
+                on_error(payload)
+            else:
+                log.error("Background job %d failed: %s", job_id, payload)
+        except Exception:
+            log.exception("Background job %d callback failed", job_id)
+
+
+class EventScheduler(QtCore.QObject):
+    """
+    Qt driver for ``ReminderScheduler``: arms one single-shot timer for the next due event instead
+    of waking up every minute, and emits ``fired(event, now)`` for each event due at that moment.
+    ``clock`` replaces ``datetime.now`` (e.g. a ``simulation.VirtualClock``).
+    """
+
+    fired = QtCore.pyqtSignal(str, object)
+
+    def __init__(
+        self,
+        schedule: Schedule,
+        parent: QtCore.QObject | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        super().__init__(parent)
+        self.clock = clock
+        self.core = ReminderScheduler(schedule, now=clock())
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self) -> None:
+        self._arm(self.clock())
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def set_schedule(self, schedule: Schedule) -> None:
+        now = self.clock()
+        self.core.set_schedule(schedule, now)
+        if self._timer.isActive():
+            self._arm(now)
+
+    def run_due(self, now: datetime) -> list[str]:
+        """Emit every event due at ``now``; also used to drive the scheduler by hand in tests."""
+        events = self.core.due(now)
+        for ev in events:
+            self.fired.emit(ev, now)
+        return events
+
+    def _arm(self, now: datetime) -> None:
+        at = self.core.next_wakeup(now)
+        ms = max(0, int((at - now).total_seconds() * 1000))
+        log.debug("Next scheduler wakeup at %s", at.strftime("%d-%m %H:%M:%S"))
+        self._timer.start(ms)
+
+    def _on_timeout(self) -> None:
+        now = self.clock()
+        self.run_due(now)
+        self._arm(now)
+
+
+class ConfigWatcher(QtCore.QObject):
+    """
+    Qt driver for ``ConfigStore``: watches the config files and calls ``store.reload()`` shortly
+    after they change on disk. Bursts of change notifications (editors often write a file in several
+    steps, or replace it) are collapsed into one reload.
+    """
+
+    def __init__(self, store: ConfigStore, parent: QtCore.QObject | None = None, delay_ms: int = 300):
+        super().__init__(parent)
+        self.store = store
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_change)
+        self._watcher.directoryChanged.connect(self._on_change)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._reload)
+        self._rewatch()
+
+    def _rewatch(self) -> None:
+        # a file replaced by rename drops out of the watch list; the directory catches it coming back
+        files = [str(p) for p in (paths.CONFIG_PLAIN_PATH, paths.CONFIG_ENC_PATH) if p.exists()]
+        dirs = sorted({str(paths.CONFIG_PLAIN_PATH.parent), str(paths.CONFIG_ENC_PATH.parent)})
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [p for p in files + dirs if p not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _on_change(self, _path: str) -> None:
+        self._timer.start()
+
+    def _reload(self) -> None:
+        self._rewatch()
+        self.store.reload()